@@ -4,7 +4,7 @@ import pyg4ometry as _pyg4
 import numpy as _np
 
 
-def _loadFile(fileName):
+def _loadFile(fileName, workers=None):
     if fileName.find(".gdml") != -1:
         r = _pyg4.gdml.Reader(fileName)
         reg = r.getRegistry()
@@ -15,7 +15,7 @@ def _loadFile(fileName):
         wl = reg.getWorldVolume()
     elif fileName.find(".inp") != -1:
         r = _pyg4.fluka.Reader(fileName)
-        reg = _pyg4.convert.fluka2Geant4(r.getRegistry())
+        reg = _pyg4.convert.fluka2Geant4(r.getRegistry(), workers=workers)
         wl = reg.getWorldVolume()
     elif fileName.find(".stl") != -1:
         reg = _pyg4.geant4.Registry()
@@ -77,6 +77,29 @@ def _parseStrPythonAsDict(strPython):
     return locals["d"]
 
 
+def _meshCacheCommand(action):
+    from pyg4ometry.geant4.solid.MeshCache import MeshDiskCache
+
+    if not _pyg4.config.meshDiskCacheDir:
+        print("pyg4> no mesh cache directory (--meshcachedir or PYG4OMETRY_MESH_CACHE)")
+        exit(1)
+
+    cache = MeshDiskCache(_pyg4.config.meshDiskCacheDir)
+    if action == "info":
+        nMeshes, size = cache.info()
+        print(f"pyg4> mesh cache {cache.directory}")
+        print(f"pyg4> {nMeshes} meshes {size / 1024**2:.1f} MB")
+    elif action == "prune":
+        nRemoved = cache.prune()
+        print(f"pyg4> removed {nRemoved} meshes from mesh cache {cache.directory}")
+    elif action == "clear":
+        nRemoved = cache.clear()
+        print(f"pyg4> removed {nRemoved} meshes from mesh cache {cache.directory}")
+    else:
+        print(f"pyg4> unknown mesh cache action {action} (info, prune, clear)")
+        exit(1)
+
+
 def _printCitation():
     print("https://zenodo.org/doi/10.5281/zenodo.10449301")
 
@@ -105,6 +128,7 @@ def cli(
     featureDataOutputFileName=None,
     gltfScale=None,
     verbose=None,
+    workers=None,
 ):
     print("pyg4 - command line interface")
 
@@ -121,7 +145,7 @@ def cli(
     if nullMeshException:
         _pyg4.config.meshingNullException = not nullMeshException
 
-    reg, wl = _loadFile(inputFileName)
+    reg, wl = _loadFile(inputFileName, workers)
 
     # extract lv in new registry etc
     if lvName is not None:
@@ -164,7 +188,7 @@ def cli(
 
     if checkOverlaps:
         print("pyg4> checkoverlaps")
-        wl.checkOverlaps(True)
+        wl.checkOverlaps(True, workers=workers)
 
     if analysis:
         print("pyg4> analysis")
@@ -336,6 +360,19 @@ def main():
         help='material dictionary ("lvname":"nist")',
         dest="material",
     )
+    parser.add_option(
+        "-M",
+        "--meshcache",
+        help="persistent mesh cache action (info, prune, clear)",
+        dest="meshCache",
+        metavar="ACTION",
+    )
+    parser.add_option(
+        "--meshcachedir",
+        help="persistent mesh cache directory",
+        dest="meshCacheDir",
+        metavar="DIR",
+    )
     parser.add_option(
         "-n",
         "--nullmesh",
@@ -393,6 +430,14 @@ def main():
     )
     parser.add_option("-v", "--view", help="view geometry", action="store_true", dest="view")
     parser.add_option("-V", "--verbose", help="verbose script", dest="verbose", action="store_true")
+    parser.add_option(
+        "-w",
+        "--workers",
+        help="number of processes for overlap checking and FLUKA conversion",
+        dest="workers",
+        type="int",
+        metavar="N",
+    )
     parser.add_option(
         "-x",
         "--exchange",
@@ -416,6 +461,13 @@ def main():
         _printCitation()
         exit(0)
 
+    if options.__dict__["meshCacheDir"] is not None:
+        _pyg4.config.meshDiskCacheDir = options.__dict__["meshCacheDir"]
+
+    if options.__dict__["meshCache"] is not None:
+        _meshCacheCommand(options.__dict__["meshCache"])
+        exit(0)
+
     # absolutely need a file name
     if options.__dict__["inputFileName"] is None:
         print("pyg4> need an input file")
@@ -479,6 +531,7 @@ def main():
         featureDataOutputFileName=options.__dict__["featureExtactOutputFileName"],
         gltfScale=options.__dict__["gltfScale"],
         verbose=verbose,
+        workers=options.__dict__["workers"],
     )
 
 
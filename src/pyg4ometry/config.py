@@ -1,5 +1,6 @@
 # import logging as _logging
 # _logging.basicConfig(filename='logging.log', encoding='utf-8', level=_logging.INFO)
+import os as _os
 
 
 """
@@ -13,6 +14,7 @@ class meshingType:
     pycsg = 1
     cgal_sm = 2
     cgal_np = 3
+    cgal_epick = 4
 
 
 meshing = meshingType.cgal_sm
@@ -27,12 +29,59 @@ def backendName():
         return "cgal_sm"
     if meshing == meshingType.cgal_np:
         return "cgal_np"
+    if meshing == meshingType.cgal_epick:
+        return "cgal_epick"
 
 
-# whether to generate meshes during the construction of each logical volume
-# note this is required for a lot of functionality
+# whether to generate meshes of logical volumes, on construction or (with lazyMeshing) when
+# first used. With doMeshing = False a logical volume has no mesh (None) until
+# LogicalVolume.reMesh or Registry.meshAll is called.
+# note meshes are required for a lot of functionality
 doMeshing = True
 
+"""
+Make the mesh of a logical volume when it is first used (e.g. for an extent, overlap check
+or visualisation) rather than on construction, so loading, converting and writing a geometry
+does not mesh anything. Registry.meshAll makes all the meshes at once. Off by default,
+logical volumes are meshed on construction. Has no effect with doMeshing = False.
+"""
+lazyMeshing = False
+
+"""
+Tolerance (mm) used when comparing axis-aligned bounding boxes in the overlap checking
+broad phase. Boxes that touch within this tolerance are still considered for coplanar
+overlaps.
+"""
+overlapBoundingBoxTolerance = 1e-6
+
+"""
+Approximate memory (bytes) used to cache solid meshes. Solids with identical type and
+parameter values share a mesh, so a mesh is only made once. Set to 0 to disable the cache.
+"""
+meshCacheMemory = 512 * 1024**2
+
+"""
+Directory of the persistent on-disk solid mesh cache shared between sessions, or None
+(the default) to not use one. Can also be set with the PYG4OMETRY_MESH_CACHE environment
+variable. Pruning (pyg4ometry -M prune) reduces it to meshDiskCacheSize bytes.
+"""
+meshDiskCacheDir = _os.environ.get("PYG4OMETRY_MESH_CACHE")
+meshDiskCacheSize = 2 * 1024**3
+
+"""
+Number of processes used for the unions when meshing a MultiUnion or a multi-zone FLUKA
+region, or None (the default) to make them serially in this process. Meshes are passed
+to the processes as doubles, so only inexact meshes (cgal_epick, pycsg) are united in
+parallel and exact (cgal_sm) meshes are always united in this process.
+"""
+meshUnionWorkers = None
+
+"""
+Maximum number of terms kept while converting a FLUKA zone to disjunctive normal form.
+Conversion raises FLUKAError rather than exhausting memory for very deeply nested zones.
+"""
+flukaDNFTermLimit = 100000
+
 # Global settings for default meshing settings for solids
 # nslice and and nstacks determine the discretisation of curved solids.
 # Solids that are curved in the x-y plane (e.g. Tubs) only need nslice. Solids that are
@@ -1,20 +1,24 @@
+from copy import copy as _copy
 from copy import deepcopy as _deepcopy
 from collections import namedtuple as _namedtuple
 from functools import reduce as _reduce
 import logging as _logging
+import multiprocessing as _multiprocessing
+import os as _os
 import numpy as _np
 import types as _types
 import warnings as _warnings
 
 from .fluka2g4materials import makeFlukaToG4MaterialsMap as _makeFlukaToG4MaterialsMap
 from pyg4ometry.fluka.vector import areAABBsOverlapping as _areAABBsOverlapping
+from pyg4ometry.fluka import analytic_aabb as _analytic_aabb
 import pyg4ometry.fluka as _fluka
 import pyg4ometry.geant4 as _g4
 import pyg4ometry.transformation as _trans
 
 import pyg4ometry.config as _config
 
-if _config.meshing == _config.meshingType.cgal_sm:
+if _config.meshing in (_config.meshingType.cgal_sm, _config.meshingType.cgal_epick):
     from pyg4ometry.pycgal.core import do_intersect as _do_intersect
 elif _config.meshing == _config.meshingType.pycsg:
     from pyg4ometry.pycsg.core import do_intersect as _do_intersect
@@ -37,6 +41,7 @@ def fluka2Geant4(
     worldDimensions=None,
     omitBlackholeRegions=True,
     quadricRegionAABBs=None,
+    workers=None,
     **kwargs,
 ):
     """
@@ -56,6 +61,8 @@ def fluka2Geant4(
     :type omitBlackholeRegions: bool
     :param quadricRegionAABBs: The axis-aligned aabbs of any regions featuring QUA bodies, mapping region names to fluka.AABB instances.
     :type quadricRegionAABBs: dict
+    :param workers: number of processes used to mesh the zones without an analytic aabb, by default (None or 1) this is done serially.  The result is identical to the serial conversion.
+    :type workers: int
 
     Developer options (to kwargs) withLengthSafety: Whether or not to apply automatic length safety.
 
@@ -81,7 +88,7 @@ def fluka2Geant4(
         flukareg = _makeLengthSafetyRegistry(flukareg, regions)
 
     if kwargs["minimiseSolids"]:
-        regionZoneAABBs = _getRegionZoneAABBs(flukareg, regions, quadricRegionAABBs)
+        regionZoneAABBs = _getRegionZoneAABBs(flukareg, regions, quadricRegionAABBs, workers)
         flukareg, regionZoneAABBs = _filterRegistryNullZones(flukareg, regionZoneAABBs)
         regions = [r for r in regions if r in regionZoneAABBs]
         if not regions:
@@ -178,6 +185,28 @@ def _makeWorldVolume(dimensions, material, g4registry):
     return wlv
 
 
+class _LengthSafetyBodies:
+    """Length safety variants of the bodies of a registry, made when
+    first asked for so that only bodies of the converted regions are
+    expanded or shrunk.  Has the getBody interface of FlukaRegistry
+    used by Region.withLengthSafety.
+    """
+
+    def __init__(self, flukareg, expand):
+        self._flukareg = flukareg
+        self._expand = expand
+        self._bodies = {}
+
+    def getBody(self, name):
+        try:
+            return self._bodies[name]
+        except KeyError:
+            body = self._flukareg.getBody(name)
+            body = body.safetyExpanded() if self._expand else body.safetyShrunk()
+            self._bodies[name] = body
+            return body
+
+
 def _makeLengthSafetyRegistry(flukareg, regions):
     """Make a new registry from a registry with length safety applied
     to the zones and regions within.
@@ -187,18 +216,10 @@ def _makeLengthSafetyRegistry(flukareg, regions):
     :type flukareg: FlukaRegistry
     :param regions: The names of the regions that are to be converted.
     """
-    # Why do I pass regions in as an argument?  Why don't I just
-    # filter the FlukaRegistry instance early on and then just carry
-    # on?
-    bigger = _fluka.FlukaRegistry()
-    smaller = _fluka.FlukaRegistry()
-
-    for body in flukareg.bodyDict.values():
-        bigger.addBody(body.safetyExpanded())
-        smaller.addBody(body.safetyShrunk())
-
-    # return bigger, smaller
-    fluka_reg_out = _fluka.FlukaRegistry()
+    bigger = _LengthSafetyBodies(flukareg, expand=True)
+    smaller = _LengthSafetyBodies(flukareg, expand=False)
+
+    fluka_reg_out = flukareg.derive()
     for name, region in flukareg.regionDict.items():
         if name not in regions:
             continue
@@ -206,16 +227,26 @@ def _makeLengthSafetyRegistry(flukareg, regions):
         ls_region = region.withLengthSafety(bigger, smaller)
         fluka_reg_out.addRegion(ls_region)
         ls_region.allBodiesToRegistry(fluka_reg_out)
-    _copyStructureToNewFlukaRegistry(flukareg, fluka_reg_out)
 
     return fluka_reg_out
 
 
-def _getRegionZoneAABBs(flukareg, regions, quadricRegionAABBs):
+def _getRegionZoneAABBs(flukareg, regions, quadricRegionAABBs, workers=None):
     """Loop over the regions, and for each region, get all the aabbs
     of the zones belonging to that region.  Don't do this for
     quadricRegionAABBs, instead, just continue to use the aabb
-    provided by the user."""
+    provided by the user.  If workers is greater than one the zones
+    without an analytic aabb are meshed in a pool of processes."""
+
+    if workers is not None and workers > 1:
+        names = [
+            name
+            for name in flukareg.regionDict
+            if name in regions and name not in quadricRegionAABBs
+        ]
+        computed = _regionZoneAABBsParallel(flukareg, names, workers)
+    else:
+        computed = {}
 
     regionZoneAABBs = {}
     for name, region in flukareg.regionDict.items():
@@ -240,25 +271,100 @@ def _getRegionZoneAABBs(flukareg, regions, quadricRegionAABBs):
             continue
         elif name not in regions:
             continue
+        elif name in computed:
+            regionZoneAABBs[name] = computed[name]
         else:
             regionZoneAABBs[name] = region.zoneAABBs(aabb=None)
     return regionZoneAABBs
 
 
+# zones to be meshed by the worker processes, inherited by fork
+_workerZones = []
+
+
+def _meshedZoneAABB(zone):
+    # as Region.zoneAABBs, a zone which can't be meshed is null
+    try:
+        return zone.aabb(aabb=None, analytic=False)
+    except ValueError:
+        return None
+
+
+def _meshedZoneAABBWorker(index):
+    # only the corners are returned to keep the results small
+    aabb = _meshedZoneAABB(_workerZones[index])
+    return None if aabb is None else (aabb.lower, aabb.upper)
+
+
+def _regionZoneAABBsParallel(flukareg, names, workers):
+    """Compute the zone aabbs of the named regions.  The analytic aabbs
+    are computed in this process, and only the zones without one are
+    meshed in a pool of processes.  The registry is inherited by the
+    forked workers so only the indices of the zones and the aabb corners
+    are passed between processes.  If processes cannot be forked the
+    zones are meshed serially.  Returns a map of region names to zone
+    aabbs, identical to Region.zoneAABBs.
+    """
+    from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+
+    regionZoneAABBs = {}
+    pending = []
+    for name in names:
+        zones = flukareg.regionDict[name].zones
+        regionZoneAABBs[name] = [None] * len(zones)
+        for index, zone in enumerate(zones):
+            decided, extent = _analytic_aabb.zoneAABB(zone)
+            if decided:
+                regionZoneAABBs[name][index] = extent
+            else:
+                pending.append((name, index))
+
+    zones = [flukareg.regionDict[name].zones[index] for name, index in pending]
+    if len(zones) < 2 or "fork" not in _multiprocessing.get_all_start_methods():
+        if len(zones) > 1:
+            logger.warning("Processes cannot be forked, meshing zones serially")
+        aabbs = [_meshedZoneAABB(zone) for zone in zones]
+    else:
+        workers = min(workers, len(zones), _os.cpu_count() or 1)
+        chunksize = max(1, len(zones) // (4 * workers))
+
+        _workerZones[:] = zones
+        try:
+            with _ProcessPoolExecutor(
+                max_workers=workers, mp_context=_multiprocessing.get_context("fork")
+            ) as executor:
+                results = list(
+                    executor.map(_meshedZoneAABBWorker, range(len(zones)), chunksize=chunksize)
+                )
+        finally:
+            _workerZones.clear()
+        aabbs = [None if corners is None else _fluka.AABB(*corners) for corners in results]
+
+    for (name, index), aabb in zip(pending, aabbs):
+        regionZoneAABBs[name][index] = aabb
+    return regionZoneAABBs
+
+
 def _filterRegistryNullZones(flukareg, regionZoneAABBs):
-    regout = _deepcopy(flukareg)
-    for regionName, aabbs in regionZoneAABBs.items():
-        region = regout.regionDict[regionName]
-        region.zones = list(_filterRegionNullZones(region, aabbs))
-        if not region.zones:
-            logger.warning(f"Omitting null region {region.name} from conversion")
-            del regout.regionDict[regionName]
-            regout.assignmas.pop(regionName, None)
+    # Regions without null zones are shared with the input registry,
+    # the others are shallow copies with the null zones removed.
+    regout = flukareg.derive()
+    for regionName, region in flukareg.regionDict.items():
+        aabbs = regionZoneAABBs.get(regionName)
+        if aabbs is not None:
+            zones = list(_filterRegionNullZones(region, aabbs))
+            if not zones:
+                logger.warning(f"Omitting null region {region.name} from conversion")
+                regout.assignmas.pop(regionName, None)
+                continue
+            if len(zones) != len(region.zones):
+                region = _copy(region)
+                region.zones = zones
+        regout.addRegion(region)
+        region.allBodiesToRegistry(regout)
 
     regionZoneAABBs = _filterNullAABBs(regionZoneAABBs)
     return regout, regionZoneAABBs
-    # for name, region in flukareg.regionDict.items():
-    #     from IPython import embed; embed()
 
 
 def _filterRegionNullZones(region, aabbs):
@@ -332,7 +438,7 @@ def _filterBlackHoleRegions(flukareg, regions):
     :type regions: list
 
     """
-    freg_out = _fluka.FlukaRegistry()
+    freg_out = flukareg.derive()
     for name, region in flukareg.regionDict.items():
         if name not in flukareg.assignmas and name in regions:
             freg_out.addRegion(region)  # add region even if no assigned material
@@ -344,7 +450,6 @@ def _filterBlackHoleRegions(flukareg, regions):
         else:
             freg_out.addRegion(region)  # add region even if no assigned material
             region.allBodiesToRegistry(freg_out)
-    _copyStructureToNewFlukaRegistry(flukareg, freg_out)
     return freg_out
 
 
@@ -469,16 +574,16 @@ def _filterHalfSpaces(flukareg, regionZoneAABBs):
     FlukaRegistry instance.  AABBs is a dictionary of region names
     to region aabbs.
     """
-    fout = _fluka.FlukaRegistry()
+    fout = flukareg.derive()
     logger.debug("Filtering half spaces")
 
     regionAABBs = _regionZoneAABBsToRegionAABBs(regionZoneAABBs)
 
     for region_name, region in flukareg.regionDict.items():
-        regionOut = _deepcopy(region)
         regionAABB = regionAABBs[region_name]
+        redundant = []
         # Loop over the bodies of this region
-        for body in regionOut.bodies():
+        for body in region.bodies():
             # Only potentially omit half spaces
             if isinstance(body, (_fluka.XYP, _fluka.XZP, _fluka.YZP, _fluka.PLA)):
                 normal, pointOnPlane = body.toPlane()
@@ -498,14 +603,20 @@ def _filterHalfSpaces(flukareg, regionZoneAABBs):
                         aabbCornerDistance,
                         d,
                     )
-                    regionOut.removeBody(body.name)
+                    redundant.append(body.name)
+
+        # Only copy the regions that are changed.
+        regionOut = region
+        if redundant:
+            regionOut = _deepcopy(region)
+            for name in redundant:
+                regionOut.removeBody(name)
+
         # add this region to the output fluka registry along with the
         # filtered bodies.
         fout.addRegion(regionOut)
         regionOut.allBodiesToRegistry(fout)
 
-    _copyStructureToNewFlukaRegistry(flukareg, fout)
-
     return fout
 
 
@@ -543,17 +654,15 @@ def _makeUniqueQuadricRegions(flukareg, quadricRegionAABBs):
     quadricRegionAABBs = _getMaximalQuadricRegionAABBs(flukareg, quadricRegionAABBs)
 
     bodiesToRegions = flukareg.getBodyToRegionsMap()
-    flukaRegOut = _fluka.FlukaRegistry()
+    flukaRegOut = flukareg.derive()
     for regionName, region in flukareg.regionDict.items():
         if regionName in quadricRegionAABBs:
             uniqueRegion = region.makeUnique("_" + regionName, flukaRegOut)
             flukaRegOut.addRegion(uniqueRegion)
         else:
-            newRegion = _deepcopy(region)
-            flukaRegOut.addRegion(newRegion)
-            newRegion.allBodiesToRegistry(flukaRegOut)
+            flukaRegOut.addRegion(region)
+            region.allBodiesToRegistry(flukaRegOut)
 
-    _copyStructureToNewFlukaRegistry(flukareg, flukaRegOut)
     return flukaRegOut
 
 
@@ -608,9 +717,3 @@ def _regionZoneAABBsToRegionAABBs(regionZoneAABBs):
         regionAABB = _reduce(_getMaximalOfTwoAABBs, zoneAABBs, zoneAABBs[0])
         regionAABBs[name] = regionAABB
     return regionAABBs
-
-
-def _copyStructureToNewFlukaRegistry(freg, fregtarget):
-    fregtarget.latticeDict = _deepcopy(freg.latticeDict)
-    fregtarget.assignmas = _deepcopy(freg.assignmas)
-    fregtarget.materials = _deepcopy(freg.materials)
@@ -1,13 +1,16 @@
 import pyg4ometry.transformation as _transformation
 import pyg4ometry.geant4 as _geant4
 import pyg4ometry.fluka as _fluka
+from pyg4ometry.fluka import analytic_aabb as _analytic_aabb
 import pyg4ometry.pycgal as _pycgal
 from pyg4ometry.pycgal.core import PolygonProcessing as _PolygonProcessing
 from pyg4ometry.fluka.directive import (
     rotoTranslationFromTra2 as _rotoTranslationFromTra2,
 )
+from pyg4ometry.geant4.solid.MeshCache import meshCacheKey as _meshCacheKey
 import numpy as _np
 import copy as _copy
+import weakref as _weakref
 import scipy.linalg as _la
 
 # this should be refactored to rename namespaced (privately)
@@ -15,14 +18,19 @@ from pyg4ometry.fluka.body import *
 
 # import matplotlib.pyplot as _plt
 
+# converted solid regions (as zones) per fluka registry, see geant4Solid2FlukaRegion
+_solidRegionCache = _weakref.WeakKeyDictionary()
 
-def geant4Reg2FlukaReg(greg, logicalVolumeName="", bakeTransforms=False):
+
+def geant4Reg2FlukaReg(greg, logicalVolumeName="", bakeTransforms=False, latticeThreshold=None):
     """
     Convert a Geant4 model to a FLUKA one. This is done by handing over a complete
     pyg4ometry.geant4.Registry instance.
 
     :param greg: geant4 registry
     :type greg: pyg4ometry.geant4.Registry
+    :param latticeThreshold: logical volumes with daughters placed at least this many times are converted once and the other placements made LATTICE cells of it. None (default) converts every placement.
+    :type latticeThreshold: int
 
     returns:  pyg4ometry.fluka.FlukaRegistry
     """
@@ -34,15 +42,21 @@ def geant4Reg2FlukaReg(greg, logicalVolumeName="", bakeTransforms=False):
     else:
         logi = greg.logicalVolumeDict[logicalVolumeName]
     freg = geant4MaterialDict2Fluka(greg.materialDict, freg)
-    freg = geant4Logical2Fluka(logi, freg, bakeTransforms)
+    freg = geant4Logical2Fluka(logi, freg, bakeTransforms, latticeThreshold)
 
     return freg
 
 
-def geant4Logical2Fluka(logicalVolume, flukaRegistry=None, bakeTransforms=False):
+def geant4Logical2Fluka(
+    logicalVolume, flukaRegistry=None, bakeTransforms=False, latticeThreshold=None
+):
     """
     Convert a single logical volume - not the main entry point for the conversion.
     """
+    instancing = None
+    if latticeThreshold is not None:
+        instancing = _LatticeInstancing(logicalVolume, latticeThreshold)
+
     mtra = _np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
     tra = _np.array([0, 0, 0])
 
@@ -121,6 +135,8 @@ def geant4Logical2Fluka(logicalVolume, flukaRegistry=None, bakeTransforms=False)
     for zone in flukaMotherOuterRegion.zones:
         fzone.addSubtraction(zone)
 
+    motherBounds = [_zoneBounds(zone) for zone in flukaMotherRegion.zones]
+
     for dv in logicalVolume.daughterVolumes:
         pvmrot = _transformation.tbzyx2matrix(-_np.array(dv.rotation.eval()))
         pvtra = _np.array(dv.position.eval())
@@ -131,13 +147,17 @@ def geant4Logical2Fluka(logicalVolume, flukaRegistry=None, bakeTransforms=False)
         new_tra = mtra @ pvtra + tra
 
         flukaDaughterOuterRegion, flukaNameCount = geant4PhysicalVolume2Fluka(
-            dv, new_mtra, new_tra, flukaRegistry, flukaNameCount, bakeTransforms=bakeTransforms
+            dv,
+            new_mtra,
+            new_tra,
+            flukaRegistry,
+            flukaNameCount,
+            bakeTransforms=bakeTransforms,
+            instancing=instancing,
         )
 
         # subtract daughters from black body
-        for motherZones in flukaMotherRegion.zones:
-            for daughterZones in flukaDaughterOuterRegion.zones:
-                motherZones.addSubtraction(daughterZones)
+        _subtractDaughterZones(flukaMotherRegion.zones, motherBounds, flukaDaughterOuterRegion)
 
     ###########################################
     # create black body region
@@ -178,7 +198,16 @@ def geant4PhysicalVolume2Fluka(
     flukaRegistry=None,
     flukaNameCount=0,
     bakeTransforms=False,
+    instancing=None,
 ):
+    # repeated placement of an instanced logical volume
+    if instancing is not None:
+        cell = _geant4PhysicalVolume2FlukaLatticeCell(
+            physicalVolume, mtra, tra, flukaRegistry, flukaNameCount, bakeTransforms, instancing
+        )
+        if cell is not None:
+            return cell
+
     # logical volume (outer and complete)
     if physicalVolume.logicalVolume.type == "logical":
         geant4LvOuterSolid = physicalVolume.logicalVolume.solid
@@ -241,6 +270,7 @@ def geant4PhysicalVolume2Fluka(
                 flukaRegistry=flukaRegistry,
                 flukaNameCount=flukaNameCount,
                 bakeTransforms=bakeTransforms,
+                instancing=instancing,
             )
 
         materialName = daughterVolumes[0].logicalVolume.material.name
@@ -252,6 +282,8 @@ def geant4PhysicalVolume2Fluka(
         except KeyError:
             pass
     else:
+        motherBounds = [_zoneBounds(zone) for zone in flukaMotherRegion.zones]
+
         # loop over daughters and remove from mother region
         for dv in physicalVolume.logicalVolume.daughterVolumes:
             # placement information for daughter
@@ -270,11 +302,12 @@ def geant4PhysicalVolume2Fluka(
                 flukaRegistry=flukaRegistry,
                 flukaNameCount=flukaNameCount,
                 bakeTransforms=bakeTransforms,
+                instancing=instancing,
             )
             if physicalVolume.logicalVolume.type == "logical":
-                for motherZones in flukaMotherRegion.zones:
-                    for daughterZones in flukaDaughterOuterRegion.zones:
-                        motherZones.addSubtraction(daughterZones)
+                _subtractDaughterZones(
+                    flukaMotherRegion.zones, motherBounds, flukaDaughterOuterRegion
+                )
             elif physicalVolume.logicalVolume.type == "assembly":
                 # If assembly the daughters form the outer
                 for daughterZones in flukaDaughterOuterRegion.zones:
@@ -297,6 +330,114 @@ def geant4PhysicalVolume2Fluka(
     return flukaMotherOuterRegion, flukaNameCount
 
 
+def _zoneBounds(zone):
+    # body parameters are in cm but rot-defi translations are in mm
+    return _analytic_aabb.zoneBounds(zone, translationScale=0.1)
+
+
+def _subtractDaughterZones(motherZones, motherBounds, daughterRegion, tolerance=1e-6):
+    """
+    Subtract the zones of a daughter region from the mother zones whose
+    bounds (from _zoneBounds) they overlap. Other mother zones cannot
+    intersect the daughter so the subtraction is not needed.
+    """
+    for daughterZone in daughterRegion.zones:
+        daughterLower, daughterUpper = _zoneBounds(daughterZone)
+        for motherZone, (motherLower, motherUpper) in zip(motherZones, motherBounds):
+            if (daughterLower <= motherUpper + tolerance).all() and (
+                motherLower <= daughterUpper + tolerance
+            ).all():
+                motherZone.addSubtraction(daughterZone)
+
+
+class _LatticeInstancing:
+    """
+    Logical volumes to be converted once and placed as FLUKA LATTICE cells,
+    and the placement of the prototype of each (the first placement met).
+    """
+
+    def __init__(self, logicalVolume, threshold):
+        counts = _logicalVolumeInstanceCounts(logicalVolume)
+        self.instanced = {
+            lv.name
+            for lv, count in counts.values()
+            if count >= threshold and lv.type == "logical" and len(lv.daughterVolumes) > 0
+        }
+        self.prototypes = {}
+
+
+def _logicalVolumeInstanceCounts(logicalVolume):
+    """
+    Number of times each logical volume appears in the tree of logical
+    volume. Returns a dict of name to (logical volume, count).
+    """
+    # depth first post order, reversed so parents come before daughters
+    order = []
+    seen = set()
+
+    def visit(lv):
+        if lv.name in seen:
+            return
+        seen.add(lv.name)
+        for dv in lv.daughterVolumes:
+            visit(dv.logicalVolume)
+        order.append(lv)
+
+    visit(logicalVolume)
+
+    counts = {logicalVolume.name: (logicalVolume, 1)}
+    for lv in reversed(order):
+        count = counts[lv.name][1]
+        for dv in lv.daughterVolumes:
+            daughter = dv.logicalVolume
+            counts[daughter.name] = (daughter, counts.get(daughter.name, (daughter, 0))[1] + count)
+    return counts
+
+
+def _geant4PhysicalVolume2FlukaLatticeCell(
+    physicalVolume, mtra, tra, flukaRegistry, flukaNameCount, bakeTransforms, instancing
+):
+    """
+    Convert a placement of an instanced logical volume to a LATTICE cell of
+    its prototype. Only the outer solid is converted (as the cell region) and
+    a ROT-DEFI maps the cell onto the prototype. Returns None for placements
+    that have to be converted in full: the prototype itself and reflections.
+    """
+    lv = physicalVolume.logicalVolume
+    if lv.name not in instancing.instanced or _np.linalg.det(mtra) < 0:
+        return None
+
+    try:
+        prototypeMtra, prototypeTra = instancing.prototypes[lv.name]
+    except KeyError:
+        instancing.prototypes[lv.name] = (mtra, tra)
+        return None
+
+    cellRegion, flukaNameCount = geant4Solid2FlukaRegion(
+        flukaNameCount,
+        lv.solid,
+        mtra,
+        tra,
+        flukaRegistry,
+        commentName=physicalVolume.name,
+        bakeTransforms=bakeTransforms,
+    )
+    cellRegion.comment = physicalVolume.name
+
+    # cell point x -> prototype point rotation @ x + translation
+    rotation = prototypeMtra @ mtra.T
+    translation = prototypeTra - rotation @ tra
+    rotoTranslation = _rotoTranslationFromTra2(
+        "L" + cellRegion.name[1:],
+        [_transformation.matrix2tbxyz(rotation), translation],
+        flukaregistry=flukaRegistry,
+        allowZero=True,
+    )
+    _fluka.Lattice(cellRegion, rotoTranslation, flukaregistry=flukaRegistry)
+
+    return cellRegion, flukaNameCount
+
+
 def geant4Solid2FlukaRegion(
     flukaNameCount,
     solid,
@@ -306,6 +447,123 @@ def geant4Solid2FlukaRegion(
     addRegistry=True,
     commentName="",
     bakeTransforms=False,
+):
+    """
+    Convert a solid placed with rotation mtra and translation tra to a FLUKA
+    region. Conversions are memoised per registry by the content of the solid
+    and the placement, so a solid placed the same way again gives a new region
+    made of the bodies of the first conversion. Bodies identical to ones
+    already in the registry are shared instead of being defined again.
+    """
+    key = _solidRegionKey(solid, mtra, tra, bakeTransforms)
+    cache = _solidRegionCache.setdefault(flukaRegistry, {}) if key is not None else None
+
+    if cache is not None and key in cache:
+        name = format(flukaNameCount, "04")
+        flukaRegistry.PhysVolToRegionMap[commentName] = "R" + name
+        fregion = _fluka.Region("R" + name)
+        for zone in cache[key]:
+            fregion.addZone(_mapZoneBodies(zone, {}))
+        return fregion, flukaNameCount + 1
+
+    fregion, flukaNameCount = _geant4Solid2FlukaRegion(
+        flukaNameCount,
+        solid,
+        mtra,
+        tra,
+        flukaRegistry,
+        addRegistry,
+        commentName,
+        bakeTransforms,
+    )
+    _shareIdenticalBodies(fregion, flukaRegistry)
+
+    # callers may modify the zones of the region so keep a copy
+    if cache is not None:
+        cache[key] = [_mapZoneBodies(zone, {}) for zone in fregion.zones]
+
+    return fregion, flukaNameCount
+
+
+def _solidRegionKey(solid, mtra, tra, bakeTransforms, decimals=9):
+    """
+    Key of the conversion of a solid: the content key of the solid and the
+    placement rounded to decimals. None if the solid can't be keyed, or if
+    its conversion has side effects beyond the returned region (extruders
+    add their decomposed regions and material assignments to the registry).
+    """
+    if _containsExtruder(solid):
+        return None
+    solidKey = _meshCacheKey(solid)
+    if solidKey is None:
+        return None
+    placement = _np.round(
+        _np.concatenate([_np.ravel(mtra), _np.ravel(tra)]).astype(float), decimals
+    )
+    return (solidKey, tuple(placement.tolist()), bool(bakeTransforms))
+
+
+def _containsExtruder(solid):
+    if solid.type == "extruder":
+        return True
+    constituents = getattr(solid, "objects", None) or [
+        getattr(solid, "obj1", None),
+        getattr(solid, "obj2", None),
+    ]
+    return any(s is not None and _containsExtruder(s) for s in constituents)
+
+
+def _mapZoneBodies(zone, bodyMap):
+    """
+    Copy of zone (and its subzones) with each body replaced by bodyMap[body.name]
+    where present. The bodies themselves are not copied.
+    """
+    result = _fluka.Zone(name=zone.name)
+    for boolean in zone.intersections:
+        result.addIntersection(_mapBooleanBody(boolean.body, bodyMap))
+    for boolean in zone.subtractions:
+        result.addSubtraction(_mapBooleanBody(boolean.body, bodyMap))
+    return result
+
+
+def _mapBooleanBody(body, bodyMap):
+    if isinstance(body, _fluka.Zone):
+        return _mapZoneBodies(body, bodyMap)
+    return bodyMap.get(body.name, body)
+
+
+def _shareIdenticalBodies(region, flukaRegistry):
+    """
+    Replace the bodies of region that are identical (same key, so same type,
+    parameters and transform) to a body defined earlier in flukaRegistry by
+    that body, and remove the duplicates from the registry.
+    """
+    bodyStore = flukaRegistry.bodyDict
+    bodyMap = {}
+    for body in region.bodies():
+        if body.name in bodyMap or body.name not in bodyStore.nameBody:
+            continue
+        existing = bodyStore.identicalBody(body)
+        if existing is not None:
+            bodyMap[body.name] = existing
+
+    if not bodyMap:
+        return
+
+    region.zones = [_mapZoneBodies(zone, bodyMap) for zone in region.zones]
+    for name in bodyMap:
+        del bodyStore[name]
+
+
+def _geant4Solid2FlukaRegion(
+    flukaNameCount,
+    solid,
+    mtra=_np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]]),
+    tra=_np.array([0, 0, 0]),
+    flukaRegistry=None,
+    addRegistry=True,
+    commentName="",
+    bakeTransforms=False,
 ):
     import pyg4ometry.gdml.Units as _Units  # TODO move circular import
 
@@ -1639,55 +1897,78 @@ def pycsgmesh2FlukaRegion(
     transform = _rotoTranslationFromTra2("T" + name, [rotation, tra], flukaregistry=flukaRegistry)
 
     polyhedron = _pycgal.Polyhedron_3.Polyhedron_3_EPECK()
-    _pycgal.CGAL.copy_face_graph(mesh.sm, polyhedron)
+    _pycgal.CGAL.copy_face_graph(mesh.exactSurfaceMesh(), polyhedron)
     nef = _pycgal.Nef_polyhedron_3.Nef_polyhedron_3_EPECK(polyhedron)
     convex_polyhedra = _pycgal.PolyhedronProcessing.nefPolyhedron_to_convexPolyhedra(nef)
 
-    fregion = _fluka.Region("R" + name)
-
-    ibody = 0
+    # planes of all the convex polyhedra are made in one batch
+    polyhedraPlanes = [
+        _np.reshape(
+            _pycgal.PolyhedronProcessing.polyhedron_to_numpyArrayPlanes(convex_polyhedron),
+            (-1, 6),
+        )
+        for convex_polyhedron in convex_polyhedra
+    ]
+    planes = _np.concatenate(polyhedraPlanes) if polyhedraPlanes else _np.zeros((0, 6))
+    norms = _np.sqrt((planes[:, 3:] ** 2).sum(axis=1))[:, None]
 
     if not bakeTransform:
-        for convex_polyhedron in convex_polyhedra:
-            planes = _pycgal.PolyhedronProcessing.polyhedron_to_numpyArrayPlanes(convex_polyhedron)
+        normals = -planes[:, 3:] / norms
+        points = planes[:, 0:3] / 10.0
+        fbodies, _ = _makePlaneBodies(
+            flukaRegistry, name, 0, normals, points, transform, commentName
+        )
+    else:
+        normals = _rotateRows(mtra, -planes[:, 3:]) / norms
+        points = _rotateRows(mtra, planes[:, 0:3]) / 10 + tra / 10
+        fbodies, _ = _makePlaneBodies(flukaRegistry, name, 0, normals, points, None, commentName)
 
-            fzone = _fluka.Zone()
+    fregion = _fluka.Region("R" + name)
 
-            for plane in planes:
-                fbody = flukaRegistry.makeBody(
-                    PLA,
-                    "B" + name + format(ibody, "02"),
-                    -plane[3:] / _np.sqrt((plane[3:] ** 2).sum()),
-                    plane[0:3] / 10.0,
-                    transform=transform,
-                    flukaregistry=flukaRegistry,
-                    comment=commentName,
-                )
-                fzone.addSubtraction(fbody)
-                ibody += 1
+    start = 0
+    for polyhedronPlanes in polyhedraPlanes:
+        stop = start + len(polyhedronPlanes)
+        fzone = _fluka.Zone()
+        for fbody in fbodies[start:stop]:
+            fzone.addSubtraction(fbody)
+        fregion.addZone(fzone)
+        start = stop
+    return fregion
 
-            fregion.addZone(fzone)
-    else:
-        for convex_polyhedron in convex_polyhedra:
-            planes = _pycgal.PolyhedronProcessing.polyhedron_to_numpyArrayPlanes(convex_polyhedron)
 
-            fzone = _fluka.Zone()
+def _rotateRows(mtra, vectors):
+    # stacked matrix-vector products, the same arithmetic as mtra @ vector per row
+    return (_np.asarray(mtra, dtype=float) @ vectors[..., None])[..., 0]
 
-            for plane in planes:
-                fbody = flukaRegistry.makeBody(
-                    PLA,
-                    "B" + name + format(ibody, "02"),
-                    mtra @ -plane[3:] / _np.sqrt((plane[3:] ** 2).sum()),
-                    mtra @ plane[0:3] / 10 + tra / 10,
-                    transform=None,
-                    flukaregistry=flukaRegistry,
-                    comment=commentName,
-                )
-                fzone.addSubtraction(fbody)
-                ibody += 1
 
-            fregion.addZone(fzone)
-    return fregion
+def _makePlaneBodies(
+    flukaRegistry, name, ibody, normals, points, transform, commentName, mtra=None, tra=None
+):
+    """
+    Make PLA bodies "B" + name + ibody, ibody + 1, ... from rows of normals
+    and points. Given mtra and tra, all the planes are rotated and translated
+    (tra in mm, points in cm) in one batch first. Returns the bodies and the
+    next body index.
+    """
+    normals = _np.asarray(normals, dtype=float).reshape(-1, 3)
+    points = _np.asarray(points, dtype=float).reshape(-1, 3)
+    if mtra is not None:
+        normals = _rotateRows(mtra, normals)
+        points = _rotateRows(mtra, points) + _np.asarray(tra) / 10
+
+    fbodies = [
+        flukaRegistry.makeBody(
+            PLA,
+            "B" + name + format(ibody + i, "02"),
+            normal,
+            point,
+            transform=transform,
+            flukaregistry=flukaRegistry,
+            comment=commentName,
+        )
+        for i, (normal, point) in enumerate(zip(normals.tolist(), points.tolist()))
+    ]
+    return fbodies, ibody + len(fbodies)
 
 
 def geant4Sphere2Fluka(
@@ -2470,175 +2751,73 @@ def geant4Extruded2Fluka(
 
     fregion = _fluka.Region("R" + name)
 
-    ibody = 0
-    # loop over planes
-    for i in range(0, nslices - 1, 1):
-        i1 = i
-        i2 = i + 1
-
-        zi1 = zpos[i1]
-        zi2 = zpos[i2]
-
-        # build i'th and i+1'th layers
-        i1PolyListConvex = []
-        i2PolyListConvex = []
-
-        for j in range(0, len(polyListConvex), 1):
-            i1PolyListConvex.append(
-                [
-                    [
-                        scale[i1] * vert[0] + x_offs[i1],
-                        scale[i1] * vert[1] + y_offs[i1],
-                    ]
-                    for vert in polyListConvex[j]
-                ]
-            )
+    # vertices of all the convex polygons and the index of the vertex following each one
+    nVertices = [len(polygon) for polygon in polyListConvex]
+    firstVertex = _np.cumsum([0, *nVertices])
+    polyVertices = _np.array(
+        [vert for polygon in polyListConvex for vert in polygon], dtype=float
+    ).reshape(-1, 2)
+    nextVertex = _np.array(
+        [first + (k + 1) % n for first, n in zip(firstVertex, nVertices) for k in range(n)],
+        dtype=int,
+    )
 
-            i2PolyListConvex.append(
-                [
-                    [
-                        scale[i2] * vert[0] + x_offs[i2],
-                        scale[i2] * vert[1] + y_offs[i2],
-                    ]
-                    for vert in polyListConvex[j]
-                ]
-            )
+    # vertices of every layer (layer, vertex) and side plane normals between layers i, i+1
+    zpos = _np.array(zpos, dtype=float)
+    scale = _np.array(scale, dtype=float)[:, None]
+    xs = scale * polyVertices[:, 0] + _np.array(x_offs, dtype=float)[:, None]
+    ys = scale * polyVertices[:, 1] + _np.array(y_offs, dtype=float)[:, None]
+
+    x0 = xs[:-1]
+    y0 = ys[:-1]
+    z0 = _np.broadcast_to(zpos[:-1, None], x0.shape)
+
+    dx1 = xs[1:] - x0
+    dy1 = ys[1:] - y0
+    dz1 = zpos[1:, None] - z0
+    ld1 = _np.sqrt(dx1**2 + dy1**2 + dz1**2)
+    dx1, dy1, dz1 = dx1 / ld1, dy1 / ld1, dz1 / ld1
+
+    dx2 = x0[:, nextVertex] - x0
+    dy2 = y0[:, nextVertex] - y0
+    dz2 = z0 - z0
+    ld2 = _np.sqrt(dx2**2 + dy2**2 + dz2**2)
+    dx2, dy2, dz2 = dx2 / ld2, dy2 / ld2, dz2 / ld2
+
+    nx = dy1 * dz2 - dz1 * dy2
+    ny = dx2 * dz1 - dx1 * dz2
+    nz = dx1 * dy2 - dy1 * dx2
+
+    # per layer: low and high end planes followed by the side planes
+    nLayers = nslices - 1
+    endNormals = _np.broadcast_to(_np.array([[0, 0, -1], [0, 0, 1]], dtype=float), (nLayers, 2, 3))
+    endPoints = _np.zeros((nLayers, 2, 3))
+    endPoints[:, 0, 2] = zpos[:-1]
+    endPoints[:, 1, 2] = zpos[1:]
+    normals = _np.concatenate([endNormals, _np.stack([-nx, -ny, -nz], axis=-1)], axis=1)
+    points = _np.concatenate([endPoints, _np.stack([x0, y0, z0], axis=-1)], axis=1)
 
-        # end planes
-        if not bakeTransform:
-            fbody1 = flukaRegistry.makeBody(
-                PLA,
-                "B" + name + format(ibody, "02"),
-                [0, 0, -1],
-                [0, 0, zi1],
-                transform=transform,
-                flukaregistry=flukaRegistry,
-                comment=commentName,
-            )
-        else:
-            fbody1 = flukaRegistry.makeBody(
-                PLA,
-                "B" + name + format(ibody, "02"),
-                mtra @ _np.array([0, 0, -1]),
-                mtra @ _np.array([0, 0, zi1]) + tra / 10,
-                transform=None,
-                flukaregistry=flukaRegistry,
-                comment=commentName,
-            )
-        ibody += 1
+    if not bakeTransform:
+        fbodies, _ = _makePlaneBodies(
+            flukaRegistry, name, 0, normals, points, transform, commentName
+        )
+    else:
+        fbodies, _ = _makePlaneBodies(
+            flukaRegistry, name, 0, normals, points, None, commentName, mtra, tra
+        )
 
-        if not bakeTransform:
-            fbody2 = flukaRegistry.makeBody(
-                PLA,
-                "B" + name + format(ibody, "02"),
-                [0, 0, 1],
-                [0, 0, zi2],
-                transform=transform,
-                flukaregistry=flukaRegistry,
-                comment=commentName,
-            )
-        else:
-            fbody2 = flukaRegistry.makeBody(
-                PLA,
-                "B" + name + format(ibody, "02"),
-                mtra @ _np.array([0, 0, 1]),
-                mtra @ _np.array([0, 0, zi2]) + tra / 10,
-                transform=None,
-                flukaregistry=flukaRegistry,
-                comment=commentName,
-            )
-        ibody += 1
+    nLayerBodies = 2 + len(polyVertices)
+    for i in range(0, nLayers, 1):
+        layerBodies = fbodies[i * nLayerBodies : (i + 1) * nLayerBodies]
+        fbody1, fbody2 = layerBodies[0:2]
 
-        for j in range(0, len(i1PolyListConvex), 1):
+        for j in range(0, len(polyListConvex), 1):
             fzone = _fluka.Zone()
 
             fzone.addIntersection(fbody1)
             fzone.addIntersection(fbody2)
 
-            for k in range(0, len(i1PolyListConvex[j]), 1):
-                k1 = k
-                k2 = (k + 1) % len(i1PolyListConvex[j])
-
-                x0 = i1PolyListConvex[j][k1][0]
-                y0 = i1PolyListConvex[j][k1][1]
-                z0 = zi1
-
-                x1 = i2PolyListConvex[j][k1][0]
-                y1 = i2PolyListConvex[j][k1][1]
-                z1 = zi2
-
-                x2 = i1PolyListConvex[j][k2][0]
-                y2 = i1PolyListConvex[j][k2][1]
-                z2 = zi1
-
-                dx1 = x1 - x0
-                dy1 = y1 - y0
-                dz1 = z1 - z0
-
-                ld1 = _np.sqrt(dx1**2 + dy1**2 + dz1**2)
-
-                dx1 = dx1 / ld1
-                dy1 = dy1 / ld1
-                dz1 = dz1 / ld1
-
-                dx2 = x2 - x0
-                dy2 = y2 - y0
-                dz2 = z2 - z0
-
-                ld2 = _np.sqrt(dx2**2 + dy2**2 + dz2**2)
-
-                dx2 = dx2 / ld2
-                dy2 = dy2 / ld2
-                dz2 = dz2 / ld2
-
-                nx = dy1 * dz2 - dz1 * dy2
-                ny = dx2 * dz1 - dx1 * dz2
-                nz = dx1 * dy2 - dy1 * dx2
-
-                if not bakeTransform:
-                    fbody = flukaRegistry.makeBody(
-                        PLA,
-                        "B" + name + format(ibody, "02"),
-                        [
-                            -nx,
-                            -ny,
-                            -nz,
-                        ],
-                        [
-                            x0,
-                            y0,
-                            z0,
-                        ],
-                        transform=transform,
-                        flukaregistry=flukaRegistry,
-                        comment=commentName,
-                    )
-                else:
-                    fbody = flukaRegistry.makeBody(
-                        PLA,
-                        "B" + name + format(ibody, "02"),
-                        mtra
-                        @ _np.array(
-                            [
-                                -nx,
-                                -ny,
-                                -nz,
-                            ]
-                        ),
-                        mtra
-                        @ _np.array(
-                            [
-                                x0,
-                                y0,
-                                z0,
-                            ]
-                        )
-                        + tra / 10,
-                        transform=None,
-                        flukaregistry=flukaRegistry,
-                        comment=commentName,
-                    )
-                ibody += 1
+            for fbody in layerBodies[2 + firstVertex[j] : 2 + firstVertex[j + 1]]:
                 fzone.addIntersection(fbody)
             fregion.addZone(fzone)
 
@@ -2710,137 +2889,83 @@ def geant4Polyhedra2Fluka(
 
     fregion = _fluka.Region("R" + name)
 
-    # loop over zr convex polygons
-    ibody = 0
-
-    for i in range(0, len(zrListConvex), 1):
-        for j in range(0, numSide, 1):
-            j1 = j
-            j2 = j + 1
-
-            phi1 = dPhi * j1 + pSPhi
-            phi2 = dPhi * j2 + pSPhi
-
-            fzone = _fluka.Zone()
-
-            for k in range(0, len(zrListConvex[i]), 1):
-                k1 = k
-                k2 = (k + 1) % len(zrListConvex[i])  # cyclic index as polygon is closed
+    # phi segments (segment, 1)
+    segment = _np.arange(numSide)
+    phi1 = (dPhi * segment + pSPhi)[:, None]
+    phi2 = (dPhi * (segment + 1) + pSPhi)[:, None]
 
-                z1 = zrListConvex[i][k1][0]
-                r1 = zrListConvex[i][k1][1]
+    # for each zr convex polygon and phi segment: the side planes of the polygon
+    # edges (segment, edge) followed by the two phi planes
+    normals = []
+    points = []
+    for zrConvex in zrListConvex:
+        zrConvex = _np.asarray(zrConvex, dtype=float)
+        z1 = zrConvex[:, 0]
+        r1 = zrConvex[:, 1]
+        z2 = _np.roll(z1, -1)  # cyclic index as polygon is closed
+        r2 = _np.roll(r1, -1)
 
-                x1p1 = r1 * _np.cos(phi1)
-                y1p1 = r1 * _np.sin(phi1)
+        x1p1 = r1 * _np.cos(phi1)
+        y1p1 = r1 * _np.sin(phi1)
 
-                x1p2 = r1 * _np.cos(phi2)
-                y1p2 = r1 * _np.sin(phi2)
+        x1p2 = r1 * _np.cos(phi2)
+        y1p2 = r1 * _np.sin(phi2)
 
-                z2 = zrListConvex[i][k2][0]
-                r2 = zrListConvex[i][k2][1]
+        x2p1 = r2 * _np.cos(phi1)
+        y2p1 = r2 * _np.sin(phi1)
 
-                x2p1 = r2 * _np.cos(phi1)
-                y2p1 = r2 * _np.sin(phi1)
+        dx1 = x2p1 - x1p1
+        dy1 = y2p1 - y1p1
+        dz1 = _np.broadcast_to(z2 - z1, x1p1.shape)
 
-                x2p2 = r2 * _np.cos(phi2)
-                x2p2 = r2 * _np.sin(phi2)
+        l1 = _np.sqrt(dx1**2 + dy1**2 + dz1**2)
+        dx1, dy1, dz1 = dx1 / l1, dy1 / l1, dz1 / l1
 
-                dx1 = x2p1 - x1p1
-                dy1 = y2p1 - y1p1
-                dz1 = z2 - z1
+        dx2 = x1p2 - x1p1
+        dy2 = y1p2 - y1p1
+        dz2 = _np.zeros(x1p1.shape)
 
-                l1 = _np.sqrt(dx1**2 + dy1**2 + dz1**2)
+        l2 = _np.sqrt(dx2**2 + dy2**2 + dz2**2)
+        dx2, dy2, dz2 = dx2 / l2, dy2 / l2, dz2 / l2
 
-                dx1 = dx1 / l1
-                dy1 = dy1 / l1
-                dz1 = dz1 / l1
+        nx = dy1 * dz2 - dz1 * dy2
+        ny = dz1 * dx2 - dx1 * dz2
+        nz = dx1 * dy2 - dy1 * dx2
 
-                dx2 = x1p2 - x1p1
-                dy2 = y1p2 - y1p1
-                dz2 = 0
+        zeros = _np.zeros((numSide, 1))
+        phiNormals = _np.stack(
+            [
+                _np.hstack([_np.cos(phi1 - _np.pi / 2.0), _np.sin(phi1 - _np.pi / 2.0), zeros]),
+                _np.hstack([_np.cos(phi2 + _np.pi / 2.0), _np.sin(phi2 + _np.pi / 2.0), zeros]),
+            ],
+            axis=1,
+        )
+        sidePoints = _np.stack([x1p1, y1p1, _np.broadcast_to(z1, x1p1.shape)], axis=-1)
 
-                l2 = _np.sqrt(dx2**2 + dy2**2 + dz2**2)
+        normals.append(_np.concatenate([_np.stack([nx, ny, nz], axis=-1), phiNormals], axis=1))
+        points.append(_np.concatenate([sidePoints, _np.zeros((numSide, 2, 3))], axis=1))
 
-                dx2 = dx2 / l2
-                dy2 = dy2 / l2
-                dz2 = dz2 / l2
+    normals = _np.concatenate([n.reshape(-1, 3) for n in normals]) if normals else _np.zeros((0, 3))
+    points = _np.concatenate([p.reshape(-1, 3) for p in points]) if points else _np.zeros((0, 3))
 
-                nx = dy1 * dz2 - dz1 * dy2
-                ny = dz1 * dx2 - dx1 * dz2
-                nz = dx1 * dy2 - dy1 * dx2
+    if not bakeTransform:
+        fbodies, _ = _makePlaneBodies(
+            flukaRegistry, name, 0, normals, points, transform, commentName
+        )
+    else:
+        fbodies, _ = _makePlaneBodies(
+            flukaRegistry, name, 0, normals, points, transform, commentName, mtra, tra
+        )
 
-                if not bakeTransform:
-                    fbody = flukaRegistry.makeBody(
-                        PLA,
-                        "B" + name + format(ibody, "02"),
-                        [nx, ny, nz],
-                        [x1p1, y1p1, z1],
-                        transform=transform,
-                        flukaregistry=flukaRegistry,
-                        comment=commentName,
-                    )
-                else:
-                    fbody = flukaRegistry.makeBody(
-                        PLA,
-                        "B" + name + format(ibody, "02"),
-                        mtra @ _np.array([nx, ny, nz]),
-                        mtra @ _np.array([x1p1, y1p1, z1]) + tra / 10,
-                        transform=transform,
-                        flukaregistry=flukaRegistry,
-                        comment=commentName,
-                    )
+    start = 0
+    for zrConvex in zrListConvex:
+        for j in range(0, numSide, 1):
+            stop = start + len(zrConvex) + 2
+            fzone = _fluka.Zone()
+            for fbody in fbodies[start:stop]:
                 fzone.addIntersection(fbody)
-                ibody += 1
-
-            if not bakeTransform:
-                fbody = flukaRegistry.makeBody(
-                    PLA,
-                    "B" + name + format(ibody, "02"),
-                    [_np.cos(phi1 - _np.pi / 2.0), _np.sin(phi1 - _np.pi / 2.0), 0],
-                    [0, 0, 0],
-                    transform=transform,
-                    flukaregistry=flukaRegistry,
-                    comment=commentName,
-                )
-            else:
-                fbody = flukaRegistry.makeBody(
-                    PLA,
-                    "B" + name + format(ibody, "02"),
-                    mtra
-                    @ _np.array([_np.cos(phi1 - _np.pi / 2.0), _np.sin(phi1 - _np.pi / 2.0), 0]),
-                    mtra @ _np.array([0, 0, 0]) + tra / 10,
-                    transform=transform,
-                    flukaregistry=flukaRegistry,
-                    comment=commentName,
-                )
-            fzone.addIntersection(fbody)
-            ibody += 1
-
-            if not bakeTransform:
-                fbody = flukaRegistry.makeBody(
-                    PLA,
-                    "B" + name + format(ibody, "02"),
-                    [_np.cos(phi2 + _np.pi / 2.0), _np.sin(phi2 + _np.pi / 2.0), 0],
-                    [0, 0, 0],
-                    transform=transform,
-                    flukaregistry=flukaRegistry,
-                    comment=commentName,
-                )
-            else:
-                fbody = flukaRegistry.makeBody(
-                    PLA,
-                    "B" + name + format(ibody, "02"),
-                    mtra
-                    @ _np.array([_np.cos(phi2 + _np.pi / 2.0), _np.sin(phi2 + _np.pi / 2.0), 0]),
-                    mtra @ _np.array([0, 0, 0]) + tra / 10,
-                    transform=transform,
-                    flukaregistry=flukaRegistry,
-                    comment=commentName,
-                )
-            fzone.addIntersection(fbody)
-            ibody += 1
-
             fregion.addZone(fzone)
+            start = stop
 
     flukaNameCount += 1
 
@@ -3584,31 +3709,57 @@ def makeShortName(mn):
 
 
 def transformQuadricFluka(axx, ayy, azz, axy, axz, ayz, ax, ay, az, a, M, T):
-    Q = _np.array([[axx, axy / 2, axz / 2], [axy / 2, ayy, ayz / 2], [axz / 2, ayz / 2, azz]])
-    P = _np.array([ax, ay, az])
-    R = a
-
-    Qprime, Pprime, Rprime = transformQuadricMatrix(Q, P, R, M, T)
-
-    return (
-        Qprime[0, 0],
-        Qprime[1, 1],
-        Qprime[2, 2],
-        Qprime[0, 1] * 2,
-        Qprime[0, 2] * 2,
-        Qprime[1, 2] * 2,
-        Pprime[0],
-        Pprime[1],
-        Pprime[2],
-        Rprime,
+    return tuple(transformQuadricsFluka([axx, ayy, azz, axy, axz, ayz, ax, ay, az, a], M, T)[0])
+
+
+def transformQuadricsFluka(coefficients, M, T):
+    """
+    Transform many quadrics at once. coefficients are rows of FLUKA QUA
+    coefficients (axx, ayy, azz, axy, axz, ayz, ax, ay, az, a), the same
+    transformed rows are returned.
+    """
+    c = _np.asarray(coefficients, dtype=float).reshape(-1, 10)
+
+    Q = _np.empty((len(c), 3, 3))
+    Q[:, 0, 0] = c[:, 0]
+    Q[:, 1, 1] = c[:, 1]
+    Q[:, 2, 2] = c[:, 2]
+    Q[:, 0, 1] = Q[:, 1, 0] = c[:, 3] / 2
+    Q[:, 0, 2] = Q[:, 2, 0] = c[:, 4] / 2
+    Q[:, 1, 2] = Q[:, 2, 1] = c[:, 5] / 2
+
+    Qprime, Pprime, Rprime = transformQuadricMatrix(Q, c[:, 6:9], c[:, 9], M, T)
+
+    return _np.column_stack(
+        [
+            Qprime[:, 0, 0],
+            Qprime[:, 1, 1],
+            Qprime[:, 2, 2],
+            Qprime[:, 0, 1] * 2,
+            Qprime[:, 0, 2] * 2,
+            Qprime[:, 1, 2] * 2,
+            Pprime,
+            Rprime,
+        ]
     )
 
 
+def _rowDot(a, b):
+    # dot products of the last axes, the same arithmetic as a @ b for single vectors
+    a = _np.asarray(a, dtype=float)
+    b = _np.broadcast_to(_np.asarray(b, dtype=float), a.shape)
+    return (a[..., None, :] @ b[..., :, None])[..., 0, 0]
+
+
 def transformQuadricMatrix(Q, P, R, M, T):
+    """
+    Transform the quadric x.Q.x + P.x + R = 0 by rotation M and translation T.
+    Q, P and R may also be stacks (n,3,3), (n,3) and (n,) of quadrics.
+    """
     M = _np.linalg.inv(M)
     T = -M @ T
     Qprime = M.T @ Q @ M
-    Pprime = M.T @ Q @ T + M.T @ Q.T @ T + M.T @ P
-    Rprime = R + T @ Q @ T + P @ T
+    Pprime = M.T @ Q @ T + M.T @ _np.swapaxes(Q, -1, -2) @ T + _np.asarray(P) @ M
+    Rprime = R + _rowDot(T @ Q, T) + _rowDot(P, T)
 
     return Qprime, Pprime, Rprime
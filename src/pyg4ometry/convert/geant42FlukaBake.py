@@ -2140,7 +2140,7 @@ def geant4Material2Fluka(
 
 def pycsgmesh2FlukaRegion(mesh, name, transform, flukaRegistry, commentName):
     polyhedron = _pycgal.Polyhedron_3.Polyhedron_3_EPECK()
-    _pycgal.CGAL.copy_face_graph(mesh.sm, polyhedron)
+    _pycgal.CGAL.copy_face_graph(mesh.exactSurfaceMesh(), polyhedron)
     nef = _pycgal.Nef_polyhedron_3.Nef_polyhedron_3_EPECK(polyhedron)
     convex_polyhedra = _pycgal.PolyhedronProcessing.nefPolyhedron_to_convexPolyhedra(nef)
 
@@ -19,8 +19,15 @@
     END
 """
 
+import gzip as _gzip
+import logging as _logging
+import time as _time
+
 from pyg4ometry.fluka import material as _material
 from pyg4ometry.fluka.directive import RecursiveRotoTranslation, Transform
+from pyg4ometry import utils as _utils
+
+logger = _logging.getLogger(__name__)
 
 
 class Writer:
@@ -30,14 +37,19 @@ class Writer:
     >>> f = Writer()
     >>> f.addDetectro(flukaRegObject)
     >>> f.write("model.inp")
+
+    The wall clock time taken to write each section of the last file written
+    is kept in the timer attribute (a pyg4ometry.utils.Timer).
     """
 
     _flukaFFString = (
         "*...+....1....+....2....+....3....+....4....+....5....+....6....+....7....+..."
     )
 
+    _bufferSize = 1024**2
+
     def __init__(self):
-        pass
+        self.timer = None
 
     def addDetector(self, flukaRegistry):
         """
@@ -45,11 +57,31 @@ class Writer:
         """
         self.flukaRegistry = flukaRegistry
 
-    def write(self, fileName):
+    def write(self, fileName, compress=None):
         """
         Write the output to a given filename. e.g. "model.inp".
+
+        :param fileName: output file name
+        :type fileName: str
+        :param compress: write gzip compressed output, None (default) compresses file names ending in .gz
+        :type compress: bool
         """
-        f = open(fileName, "w")
+        if compress is None:
+            compress = str(fileName).endswith(".gz")
+
+        if compress:
+            f = _gzip.open(fileName, "wt")
+        else:
+            f = open(fileName, "w", buffering=self._bufferSize)
+
+        with f:
+            self._write(f)
+
+    def _write(self, f):
+        self.timer = _utils.Timer(clock=_time.perf_counter)
+
+        # rot-defi free strings by id, as many bodies share a rototranslation
+        rotoTranslationStrings = {}
 
         f.write("FREE\n")
 
@@ -77,51 +109,31 @@ class Writer:
                         f.write(f"{cardstr}\n")
                 else:
                     cardstr = self.flukaRegistry.cardDict[c].toFreeString()
+        self.timer.add("init cards")
 
         f.write("GEOBEGIN , , , , , , , COMBNAME\n")
         f.write("    0    0\n")
 
-        # loop over bodies
-        for bk in self.flukaRegistry.bodyDict.keys():
-            transform = self.flukaRegistry.bodyDict[bk].transform
-
-            if type(transform) is RecursiveRotoTranslation:
-                if len(transform) != 0:
-                    if transform.flukaFreeString() != "":
-                        f.write("$start_transform " + transform.name + "\n")
-                        try:
-                            rotdefi[transform.name] = transform
-                        except KeyError:
-                            pass
-
-                f.write(self.flukaRegistry.bodyDict[bk].flukaFreeString() + "\n")
-
-                if len(transform) != 0:
-                    if transform.flukaFreeString() != "":
-                        f.write("$end_transform\n")
-            elif type(transform) is Transform:
-                if transform.rotoTranslation:
-                    if len(transform.rotoTranslation) != 0:
-                        if transform.rotoTranslation.flukaFreeString() != "":
-                            f.write("$start_transform " + transform.rotoTranslation.name + "\n")
-                            try:
-                                rotdefi[transform.rotoTranslation.name] = transform.rotoTranslation
-                            except KeyError:
-                                pass
-
-                f.write(self.flukaRegistry.bodyDict[bk].flukaFreeString() + "\n")
-
-                if transform.rotoTranslation:
-                    if len(transform.rotoTranslation) != 0:
-                        if transform.rotoTranslation.flukaFreeString() != "":
-                            f.write("$end_transform\n")
+        self._writeBodies(f, rotdefi, rotoTranslationStrings)
         f.write("END\n")
+        self.timer.add("bodies")
 
         # loop over regions
-        for rk in self.flukaRegistry.regionDict.keys():
-            f.write(self.flukaRegistry.regionDict[rk].flukaFreeString())
+        for region in self.flukaRegistry.regionDict.values():
+            f.write(region.flukaFreeString())
+
+        # lattice cells are regions too
+        for lattice in self.flukaRegistry.latticeDict.values():
+            f.write(lattice.cellRegion.flukaFreeString())
         f.write("END\n")
+        self.timer.add("regions")
+
+        # loop over lattices
+        for lattice in self.flukaRegistry.latticeDict.values():
+            f.write(lattice.flukaFreeString() + "\n")
+            rotdefi[lattice.rotoTranslation.name] = lattice.rotoTranslation
         f.write("GEOEND\n")
+        self.timer.add("lattices")
 
         # loop over materials
         f.write("FREE\n")
@@ -136,6 +148,7 @@ class Writer:
                 pass
             else:
                 f.write(self.flukaRegistry.materials[mk].flukaFreeString() + "\n")
+        self.timer.add("materials")
 
         # loop over material assignments
         for rk in self.flukaRegistry.regionDict.keys():
@@ -149,13 +162,17 @@ class Writer:
                 # now magnetic field
             except KeyError:
                 print("Region does not have an assigned material", rk)
+        self.timer.add("material assignments")
 
         # loop over magnetic fields
 
         # loop over rotdefis
         for rotdefi in rotdefi.values():
-            rotstr = rotdefi.flukaFreeString()
+            rotstr = rotoTranslationStrings.get(id(rotdefi))
+            if rotstr is None:
+                rotstr = rotdefi.flukaFreeString()
             f.write(f"{rotstr}\n")
+        self.timer.add("rotdefis")
 
         # loop over (non init cards)
         for c in self.flukaRegistry.cardDict.keys():
@@ -171,7 +188,38 @@ class Writer:
                 for card in self.flukaRegistry.cardDict[c]:
                     cardstr = card.toFreeString()
                     f.write(f"{cardstr}\n")
+        self.timer.add("cards")
+
+        self.timer.updateTotal()
+        logger.debug("FLUKA write times: %s", self.timer)
+
+    def _writeBodies(self, f, rotdefi, rotoTranslationStrings):
+        def activeRotoTranslation(rotoTranslation):
+            if not rotoTranslation or len(rotoTranslation) == 0:
+                return None
+            key = id(rotoTranslation)
+            if key not in rotoTranslationStrings:
+                rotoTranslationStrings[key] = rotoTranslation.flukaFreeString()
+            return rotoTranslation if rotoTranslationStrings[key] != "" else None
+
+        for body in self.flukaRegistry.bodyDict.values():
+            transform = body.transform
 
-        # Close file (TODO use with)
-        # f.write("END\n")
-        f.close()
+            if type(transform) is RecursiveRotoTranslation:
+                rotoTranslation = activeRotoTranslation(transform)
+            elif type(transform) is Transform:
+                rotoTranslation = activeRotoTranslation(transform.rotoTranslation)
+            else:
+                continue
+
+            if rotoTranslation is None:
+                f.write(body.flukaFreeString() + "\n")
+            else:
+                rotdefi[rotoTranslation.name] = rotoTranslation
+                f.write(
+                    "$start_transform "
+                    + rotoTranslation.name
+                    + "\n"
+                    + body.flukaFreeString()
+                    + "\n$end_transform\n"
+                )
@@ -0,0 +1,381 @@
+"""
+Analytic axis-aligned bounding boxes of FLUKA bodies and zones.
+
+The world space extent of each body is computed in closed form from its
+parameters and transform, allowing for infinite extents.  The extent of a zone
+is then the interval intersection of its intersected bodies, which is exact when
+every intersected body is itself a box, or when a single non-box body is only
+cut along axes its cross-section does not vary along.  Anything that cannot be
+decided this way (nested zones, QUA, rotated infinite cylinders, zones whose
+subtractions may remove everything) is left for the caller to mesh.
+"""
+
+import math
+
+import numpy as np
+
+from . import body as _body
+from .vector import AABB
+
+_INF = float("inf")
+_TOLERANCE = 1e-9
+
+
+class BodyBounds:
+    """
+    World space extent of a body.
+
+    :param lower: lower corner, components may be -inf
+    :type lower: numpy.array
+    :param upper: upper corner, components may be +inf
+    :type upper: numpy.array
+    :param isBox: the body is exactly its own bounding box
+    :type isBox: bool
+    :param freeAxes: axes along which the cross-section of the body is constant
+    :type freeAxes: set
+    :param complement: bounds of the complement if it is also a box
+    :type complement: BodyBounds
+    """
+
+    def __init__(self, lower, upper, isBox=False, freeAxes=(), complement=None):
+        self.lower = np.array(lower, dtype=float)
+        self.upper = np.array(upper, dtype=float)
+        self.isBox = isBox
+        self.freeAxes = set(freeAxes)
+        self.complement = complement
+
+
+def _points(matrix, points):
+    points = np.array([(matrix @ [*p, 1])[:3] for p in points])
+    return points.min(axis=0), points.max(axis=0)
+
+
+def _point(matrix, point):
+    return (matrix @ [*point, 1])[:3]
+
+
+def _expansion(matrix):
+    return np.linalg.norm(matrix[:3, 0])
+
+
+def _axisOf(direction):
+    # index of the coordinate axis a unit vector is parallel to, otherwise None
+    direction = np.asarray(direction, dtype=float)
+    direction = direction / np.linalg.norm(direction)
+    axis = int(np.argmax(np.abs(direction)))
+    if math.isclose(abs(direction[axis]), 1.0, abs_tol=_TOLERANCE):
+        return axis
+    return None
+
+
+def _isAxisAligned(matrix):
+    # rotation part maps coordinate axes onto coordinate axes
+    return all(_axisOf(column) is not None for column in np.transpose(matrix))
+
+
+def _discExtent(centre, normal, radius):
+    # extent of a disc about centre perpendicular to normal
+    normal = normal / np.linalg.norm(normal)
+    extent = radius * np.sqrt(np.clip(1 - normal**2, 0, None))
+    return centre - extent, centre + extent
+
+
+def _boxBounds(matrix, vertex, edges):
+    corners = [
+        vertex + sum(e for e, on in zip(edges, flags) if on) for flags in np.ndindex(2, 2, 2)
+    ]
+    lower, upper = _points(matrix, corners)
+    return BodyBounds(lower, upper, isBox=_isAxisAligned(matrix[:3, :3] @ np.transpose(edges)))
+
+
+def _rppBounds(body, matrix):
+    edges = np.diag(body.upper - body.lower)
+    return _boxBounds(matrix, body.lower, list(edges))
+
+
+def _boxBodyBounds(body, matrix):
+    return _boxBounds(matrix, body.vertex, [body.edge1, body.edge2, body.edge3])
+
+
+def _wedgeBounds(body, matrix):
+    v, e1, e2, e3 = body.vertex, body.edge1, body.edge2, body.edge3
+    lower, upper = _points(matrix, [v, v + e1, v + e2, v + e3, v + e1 + e3, v + e2 + e3])
+    return BodyBounds(lower, upper)
+
+
+def _arbBounds(body, matrix):
+    lower, upper = _points(matrix, body.vertices)
+    return BodyBounds(lower, upper)
+
+
+def _sphBounds(body, matrix):
+    centre = _point(matrix, body.point)
+    radius = _expansion(matrix) * body.radius
+    return BodyBounds(centre - radius, centre + radius)
+
+
+def _ends(matrix, start, direction):
+    first = _point(matrix, start)
+    second = _point(matrix, start + direction)
+    return first, second, second - first
+
+
+def _rccBounds(body, matrix):
+    first, second, axis = _ends(matrix, body.face, body.direction)
+    radius = _expansion(matrix) * body.radius
+    lower1, upper1 = _discExtent(first, axis, radius)
+    lower2, upper2 = _discExtent(second, axis, radius)
+    freeAxis = _axisOf(axis)
+    return BodyBounds(
+        np.minimum(lower1, lower2),
+        np.maximum(upper1, upper2),
+        freeAxes=() if freeAxis is None else (freeAxis,),
+    )
+
+
+def _trcBounds(body, matrix):
+    first, second, axis = _ends(matrix, body.major_centre, body.direction)
+    expansion = _expansion(matrix)
+    lower1, upper1 = _discExtent(first, axis, expansion * body.major_radius)
+    lower2, upper2 = _discExtent(second, axis, expansion * body.minor_radius)
+    return BodyBounds(np.minimum(lower1, lower2), np.maximum(upper1, upper2))
+
+
+def _recBounds(body, matrix):
+    first, second, axis = _ends(matrix, body.face, body.direction)
+    semiminor = matrix[:3, :3] @ body.semiminor
+    semimajor = matrix[:3, :3] @ body.semimajor
+    extent = np.sqrt(semiminor**2 + semimajor**2)
+    freeAxis = _axisOf(axis)
+    return BodyBounds(
+        np.minimum(first, second) - extent,
+        np.maximum(first, second) + extent,
+        freeAxes=() if freeAxis is None else (freeAxis,),
+    )
+
+
+def _ellBounds(body, matrix):
+    centre = _point(matrix, 0.5 * (body.focus1 + body.focus2))
+    axis = matrix[:3, :3] @ (body.focus1 - body.focus2)
+    focalDistance = 0.5 * np.linalg.norm(axis)
+    axis = axis / np.linalg.norm(axis)
+    semimajor = 0.5 * _expansion(matrix) * body.length
+    semiminor = np.sqrt(max(semimajor**2 - focalDistance**2, 0))
+    extent = np.sqrt(semimajor**2 * axis**2 + semiminor**2 * (1 - axis**2))
+    return BodyBounds(centre - extent, centre + extent)
+
+
+def _halfSpacePlane(body):
+    # untransformed outward normal and a point of the plane
+    if isinstance(body, _body.XYP):
+        return [0, 0, 1], [0, 0, body.z]
+    elif isinstance(body, _body.XZP):
+        return [0, 1, 0], [0, body.y, 0]
+    elif isinstance(body, _body.YZP):
+        return [1, 0, 0], [body.x, 0, 0]
+    return body.normal, body.point
+
+
+def _halfSpaceBounds(body, matrix):
+    normal, point = _halfSpacePlane(body)
+    normal = matrix[:3, :3] @ normal
+    point = _point(matrix, point)
+    axis = _axisOf(normal)
+    if axis is None:
+        return BodyBounds([-_INF] * 3, [_INF] * 3)
+
+    # the normal points out of the body, the complement is the other side
+    lower = np.full(3, -_INF)
+    upper = np.full(3, _INF)
+    complementLower = lower.copy()
+    complementUpper = upper.copy()
+    if normal[axis] > 0:
+        upper[axis] = complementLower[axis] = point[axis]
+    else:
+        lower[axis] = complementUpper[axis] = point[axis]
+    complement = BodyBounds(complementLower, complementUpper, isBox=True)
+    return BodyBounds(lower, upper, isBox=True, complement=complement)
+
+
+def _infiniteCylinderBounds(centre, semiAxes, axis):
+    # centre and semi axes in the two bounded coordinates, infinite along axis
+    lower = np.full(3, -_INF)
+    upper = np.full(3, _INF)
+    others = [i for i in range(3) if i != axis]
+    for i, c, s in zip(others, centre, semiAxes):
+        lower[i] = c - s
+        upper[i] = c + s
+    return BodyBounds(lower, upper, freeAxes=(axis,))
+
+
+def _infiniteCylinderBodyBounds(body, matrix):
+    # the meshes of transformed infinite cylinders are not placed
+    # consistently with their transform, so these are left to be meshed
+    if not np.allclose(matrix, np.identity(4)):
+        return None
+
+    if isinstance(body, _body.XCC):
+        return _infiniteCylinderBounds([body.y, body.z], [body.radius] * 2, 0)
+    elif isinstance(body, _body.YCC):
+        return _infiniteCylinderBounds([body.x, body.z], [body.radius] * 2, 1)
+    elif isinstance(body, _body.ZCC):
+        return _infiniteCylinderBounds([body.x, body.y], [body.radius] * 2, 2)
+    elif isinstance(body, _body.XEC):
+        return _infiniteCylinderBounds([body.y, body.z], [body.ysemi, body.zsemi], 0)
+    elif isinstance(body, _body.YEC):
+        return _infiniteCylinderBounds([body.x, body.z], [body.xsemi, body.zsemi], 1)
+    elif isinstance(body, _body.ZEC):
+        return _infiniteCylinderBounds([body.x, body.y], [body.xsemi, body.ysemi], 2)
+
+
+_boundsFunctions = [
+    (_body.RPP, _rppBounds),
+    (_body.BOX, _boxBodyBounds),
+    (_body.SPH, _sphBounds),
+    (_body.RCC, _rccBounds),
+    (_body.REC, _recBounds),
+    (_body.TRC, _trcBounds),
+    (_body.ELL, _ellBounds),
+    (_body.WED, _wedgeBounds),
+    (_body.RAW, _wedgeBounds),
+    (_body.ARB, _arbBounds),
+    (_body._HalfSpaceMixin, _halfSpaceBounds),
+    (_body.XCC, _infiniteCylinderBodyBounds),
+    (_body.YCC, _infiniteCylinderBodyBounds),
+    (_body.ZCC, _infiniteCylinderBodyBounds),
+    (_body.XEC, _infiniteCylinderBodyBounds),
+    (_body.YEC, _infiniteCylinderBodyBounds),
+    (_body.ZEC, _infiniteCylinderBodyBounds),
+]
+
+
+def bodyBounds(body, translationScale=1.0):
+    """
+    Analytic world space extent of a body.
+
+    :param body: FLUKA body
+    :type body: BodyMixin
+    :param translationScale: factor applied to the translation of the body \
+    transform, for transforms in different length units to the body
+    :type translationScale: float
+    :returns: bounds, or None if the body is not supported (e.g. QUA)
+    :rtype: BodyBounds
+    """
+    for bodyType, function in _boundsFunctions:
+        if isinstance(body, bodyType):
+            matrix = np.array(body.transform.to4DMatrix(), dtype=float)
+            matrix[:3, 3] *= translationScale
+            return function(body, matrix)
+    return None
+
+
+def _isTight(lower, upper, nonBoxes):
+    # the intersection box is exactly the extent of the intersected bodies
+    if not nonBoxes:
+        return True
+    if len(nonBoxes) > 1:
+        return False
+    bounds = nonBoxes[0]
+    for i in range(3):
+        isCut = lower[i] > bounds.lower[i] + _TOLERANCE or upper[i] < bounds.upper[i] - _TOLERANCE
+        if isCut and i not in bounds.freeAxes:
+            return False
+    return True
+
+
+def _canEscape(lower, upper, subtractions):
+    # some face of the box is not reached by any of the subtractions, so
+    # points of the intersection on that face survive the subtractions
+    subtractions = [
+        s
+        for s in subtractions
+        if (s.lower < upper - _TOLERANCE).all() and (s.upper > lower + _TOLERANCE).all()
+    ]
+    for i in range(3):
+        if all(s.lower[i] > lower[i] + _TOLERANCE for s in subtractions):
+            return True
+        if all(s.upper[i] < upper[i] - _TOLERANCE for s in subtractions):
+            return True
+    return False
+
+
+def zoneAABB(zone):
+    """
+    Analytic bounding box of a zone.
+
+    The box is the extent of the intersected bodies and ignores any shrinkage
+    from subtractions, so it may be larger than the box of the zone mesh.
+
+    :param zone: zone to bound
+    :type zone: Zone
+    :returns: (decided, aabb) where aabb is None for a null zone.  If decided \
+    is False the zone must be meshed instead.
+    :rtype: tuple
+    """
+    lower = np.full(3, -_INF)
+    upper = np.full(3, _INF)
+    nonBoxes = []
+    subtractions = []
+
+    for boolean in zone.intersections:
+        if not isinstance(boolean.body, _body.BodyMixin):
+            return False, None
+        bounds = bodyBounds(boolean.body)
+        if bounds is None:
+            return False, None
+        lower = np.maximum(lower, bounds.lower)
+        upper = np.minimum(upper, bounds.upper)
+        if not bounds.isBox:
+            nonBoxes.append(bounds)
+
+    for boolean in zone.subtractions:
+        if not isinstance(boolean.body, _body.BodyMixin):
+            return False, None
+        bounds = bodyBounds(boolean.body)
+        if bounds is None:
+            return False, None
+        if bounds.complement is not None:
+            lower = np.maximum(lower, bounds.complement.lower)
+            upper = np.minimum(upper, bounds.complement.upper)
+        else:
+            subtractions.append(bounds)
+
+    if (lower >= upper - _TOLERANCE).any():
+        return True, None
+    if not (np.isfinite(lower).all() and np.isfinite(upper).all()):
+        return False, None
+    if not _isTight(lower, upper, nonBoxes):
+        return False, None
+    if subtractions and not _canEscape(lower, upper, subtractions):
+        return False, None
+
+    return True, AABB(lower, upper)
+
+
+def zoneBounds(zone, translationScale=1.0):
+    """
+    Conservative world space bounds of a zone, the intersection of the
+    bounds of its intersected bodies and zones.  Subtractions are ignored
+    and unsupported bodies taken as unbounded.
+
+    :param zone: zone to bound
+    :type zone: Zone
+    :param translationScale: see bodyBounds
+    :type translationScale: float
+    :returns: (lower, upper), components may be infinite
+    :rtype: tuple
+    """
+    lower = np.full(3, -_INF)
+    upper = np.full(3, _INF)
+    for boolean in zone.intersections:
+        body = boolean.body
+        if isinstance(body, _body.BodyMixin):
+            bounds = bodyBounds(body, translationScale)
+            if bounds is None:
+                continue
+            bodyLower, bodyUpper = bounds.lower, bounds.upper
+        else:
+            bodyLower, bodyUpper = zoneBounds(body, translationScale)
+        lower = np.maximum(lower, bodyLower)
+        upper = np.minimum(upper, bodyUpper)
+    return lower, upper
@@ -49,7 +49,7 @@ if _config.meshing == _config.meshingType.pycsg:
     from pyg4ometry.pycsg.geom import Vector as _Vector
     from pyg4ometry.pycsg.geom import Vertex as _Vertex
     from pyg4ometry.pycsg.geom import Polygon as _Polygon
-elif _config.meshing == _config.meshingType.cgal_sm:
+elif _config.meshing in (_config.meshingType.cgal_sm, _config.meshingType.cgal_epick):
     from pyg4ometry.pycgal.core import CSG as _CSG
     from pyg4ometry.pycgal.geom import Vector as _Vector
     from pyg4ometry.pycgal.geom import Vertex as _Vertex
@@ -133,6 +133,23 @@ class BodyMixin(vis.ViewableMixin):
         mesh.translate(self.centre(aabb=aabb))
         return mesh
 
+    def key(self, decimals=10):
+        """
+        Exact identity of the body: its type, its parameters and its 4x4
+        transform, rounded to decimals. Bodies with equal keys are the same
+        body, unlike bodies with equal hashes.
+        """
+        parameters = np.round(np.asarray(self._parameters(), dtype=float), decimals)
+        transform = np.round(self.transform.to4DMatrix(), decimals)
+        return (
+            type(self).__name__,
+            tuple(parameters.tolist()),
+            tuple(transform.ravel().tolist()),
+        )
+
+    def hash(self):
+        return hash(self.key())
+
 
 class _HalfSpaceMixin(BodyMixin):
     # Base class for XYP, XZP, YZP.
@@ -320,20 +337,14 @@ class RPP(BodyMixin):
             str(self.upper[2]),
         )
 
-    def hash(self):
+    def _parameters(self):
         return (
-            hash(
-                (
-                    "RPP",
-                    self.lower[0],
-                    self.lower[1],
-                    self.lower[2],
-                    self.upper[0],
-                    self.upper[1],
-                    self.upper[2],
-                )
-            )
-            ^ self.transform.hash()
+            self.lower[0],
+            self.lower[1],
+            self.lower[2],
+            self.upper[0],
+            self.upper[1],
+            self.upper[2],
         )
 
 
@@ -441,26 +452,20 @@ class BOX(BodyMixin):
             _iterablesToFreeString(self.edge2, self.edge3),
         )
 
-    def hash(self):
+    def _parameters(self):
         return (
-            hash(
-                (
-                    "BOX",
-                    self.vertex[0],
-                    self.vertex[1],
-                    self.vertex[2],
-                    self.edge1[0],
-                    self.edge1[1],
-                    self.edge1[2],
-                    self.edge2[0],
-                    self.edge2[1],
-                    self.edge2[2],
-                    self.edge3[0],
-                    self.edge3[1],
-                    self.edge3[2],
-                )
-            )
-            ^ self.transform.hash()
+            self.vertex[0],
+            self.vertex[1],
+            self.vertex[2],
+            self.edge1[0],
+            self.edge1[1],
+            self.edge1[2],
+            self.edge2[0],
+            self.edge2[1],
+            self.edge2[2],
+            self.edge3[0],
+            self.edge3[1],
+            self.edge3[2],
         )
 
 
@@ -516,11 +521,8 @@ class SPH(BodyMixin):
             self.name, _iterablesToFreeString(self.point), self.radius
         )
 
-    def hash(self):
-        return (
-            hash(("SPH", self.point[0], self.point[1], self.point[2], self.radius))
-            ^ self.transform.hash()
-        )
+    def _parameters(self):
+        return (self.point[0], self.point[1], self.point[2], self.radius)
 
 
 class RCC(BodyMixin):
@@ -613,21 +615,15 @@ class RCC(BodyMixin):
             str(self.radius),
         )
 
-    def hash(self):
+    def _parameters(self):
         return (
-            hash(
-                (
-                    "RCC",
-                    self.face[0],
-                    self.face[1],
-                    self.face[2],
-                    self.direction[0],
-                    self.direction[1],
-                    self.direction[2],
-                    self.radius,
-                )
-            )
-            ^ self.transform.hash()
+            self.face[0],
+            self.face[1],
+            self.face[2],
+            self.direction[0],
+            self.direction[1],
+            self.direction[2],
+            self.radius,
         )
 
 
@@ -739,23 +735,17 @@ class REC(BodyMixin):
             _iterablesToFreeString(self.face, self.direction, self.semiminor, self.semimajor),
         )
 
-    def hash(self):
+    def _parameters(self):
         return (
-            hash(
-                (
-                    "REC",
-                    self.direction[0],
-                    self.direction[1],
-                    self.direction[2],
-                    self.semiminor[0],
-                    self.semiminor[1],
-                    self.semiminor[2],
-                    self.semimajor[0],
-                    self.semimajor[1],
-                    self.semimajor[2],
-                )
-            )
-            ^ self.transform.hash()
+            self.direction[0],
+            self.direction[1],
+            self.direction[2],
+            self.semiminor[0],
+            self.semiminor[1],
+            self.semiminor[2],
+            self.semimajor[0],
+            self.semimajor[1],
+            self.semimajor[2],
         )
 
 
@@ -860,22 +850,16 @@ class TRC(BodyMixin):
             self.minor_radius,
         )
 
-    def hash(self):
+    def _parameters(self):
         return (
-            hash(
-                (
-                    "RPP",
-                    self.major_centre[0],
-                    self.major_centre[1],
-                    self.major_centre[2],
-                    self.direction[0],
-                    self.direction[1],
-                    self.direction[2],
-                    self.minor_radius,
-                    self.major_radius,
-                )
-            )
-            ^ self.transform.hash()
+            self.major_centre[0],
+            self.major_centre[1],
+            self.major_centre[2],
+            self.direction[0],
+            self.direction[1],
+            self.direction[2],
+            self.minor_radius,
+            self.major_radius,
         )
 
 
@@ -985,21 +969,15 @@ class ELL(BodyMixin):
             self.name, _iterablesToFreeString(self.focus1, self.focus2), self.length
         )
 
-    def hash(self):
+    def _parameters(self):
         return (
-            hash(
-                (
-                    "ELL",
-                    self.focus1[0],
-                    self.focus1[1],
-                    self.focus1[2],
-                    self.focus2[0],
-                    self.focus2[1],
-                    self.focus2[2],
-                    self.length,
-                )
-            )
-            ^ self.transform.hash()
+            self.focus1[0],
+            self.focus1[1],
+            self.focus1[2],
+            self.focus2[0],
+            self.focus2[1],
+            self.focus2[2],
+            self.length,
         )
 
 
@@ -1106,26 +1084,20 @@ class _WED_RAW(BodyMixin):
             _iterablesToFreeString(self.vertex, self.edge1, self.edge2, self.edge3),
         )
 
-    def hash(self):
+    def _parameters(self):
         return (
-            hash(
-                (
-                    "WED",
-                    self.vertex[0],
-                    self.vertex[1],
-                    self.vertex[2],
-                    self.edge1[0],
-                    self.edge1[1],
-                    self.edge1[2],
-                    self.edge2[0],
-                    self.edge2[1],
-                    self.edge2[2],
-                    self.edge3[0],
-                    self.edge3[1],
-                    self.edge3[2],
-                )
-            )
-            ^ self.transform.hash()
+            self.vertex[0],
+            self.vertex[1],
+            self.vertex[2],
+            self.edge1[0],
+            self.edge1[1],
+            self.edge1[2],
+            self.edge2[0],
+            self.edge2[1],
+            self.edge2[2],
+            self.edge3[0],
+            self.edge3[1],
+            self.edge3[2],
         )
 
 
@@ -1380,13 +1352,8 @@ class ARB(BodyMixin):
             self.name, itfs(line1), itfs(line2), itfs(line3), itfs(line4), itfs(self.facenumbers)
         )
 
-    def hash(self):
-        # TODO check this is all that is required
-        h = hash("ARB")
-        for v in self.vertices:
-            h ^= hash((v[0], v[1], v[2]))
-
-        h ^= self.transform.hash()
+    def _parameters(self):
+        return (*chain.from_iterable(self.vertices), *self.facenumbers)
 
 
 class XYP(_HalfSpaceMixin):
@@ -1422,8 +1389,8 @@ class XYP(_HalfSpaceMixin):
             prefix = "* " + self.comment + "\n"
         return prefix + self._halfspaceFreeStringHelper(self.z)
 
-    def hash(self):
-        return hash(("ZXP", self.z)) ^ self.transform.hash()
+    def _parameters(self):
+        return (self.z,)
 
     def toPlane(self):
         return self._toPlaneHelper([0, 0, 1], [0, 0, self.z])
@@ -1462,8 +1429,8 @@ class XZP(_HalfSpaceMixin):
             prefix = "* " + self.comment + "\n"
         return prefix + self._halfspaceFreeStringHelper(self.y)
 
-    def hash(self):
-        return hash(("XZP", self.y)) ^ self.transform.hash()
+    def _parameters(self):
+        return (self.y,)
 
     def toPlane(self):
         return self._toPlaneHelper([0, 1, 0], [0, self.y, 0])
@@ -1503,8 +1470,8 @@ class YZP(_HalfSpaceMixin):
             prefix = "* " + self.comment + "\n"
         return prefix + self._halfspaceFreeStringHelper(self.x)
 
-    def hash(self):
-        return hash(("YZP", self.x)) ^ self.transform.hash()
+    def _parameters(self):
+        return (self.x,)
 
     def toPlane(self):
         return self._toPlaneHelper([1, 0, 0], [self.x, 0, 0])
@@ -1559,20 +1526,14 @@ class PLA(_HalfSpaceMixin):
             self.name, _iterablesToFreeString(self.normal, self.point)
         )
 
-    def hash(self):
+    def _parameters(self):
         return (
-            hash(
-                (
-                    "PLA",
-                    self.normal[0],
-                    self.normal[1],
-                    self.normal[2],
-                    self.point[0],
-                    self.point[1],
-                    self.point[2],
-                )
-            )
-            ^ self.transform.hash()
+            self.normal[0],
+            self.normal[1],
+            self.normal[2],
+            self.point[0],
+            self.point[1],
+            self.point[2],
         )
 
     def toPlane(self):
@@ -1633,8 +1594,8 @@ class XCC(_InfiniteCylinderMixin, _ShiftableCylinderMixin):
             prefix = "* " + self.comment + "\n"
         return prefix + self._infCylinderFreestringHelper(self.y, self.z, self.radius)
 
-    def hash(self):
-        return hash(("XCC", self.y, self.z, self.radius)) ^ self.transform.hash()
+    def _parameters(self):
+        return (self.y, self.z, self.radius)
 
     def point(self):
         return self.transform.leftMultiplyRotation([0, self.y, self.z])
@@ -1698,8 +1659,8 @@ class YCC(_InfiniteCylinderMixin, _ShiftableCylinderMixin):
             prefix = "* " + self.comment + "\n"
         return prefix + self._infCylinderFreestringHelper(self.z, self.x, self.radius)
 
-    def hash(self):
-        return hash(("YCC", self.z, self.x, self.radius)) ^ self.transform.hash()
+    def _parameters(self):
+        return (self.z, self.x, self.radius)
 
     def point(self):
         return self.transform.leftMultiplyVector([self.x, 0, self.z])
@@ -1763,8 +1724,8 @@ class ZCC(_InfiniteCylinderMixin, _ShiftableCylinderMixin):
             prefix = "* " + self.comment + "\n"
         return prefix + self._infCylinderFreestringHelper(self.x, self.y, self.radius)
 
-    def hash(self):
-        return hash(("ZCC", self.x, self.y, self.radius)) ^ self.transform.hash()
+    def _parameters(self):
+        return (self.x, self.y, self.radius)
 
     def point(self):
         return self.transform.leftMultiplyVector([self.x, self.y, 0])
@@ -1847,8 +1808,8 @@ class XEC(BodyMixin, _ShiftableCylinderMixin):
             prefix = "* " + self.comment + "\n"
         return prefix + f"XEC {self.name} {self.y} {self.z} {self.ysemi} {self.zsemi}"
 
-    def hash(self):
-        return hash(("XEC", self.y, self.z, self.ysemi, self.zsemi)) ^ self.transform.hash()
+    def _parameters(self):
+        return (self.y, self.z, self.ysemi, self.zsemi)
 
 
 class YEC(BodyMixin, _ShiftableCylinderMixin):
@@ -1924,8 +1885,8 @@ class YEC(BodyMixin, _ShiftableCylinderMixin):
             prefix = "* " + self.comment + "\n"
         return prefix + f"YEC {self.name} {self.z} {self.x} {self.zsemi} {self.xsemi}"
 
-    def hash(self):
-        return hash(("YEC", self.x, self.z, self.xsemi, self.zsemi)) ^ self.transform.hash()
+    def _parameters(self):
+        return (self.x, self.z, self.xsemi, self.zsemi)
 
 
 class ZEC(BodyMixin, _ShiftableCylinderMixin):
@@ -2001,8 +1962,8 @@ class ZEC(BodyMixin, _ShiftableCylinderMixin):
             prefix = "* " + self.comment + "\n"
         return prefix + f"ZEC {self.name} {self.x} {self.y} {self.xsemi} {self.ysemi}"
 
-    def hash(self):
-        return hash(("ZEC", self.x, self.y, self.xsemi, self.ysemi)) ^ self.transform.hash()
+    def _parameters(self):
+        return (self.x, self.y, self.xsemi, self.ysemi)
 
 
 class QUA(BodyMixin):
@@ -2273,24 +2234,18 @@ class QUA(BodyMixin):
             ),
         )
 
-    def hash(self):
+    def _parameters(self):
         return (
-            hash(
-                (
-                    "QUA",
-                    self.cxx,
-                    self.cyy,
-                    self.czz,
-                    self.cxy,
-                    self.cxz,
-                    self.cyz,
-                    self.cx,
-                    self.cy,
-                    self.cz,
-                    self.c,
-                )
-            )
-            ^ self.transform.hash()
+            self.cxx,
+            self.cyy,
+            self.czz,
+            self.cxy,
+            self.cxz,
+            self.cyz,
+            self.cx,
+            self.cy,
+            self.cz,
+            self.c,
         )
 
 
@@ -9,6 +9,8 @@ from . import region as _region
 from . import reader as _reader
 from .RegionExpression import RegionParserVisitor, RegionParser, RegionLexer
 from . import fluka_registry
+from pyg4ometry.exceptions import FLUKAError
+import pyg4ometry.config as _config
 
 
 def expressionToZone(zone, zoneExpr):
@@ -32,24 +34,154 @@ def expressionToZone(zone, zoneExpr):
     return freg.regionDict["dummy"].zones[0]
 
 
-def zoneToDNFZones(zone):
-    dnf = _sympy.to_dnf(zoneToAlgebraicExpression(zone))
-    zones = []
-    if isinstance(dnf, _sympy.And):
-        zones.append(expressionToZone(zone, dnf))
-        return zones
-
-    assert isinstance(dnf, _sympy.Or)
-
-    for arg in dnf.args:
-        # print("original",arg)
-        # arg = _sympy.simplify_logic(arg)  # trivially solve a & ~a, etc..
-        # print("simplified",arg)
-        if not arg:
-            continue
-        zones.append(expressionToZone(zone, arg))
+class _Literals:
+    """
+    Numbering of the bodies of a zone by name.  A DNF term is a pair of
+    integers (positive, negative) with bit i set if body i is intersected
+    or subtracted respectively.
+    """
+
+    def __init__(self):
+        self.indices = {}
+        self.bodies = []
+
+    def bit(self, body):
+        try:
+            index = self.indices[body.name]
+        except KeyError:
+            index = len(self.bodies)
+            self.indices[body.name] = index
+            self.bodies.append(body)
+        return 1 << index
+
+
+def _isSubsumed(term, other):
+    # other has a subset of the literals of term, so term is redundant
+    return (other[0] & ~term[0]) == 0 and (other[1] & ~term[1]) == 0
+
+
+def _nLiterals(term):
+    return bin(term[0]).count("1") + bin(term[1]).count("1")
+
+
+def _subterms(term):
+    # the terms made of a proper subset of the literals of term
+    literals = _termLiterals(*term)
+    for mask in range((1 << len(literals)) - 1):
+        positive = negative = 0
+        for index, (literalPositive, literalNegative) in enumerate(literals):
+            if mask >> index & 1:
+                positive |= literalPositive
+                negative |= literalNegative
+        yield positive, negative
+
+
+def _absorb(terms):
+    # remove duplicates and terms implied by a term with fewer literals,
+    # keeping the order of the remaining terms.  Terms are bucketed by their
+    # number of literals, so a term is only checked against the kept terms
+    # with fewer literals, or against its subterms when there are fewer of them
+    terms = list(dict.fromkeys(terms))
+    buckets = {}
+    for term in terms:
+        buckets.setdefault(_nLiterals(term), []).append(term)
+
+    kept = set()
+    for count in sorted(buckets):
+        smaller = list(kept)
+        bucketKept = []
+        for term in buckets[count]:
+            if len(smaller) > 1 << count:
+                redundant = any(sub in kept for sub in _subterms(term))
+            else:
+                redundant = any(_isSubsumed(term, other) for other in smaller)
+            if not redundant:
+                bucketKept.append(term)
+        kept.update(bucketKept)
+    return [term for term in terms if term in kept]
+
+
+def _product(terms, clause, limit):
+    # (t1 | t2 | ...) & (c1 | c2 | ...), dropping contradictions a & ~a.
+    # The distinct terms are counted against limit before absorption, so
+    # a large expansion fails fast instead of spending its time absorbing
+    result = {}
+    for positive, negative in terms:
+        for clausePositive, clauseNegative in clause:
+            termPositive = positive | clausePositive
+            termNegative = negative | clauseNegative
+            if termPositive & termNegative:
+                continue
+            result[(termPositive, termNegative)] = None
+            if len(result) > limit:
+                msg = f"Zone DNF exceeds {limit} terms (config.flukaDNFTermLimit)"
+                raise FLUKAError(msg)
+    return _absorb(result)
+
+
+def _zoneDNFTerms(zone, literals, limit):
+    terms = [(0, 0)]  # a single empty term is true
+    for boolean in zone.intersections:
+        body = boolean.body
+        if isinstance(body, _region.Zone):
+            terms = _product(terms, _zoneDNFTerms(body, literals, limit), limit)
+        else:
+            terms = _product(terms, [(literals.bit(body), 0)], limit)
 
-    return zones
+    for boolean in zone.subtractions:
+        body = boolean.body
+        if isinstance(body, _region.Zone):
+            # ~(t1 | t2 | ...) = ~t1 & ~t2 & ..., each ~t a clause of flipped literals
+            for positive, negative in _zoneDNFTerms(body, literals, limit):
+                clause = _termLiterals(negative, 0) + _termLiterals(0, positive)
+                terms = _product(terms, clause, limit)
+        else:
+            terms = _product(terms, [(0, literals.bit(body))], limit)
+
+    return terms
+
+
+def _termLiterals(positive, negative):
+    # split a term into single literal terms
+    literals = []
+    for mask, isPositive in ((positive, True), (negative, False)):
+        while mask:
+            bit = mask & -mask
+            literals.append((bit, 0) if isPositive else (0, bit))
+            mask ^= bit
+    return literals
+
+
+def _termToZone(term, literals):
+    positive, negative = term
+    zone = _region.Zone()
+    for index, body in enumerate(literals.bodies):
+        if positive >> index & 1:
+            zone.addIntersection(body)
+    for index, body in enumerate(literals.bodies):
+        if negative >> index & 1:
+            zone.addSubtraction(body)
+    return zone
+
+
+def zoneToDNFZones(zone, termLimit=None):
+    """
+    Convert a zone to a list of zones in disjunctive normal form (with
+    no nested zones), the union of which is equivalent to the zone.
+    Contradictory (a & ~a) and subsumed terms are dropped.  Bodies are
+    identified by name.
+
+    :param zone: zone to convert
+    :type zone: Zone
+    :param termLimit: maximum number of terms of any intermediate product, \
+    before absorption, by default config.flukaDNFTermLimit
+    :type termLimit: int
+    """
+    if termLimit is None:
+        termLimit = _config.flukaDNFTermLimit
+    literals = _Literals()
+    terms = _zoneDNFTerms(zone, literals, termLimit)
+    return [_termToZone(term, literals) for term in terms]
 
 
 def regionToAlgebraicExpression(region):  # region or zone
@@ -1,11 +1,13 @@
 import sys as _sys
+import copy as _copy
 from collections import OrderedDict as _OrderedDict
 from collections.abc import MutableMapping as _MutableMapping
 
+import bisect as _bisect
+import itertools as _itertools
 from itertools import count as _count
 
 import numpy as _np
-import pandas as _pd
 import pyg4ometry.geant4 as _g4
 from .region import Region as _Region
 from .region import bracket_depth as _bracket_depth
@@ -112,6 +114,29 @@ class FlukaRegistry:
     def getBodyToRegionsMap(self):
         return self._bodiesAndRegions
 
+    def derive(self):
+        """
+        Make an empty registry (no bodies or regions) sharing the materials,
+        lattices and material assignments of this registry.  The dictionaries
+        are copied but not their contents, so deriving is cheap and entries
+        can be added to or removed from the derived registry without changing
+        this one.  Shared objects are replaced rather than modified.
+        """
+        out = _copy.copy(self)
+        out.bodyDict = FlukaBodyStoreExact()
+        out.rotoTranslations = RotoTranslationStore()
+        out.regionDict = _OrderedDict()
+        out.mgnFieldDict = _OrderedDict()
+        out.cardDict = _OrderedDict()
+        out._bodiesAndRegions = {}
+        out.PhysVolToRegionMap = {}
+
+        out.materials = _OrderedDict(self.materials)
+        out.materialShortName = _OrderedDict(self.materialShortName)
+        out.latticeDict = _OrderedDict(self.latticeDict)
+        out.assignmas = _OrderedDict(self.assignmas)
+        return out
+
     def printDefinitions(self):
         print(f"bodyDict = {self.bodyDict}")
         print(f"regionDict = {self.regionDict}")
@@ -628,10 +653,15 @@ class RotoTranslationStore(_MutableMapping):
 
 
 class FlukaBodyStore(_MutableMapping):
+    """
+    Bodies by name which also finds degenerate bodies, i.e. half spaces and infinite
+    cylinders that are the same (within numpy.isclose) as a body already stored.
+    """
+
     def __init__(self):
-        self._df = _pd.DataFrame()
-        hscacher = HalfSpaceCacher(self._df)
-        infCylCacher = InfiniteCylinderCacher(self._df)
+        self._nameBody = {}
+        hscacher = HalfSpaceCacher(self._nameBody)
+        infCylCacher = InfiniteCylinderCacher(self._nameBody)
 
         self._cachers = {
             _body.XZP: hscacher,
@@ -642,13 +672,13 @@ class FlukaBodyStore(_MutableMapping):
             _body.YCC: infCylCacher,
             _body.ZCC: infCylCacher,
         }
-        self._basecacher = BaseCacher(self._df)
+        self._basecacher = BaseCacher(self._nameBody)
 
     def _bodyNames(self):
-        return list(self._df["name"])
+        return list(self._nameBody.keys())
 
     def _bodies(self):
-        return list(self._df["body"])
+        return list(self._nameBody.values())
 
     def _getCacherFromBody(self, body):
         return self._cachers.get(type(body), self._basecacher)
@@ -677,13 +707,14 @@ class FlukaBodyStore(_MutableMapping):
         c.setBody(value)
 
     def __getitem__(self, key):
-        if key not in self._bodyNames():
+        try:
+            return self._nameBody[key]
+        except KeyError:
             msg = f"Undefined body: {key}"
             raise _FLUKAError(msg)
-        return self._df[self._df["name"] == key]["body"].item()
 
     def __delitem__(self, key):
-        if key not in self._bodyNames():
+        if key not in self._nameBody:
             msg = f"Missing body name: {key}"
             raise KeyError(msg)
 
@@ -691,55 +722,117 @@ class FlukaBodyStore(_MutableMapping):
         self._getCacherFromBody(body).remove(key)
 
     def __len__(self):
-        return len(self._df)
+        return len(self._nameBody)
 
     def __contains__(self, key):
-        return key in self._bodyNames()
+        return key in self._nameBody
 
     def __iter__(self):
-        return iter(self._bodyNames())
+        return iter(self._nameBody)
 
     def __repr__(self):
-        return repr(dict(zip(self._bodyNames(), self._bodies())))
+        return repr(self._nameBody)
 
 
-class BaseCacher:
-    COLUMNS = ["name", "body"]
+class _ToleranceIndex:
+    """
+    Index of bodies by a direction and a vector of values for finding those within
+    numpy.isclose tolerance of a query. Directions are hashed on a grid of
+    _directionQuantum, so a query looks in the neighbouring cells as well. Within a cell
+    the bodies are sorted by a fixed linear projection of the values, so only bodies
+    with a projection within the tolerance are compared.
+    """
 
-    def __init__(self, df):
-        self.df = df
-        for column in self.COLUMNS:
-            try:
-                self.df.insert(len(self.df), column, [])
-            except ValueError:  # already added the column maybe
-                pass
+    _directionQuantum = 1e-3
+    _weights = _np.array([1.0, _np.sqrt(2) / 2, _np.sqrt(3) / 3, _np.sqrt(5) / 5])
+    _neighbours = list(_itertools.product((-1, 0, 1), repeat=3))
 
-    def appendData(self, variables):
-        df = _pd.DataFrame([variables], columns=self.COLUMNS)
-        self.df.loc[len(self.df.index)] = df.iloc[0]
+    # default numpy.isclose tolerances
+    _rtol = 1e-5
+    _atol = 1e-8
+
+    def __init__(self):
+        self._cells = {}  # direction key -> ([projection, ...], [name, ...]) by projection
+        self._entries = {}  # name -> (key, projection, direction, values, order)
+        self._counter = _count()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _key(self, direction):
+        return tuple(int(_np.floor(c / self._directionQuantum)) for c in direction)
+
+    def _projection(self, values):
+        return float(_np.dot(self._weights[: len(values)], values))
+
+    def add(self, name, direction, values):
+        direction = _np.array(direction, dtype=float)
+        values = _np.array(values, dtype=float)
+        key = self._key(direction)
+        projection = self._projection(values)
+
+        projections, names = self._cells.setdefault(key, ([], []))
+        i = _bisect.bisect_right(projections, projection)
+        projections.insert(i, projection)
+        names.insert(i, name)
+        self._entries[name] = (key, projection, direction, values, next(self._counter))
+
+    def remove(self, name):
+        key, projection, _, _, _ = self._entries.pop(name)
+        projections, names = self._cells[key]
+        i = _bisect.bisect_left(projections, projection)
+        while names[i] != name:
+            i += 1
+        del projections[i]
+        del names[i]
+
+    def candidates(self, directions, values):
+        """
+        (name, direction, values) of the bodies that may be within tolerance of one of
+        the directions and the values, in the order they were added.
+        """
+        values = _np.array(values, dtype=float)
+        projection = self._projection(values)
+        # |stored - query| <= atol + rtol * |query| for each value bounds the projection
+        weights = self._weights[: len(values)]
+        tolerance = float(_np.dot(weights, self._atol + self._rtol * _np.abs(values)))
+        tolerance = tolerance * (1 + 1e-9) + 1e-12 * (1 + abs(projection))
+
+        found = {}
+        for direction in directions:
+            key = self._key(direction)
+            for offset in self._neighbours:
+                cell = self._cells.get(tuple(k + o for k, o in zip(key, offset)))
+                if cell is None:
+                    continue
+                projections, names = cell
+                low = _bisect.bisect_left(projections, projection - tolerance)
+                high = _bisect.bisect_right(projections, projection + tolerance)
+                for name in names[low:high]:
+                    found[name] = self._entries[name]
+
+        for name, entry in sorted(found.items(), key=lambda item: item[1][4]):
+            yield name, entry[2], entry[3]
+
+
+class BaseCacher:
+    def __init__(self, nameBody):
+        self.nameBody = nameBody
 
     def append(self, body):
-        name = body.name
-        df = _pd.DataFrame([[name, body]], columns=self.COLUMNS)
-        self.df.loc[len(self.df.index)] = df.iloc[0]
+        self.nameBody[body.name] = body
 
     def setBody(self, body):
-        name = body.name
-        if name not in self.df["name"]:
-            self.append(body)
-        else:
-            rowIndex = self.df[self.df["name"] == name].index
+        if body.name in self.nameBody:
             msg = "operation not implemented"
             raise NotImplementedError(msg)
+        self.append(body)
 
     def addBody(self, body):
-        name = body.name
-        df = _pd.DataFrame([[name, body]], columns=self.COLUMNS)
-        self.df.loc[len(self.df.index)] = df.iloc[0]
+        self.append(body)
 
     def remove(self, key):
-        rowIndex = self.df[self.df["name"] == key].index
-        self.df.drop(rowIndex, inplace=True)
+        del self.nameBody[key]
 
     def make(self, clas, *args, **kwargs):
         body = clas(*args, **kwargs)
@@ -754,53 +847,60 @@ class BaseCacher:
 
 
 class Cacheable(BaseCacher):
+    def __init__(self, nameBody):
+        super().__init__(nameBody)
+        self.index = _ToleranceIndex()
+
+    def append(self, body):
+        if body.name in self.nameBody:
+            self.remove(body.name)
+        super().append(body)
+        direction, values = self.features(body)
+        self.index.add(body.name, direction, values)
+
+    def remove(self, key):
+        super().remove(key)
+        self.index.remove(key)
+
     def getDegenerateBody(self, body):
-        mask = self.mask(body)
-        if not mask.any():  # i.e. this half space has not been defined before.
-            self.append(body)
-            return body
-        result = self.df[mask]["body"].item()
-        return result  # self.df[mask]["body"].item()
-
-    def getMask(self, columns, values, predicates):
-        if self.df.empty:
-            return _np.array([], dtype=bool)
-        mask = _np.full_like(self.df["name"], True, dtype=bool)
-        for column, value, predicate in zip(columns, values, predicates):
-            mask &= self.df[column].apply(
-                lambda x, value=value, predicate=predicate: predicate(x, _np.array(value)).all()
-            )
-        return mask
+        direction, values = self.features(body)
+        for name, storedDirection, storedValues in self.index.candidates(
+            self.directions(direction), values
+        ):
+            if self.matches(storedDirection, storedValues, direction, values):
+                return self.nameBody[name]
+
+        # i.e. this body has not been defined before.
+        self.append(body)
+        return body
 
+    def directions(self, direction):
+        return [direction]
 
-class HalfSpaceCacher(Cacheable):
-    COLUMNS = ["name", "body", "planeNormal", "pointOnPlane"]
 
-    def append(self, body):
-        name = body.name
+class HalfSpaceCacher(Cacheable):
+    def features(self, body):
         normal, point = body.toPlane()
-        super().appendData([name, body, _np.array(normal), _np.array(point)])
+        return normal, point
 
-    def mask(self, body):
-        normal, point = body.toPlane()
-        return self.getMask(
-            ["planeNormal", "pointOnPlane"], [normal, point], [_np.isclose, _np.isclose]
-        )
+    def matches(self, normal1, point1, normal2, point2):
+        return _np.isclose(normal1, normal2).all() and _np.isclose(point1, point2).all()
 
 
 class InfiniteCylinderCacher(Cacheable):
-    COLUMNS = ["name", "body", "direction", "pointOnLine", "radius"]
-
-    def append(self, body):
-        super().appendData(
-            [body.name, body, body.direction(), self._cylinderPoint(body), body.radius]
-        )
-
-    def mask(self, body):
-        return self.getMask(
-            ["direction", "pointOnLine", "radius"],
-            [body.direction(), self._cylinderPoint(body), body.radius],
-            [_vector.areParallelOrAntiParallel, _np.isclose, _np.isclose],
+    def features(self, body):
+        direction = _np.array(body.direction(), dtype=float)
+        direction = direction / _np.linalg.norm(direction)
+        return direction, [*self._cylinderPoint(body), body.radius]
+
+    def directions(self, direction):
+        return [direction, -_np.asarray(direction)]
+
+    def matches(self, direction1, values1, direction2, values2):
+        return (
+            _vector.areParallelOrAntiParallel(direction1, direction2)
+            and _np.isclose(values1[:3], values2[:3]).all()
+            and _np.isclose(values1[3], values2[3])
         )
 
     @staticmethod
@@ -811,8 +911,11 @@ class InfiniteCylinderCacher(Cacheable):
 class FlukaBodyStoreExact:
     def __init__(self):
         self.nameBody = {}
+        # keyed by body.key(), i.e. by type, parameters and transform
         self.hashBody = {}
         self.hashName = {}
+        # all the bodies with each key, the first is in hashBody
+        self._keyBodies = {}
 
     def _bodyNames(self):
         return list(self.nameBody.keys())
@@ -822,11 +925,28 @@ class FlukaBodyStoreExact:
 
     def make(self, cls, *args, **kwargs):
         body = cls(*args, **kwargs)
+        existing = self.identicalBody(body)
+        if existing is not None:
+            # constructing with flukaregistry has already added the duplicate
+            if self.nameBody.get(body.name) is body:
+                del self[body.name]
+            return existing
         return self.getDegenerateBody(body)
 
+    def identicalBody(self, body):
+        """
+        Body already in the store identical to body (same type, parameters
+        and transform), other than body itself. None if there is none.
+        """
+        existing = self.hashBody.get(body.key())
+        if existing is None or existing is body or existing.key() != body.key():
+            return None
+        return existing
+
     def getDegenerateBody(self, body):
-        if body.hash() in self.hashBody:
-            return self.hashBody[body.hash()]
+        key = body.key()
+        if key in self.hashBody:
+            return self.hashBody[key]
         else:
             self.addBody(body)
             return body
@@ -836,9 +956,12 @@ class FlukaBodyStoreExact:
             raise _IdenticalNameError(body.name)
         logger.debug("%s", body)
 
+        # the first body with a key is kept as the one identical bodies resolve to
+        key = body.key()
         self.nameBody[body.name] = body
-        self.hashBody[body.hash()] = body
-        self.hashName[body.hash()] = body.name
+        self.hashBody.setdefault(key, body)
+        self.hashName.setdefault(key, body.name)
+        self._keyBodies.setdefault(key, []).append(body)
 
     def keys(self):
         return self._bodyNames()
@@ -853,26 +976,38 @@ class FlukaBodyStoreExact:
         # c.setBody(value)
 
     def __getitem__(self, key):
-        if key not in self._bodyNames():
+        if key not in self.nameBody:
             msg = f"Undefined body: {key}"
             raise _FLUKAError(msg)
         return self.nameBody[key]
 
     def __delitem__(self, key):
-        if key not in self._bodyNames():
+        if key not in self.nameBody:
             msg = f"Missing body name: {key}"
             raise KeyError(msg)
 
-        body = self[key]
         b = self.nameBody.pop(key)
-        self.hashBody.pop(b.hash())
-        self.hashName.pop(b.hash())
+        bodyKey = b.key()
+        bodies = [body for body in self._keyBodies.get(bodyKey, []) if body is not b]
+        if bodies:
+            self._keyBodies[bodyKey] = bodies
+        else:
+            self._keyBodies.pop(bodyKey, None)
+
+        if self.hashBody.get(bodyKey) is b:
+            if bodies:
+                # an identical body remains, it is now the one others resolve to
+                self.hashBody[bodyKey] = bodies[0]
+                self.hashName[bodyKey] = bodies[0].name
+            else:
+                self.hashBody.pop(bodyKey)
+                self.hashName.pop(bodyKey)
 
     def __len__(self):
         return len(self.nameBody)
 
     def __contains__(self, key):
-        return key in self._bodyNames()
+        return key in self.nameBody
 
     def __iter__(self):
         return iter(self._bodies())
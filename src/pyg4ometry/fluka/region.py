@@ -1,4 +1,3 @@
-import itertools
 import logging
 from copy import deepcopy
 from uuid import uuid4
@@ -11,20 +10,21 @@ import sympy as _sympy
 from . import vis
 from pyg4ometry.exceptions import FLUKAError, NullMeshError
 import pyg4ometry.geant4 as g4
+from pyg4ometry.meshutils import aabbCandidatePairs as _aabbCandidatePairs
+from pyg4ometry.geant4.solid.ArrayMesh import unionMeshes as _unionMeshes
 from pyg4ometry.transformation import matrix2tbxyz, tbxyz2matrix, reverse
 from pyg4ometry.fluka.body import BodyMixin
-from .vector import Three, AABB, areAABBsOverlapping
+from .vector import Three, AABB
 from . import boolean_algebra
+from . import analytic_aabb as _analytic_aabb
 from pyg4ometry.transformation import tbxyz2axisangle
 
 import pyg4ometry.config as _config
 
 if _config.meshing == _config.meshingType.pycsg:
     from pyg4ometry.pycsg.core import CSG, do_intersect
-elif _config.meshing == _config.meshingType.cgal_sm:
-    pass
-    # TODO reinstate intersecting meshes
-    # from pyg4ometry.pycgal.core import CSG, do_intersect, intersecting_meshes
+elif _config.meshing in (_config.meshingType.cgal_sm, _config.meshingType.cgal_epick):
+    from pyg4ometry.pycgal.core import do_intersect
 
 from textwrap import wrap as _wrap
 
@@ -254,6 +254,27 @@ class Zone(vis.ViewableMixin):
                 result = result.subtract(mesh)
         return result
 
+    def aabb(self, aabb=None, analytic=True):
+        """
+        Axis-aligned bounding box of this zone.  Where possible this is
+        computed analytically from the bodies, which may be slightly larger
+        than the box of the mesh as subtractions are not clipped away.
+        Otherwise the zone is meshed.  Raises ValueError for a null zone.
+
+        :param aabb: extent used to mesh infinite bodies
+        :type aabb: AABB
+        :param analytic: try the analytic bounding box before meshing
+        :type analytic: bool
+        """
+        if analytic:
+            decided, extent = _analytic_aabb.zoneAABB(self)
+            if decided:
+                if extent is None:
+                    msg = f"Null zone {self.name}"
+                    raise ValueError(msg)
+                return extent
+        return AABB.fromMesh(self.mesh(aabb=aabb))
+
     def geant4Solid(self, reg, aabb=None):
         """
         Translate this zone to a geant4solid, adding the
@@ -623,11 +644,8 @@ class Region(vis.ViewableMixin):
         return bodies
 
     def mesh(self, aabb=None):
-        result = self.zones[0].mesh(aabb=aabb)
-        for zone in self.zones[1:]:
-            mesh = zone.mesh(aabb=aabb)
-            result = result.union(mesh)
-        return result
+        meshes = [zone.mesh(aabb=aabb) for zone in self.zones]
+        return _unionMeshes(meshes, workers=_config.meshUnionWorkers)
 
     def geant4Solid(self, reg, aabb=None):
         """
@@ -690,18 +708,22 @@ class Region(vis.ViewableMixin):
             zone.allBodiesToRegistry(registry)
 
     def zoneGraph(self, zoneAABBs=None, aabb=None):
-        if _config.meshing == _config.meshingType.cgal_sm:
-            return self._zoneGraphPycgal()
-
+        """
+        Graph with a node for each zone and an edge between intersecting
+        zones.  Candidate pairs are found by sweep and prune of the zone
+        aabbs, each zone is meshed at most once, and pairs already
+        connected through other zones are not intersected (their edge is
+        still added, so the connected components are exact but the edges
+        are not necessarily all intersections).
+        """
         zones = self.zones
         n_zones = len(zones)
 
-        tried = []
         # Build undirected graph, and add nodes corresponding to each zone.
         graph = nx.Graph()
         graph.add_nodes_from(range(n_zones))
         if n_zones == 1:  # return here if there's only one zone.
-            return nx.connected_components(graph)
+            return graph
 
         # We allow the user to provide a list of zoneAABBs as an
         # optimisation, but if they have not been provided, then we
@@ -709,46 +731,54 @@ class Region(vis.ViewableMixin):
         if zoneAABBs is None:
             zoneAABBs = self.zoneAABBs(aabb=aabb)
 
-        # Loop over all combinations of zone numbers within this region
-        for i, j in itertools.product(range(n_zones), range(n_zones)):
-            # Trivially connected to self or tried this combination.
-            if i == j or {i, j} in tried:
-                continue
-            tried.append({i, j})
+        # null zones get an inverted box so they have no candidates
+        boxes = np.empty((n_zones, 2, 3))
+        for i, zoneAABB in enumerate(zoneAABBs):
+            if zoneAABB is None:
+                boxes[i] = [[1e99] * 3, [-1e99] * 3]
+            else:
+                boxes[i] = [zoneAABB.lower, zoneAABB.upper]
+        candidates = _aabbCandidatePairs(boxes, _config.overlapBoundingBoxTolerance)
 
-            # Check if the bounding boxes overlap.  Cheaper than intersecting.
-            if not areAABBsOverlapping(zoneAABBs[i], zoneAABBs[j]):
-                continue
+        # connected components found so far (union find)
+        parents = list(range(n_zones))
+
+        def root(i):
+            while parents[i] != i:
+                parents[i] = parents[parents[i]]
+                i = parents[i]
+            return i
+
+        meshes = {}
 
-            # Check if a path already exists.  Not sure how often this
-            # arises but should at least occasionally save some time.
-            if nx.has_path(graph, i, j):
+        def mesh(i):
+            if i not in meshes:
+                meshes[i] = zones[i].mesh(aabb=aabb)
+            return meshes[i]
+
+        for i, j in candidates:
+            rootI, rootJ = root(i), root(j)
+            # A path already exists, no need to intersect.
+            if rootI == rootJ:
                 graph.add_edge(i, j)
                 continue
 
             # Finally: we must do the intersection op.
             logger.debug("Region = %s, int zone %d with %d", self.name, i, j)
-            if do_intersect(zones[i].mesh(aabb=aabb), zones[j].mesh(aabb=aabb)):
+            if do_intersect(mesh(i), mesh(j)):
                 graph.add_edge(i, j)
+                parents[rootJ] = rootI
 
         return graph
 
-    def _zoneGraphPycgal(self):
-        meshes = [z.mesh() for z in self.zones]
-        intersections = intersecting_meshes(meshes)
-        graph = nx.Graph()
-        graph.add_nodes_from(range(len(self.zones)))
-        graph.add_edges_from(intersections)
-        return graph
-
     def connectedZones(self, zoneAABBs=None, aabb=None):
         return list(nx.connected_components(self.zoneGraph(zoneAABBs=zoneAABBs, aabb=aabb)))
 
-    def zoneAABBs(self, aabb=None):
+    def zoneAABBs(self, aabb=None, analytic=True):
         extents = []
         for zone in self.zones:
             try:
-                zoneExtent = AABB.fromMesh(zone.mesh(aabb=aabb))
+                zoneExtent = zone.aabb(aabb=aabb, analytic=analytic)
             except ValueError:
                 zoneExtent = None
             extents.append(zoneExtent)
@@ -792,8 +822,7 @@ class Region(vis.ViewableMixin):
             if zone.isDNF():
                 result.zones.append(zone)
             else:
-                # result.zones.extend(boolean_algebra.zoneToDNFZones(zone))
-                result.zones.extend(boolean_algebra.zoneToDNFZonesInremental(zone))
+                result.zones.extend(boolean_algebra.zoneToDNFZones(zone))
         return result
 
     def isDNF(self):
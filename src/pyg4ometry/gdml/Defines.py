@@ -23,20 +23,31 @@ class BasicExpression:
 
     def __init__(self, name, expressionString, registry):
         self.name = name
+        self.define = None  # owning define, told when the expression string changes
         self.expressionString = expressionString
         self.parseTree = None
         self.registry = registry
 
+    @property
+    def expressionString(self):
+        return self._expressionString
+
+    @expressionString.setter
+    def expressionString(self, expressionString):
+        self._expressionString = expressionString
+        if self.define is not None:
+            _defineChanged(self.define)
+
     def eval(self):
         expressionParser = self.registry.getExpressionParser()
-        self.parseTree = expressionParser.parse(self.expressionString)
-        value = expressionParser.evaluate(self.parseTree, self.registry.defineDict)
+        compiled = expressionParser.compile(self.expressionString)
+        value = compiled.evaluate(self.registry.defineDict)
         return value
 
     def variables(self, allDependents=False):
         expressionParser = self.registry.getExpressionParser()
-        self.parseTree = expressionParser.parse(self.expressionString)
-        variables = expressionParser.get_variables(self.parseTree)
+        compiled = expressionParser.compile(self.expressionString)
+        variables = list(compiled.variables)
         if allDependents:
             dependents = []
             for v in variables:
@@ -303,6 +314,43 @@ def operationReturnType(name, strExpr, v1, v2, type1, type2, reg):
         return v
 
 
+def _defineChanged(define):
+    """
+    Invalidate the cached value of a registered define and of every define depending on it.
+    """
+    registry = define.registry
+    if registry is not None and registry.defineDict.get(define.name) is define:
+        registry.invalidateDefine(define.name)
+
+
+def _cachedEval(define, evaluate):
+    """
+    Evaluate a define, using the value cache of the registry when the define is registered.
+    """
+    registry = define.registry
+    if registry is not None and registry.defineDict.get(define.name) is define:
+        return registry.getDefineValue(define, evaluate)
+    return evaluate()
+
+
+def _defineProperty(attribute):
+    """
+    Property for an attribute that the value of a define depends on (its expression(s) and
+    unit). Setting it invalidates the cached value of the define.
+    """
+
+    def getter(self):
+        return getattr(self, "_" + attribute)
+
+    def setter(self, value):
+        if isinstance(value, BasicExpression):
+            value.define = self
+        setattr(self, "_" + attribute, value)
+        _defineChanged(self)
+
+    return property(fget=getter, fset=setter)
+
+
 class DefineBase:
     """
     Common bits for a define. Must have a name and a registry. Adding
@@ -331,6 +379,8 @@ class ScalarBase(DefineBase):
     Base class for all scalars (Constants, Quantity, Variable and 'Expression')
     """
 
+    expression = _defineProperty("expression")
+
     def __init__(self, typeName, name="", registry=None):
         super().__init__(name, registry)
         self.expression = None
@@ -343,6 +393,7 @@ class ScalarBase(DefineBase):
         :param name: name of object
         :type name: str
         """
+        _defineChanged(self)
         super().setName(name)
         self.expression.name = f"expr_{name}"
 
@@ -366,13 +417,23 @@ class ScalarBase(DefineBase):
 
     def eval(self):
         """
-        Evaluate the expression
+        Evaluate the expression. The value of a define in a registry is cached there until
+        it or one of the defines it depends on changes.
 
         :return: numerical evaluation of Constant
         :rtype: float
         """
+        return _cachedEval(self, self._eval)
+
+    def _eval(self):
         return self.expression.eval()
 
+    def variables(self):
+        """
+        Names of the variables used directly by this define
+        """
+        return self.expression.variables()
+
     def __repr__(self):
         return self._typeName + f" : {self.name} = {self.expression!s}"
 
@@ -802,6 +863,8 @@ class Quantity(ScalarBase):
     :type addRegistry: bool
     """
 
+    unit = _defineProperty("unit")
+
     def __init__(self, name, value, unit, type, registry, addRegistry=True):
         super().__init__("Quantity", name, registry)
         self.unit = unit
@@ -818,7 +881,7 @@ class Quantity(ScalarBase):
             self.name, str(self.expression), self.unit, self.type
         )
 
-    def eval(self):
+    def _eval(self):
         # it is possible for a quantity not to have a unit and it uses the units of variables in the expression
         if self.unit:
             uval = _Units.unit(self.unit)
@@ -826,7 +889,7 @@ class Quantity(ScalarBase):
             uval = 1.0
 
         # evaluate quantity with units baked in
-        return super().eval() * uval
+        return super()._eval() * uval
 
 
 class Variable(ScalarBase):
@@ -879,6 +942,11 @@ class Expression(ScalarBase):
 
 
 class VectorBase:
+    x = _defineProperty("x")
+    y = _defineProperty("y")
+    z = _defineProperty("z")
+    unit = _defineProperty("unit")
+
     def __init__(self, typeName, name, registry):
         self._typeName = typeName
         self.name = name
@@ -976,6 +1044,7 @@ class VectorBase:
         :param name: name of object
         :type name: str
         """
+        _defineChanged(self)
         self.name = name
         self.x.registry = self.registry
         self.y.registry = self.registry
@@ -987,14 +1056,28 @@ class VectorBase:
 
     def eval(self):
         """
-        Evaluate vector
+        Evaluate vector. As for scalars the value of a vector in a registry is cached.
 
         :return: numerical evaluation of vector
         :rtype: list of floats
         """
+        return list(_cachedEval(self, self._eval))
+
+    def _eval(self):
         u = _Units.unit(self.unit)
         return [self.x.eval() * u, self.y.eval() * u, self.z.eval() * u]
 
+    def variables(self):
+        """
+        Names of the variables used directly by the components of this vector
+        """
+        result = []
+        for component in (self.x, self.y, self.z):
+            for v in component.variables():
+                if v not in result:
+                    result.append(v)
+        return result
+
     def nonzero(self):
         """
         Evaluate vector
@@ -0,0 +1,245 @@
+"""
+Fast path for GDML expressions. An expression string is tokenised and parsed once by a small
+recursive descent parser (following GdmlExpression.g4) into a python function, which is then
+evaluated directly against a define dictionary. Anything not understood here raises
+CompileError and the caller falls back to the ANTLR parser.
+"""
+
+import math
+import re
+import builtins
+
+import numpy
+
+from ..Units import units as _units
+
+
+class CompileError(Exception):
+    pass
+
+
+_tokenRegex = re.compile(
+    r"(?P<ws>[ \r\n\t]+)"
+    r"|(?P<number>(?:[0-9]+\.[0-9]+|[0-9]+\.|\.[0-9]+|[0-9]+)"
+    r"(?:[eE][+-]?(?:[0-9]+\.[0-9]+|[0-9]+\.|\.[0-9]+|[0-9]+))?)"
+    r"|(?P<name>[a-zA-Z_][a-zA-Z_0-9]*)"
+    r"|(?P<op>[-+*/^(),\[\]])"
+)
+
+_functionNames = [
+    "cos",
+    "sin",
+    "tan",
+    "acos",
+    "asin",
+    "atan",
+    "log",
+    "log10",
+    "sqrt",
+    "exp",
+    "pow",
+    "abs",
+    "min",
+    "max",
+]
+
+# tokens of the grammar that are not variables
+_keywords = set(_functionNames) | {"pi", "e", "i"}
+
+
+def _resolveFunction(functionName):
+    # same lookup order as GdmlExpressionEvalVisitor.visitFunc
+    for module in (builtins, math, numpy):
+        if hasattr(module, functionName):
+            return getattr(module, functionName)
+    msg = f"Function {functionName} not found in 'builtins', 'numpy' or 'math'"
+    raise CompileError(msg)
+
+
+def _variable(defines, name):
+    try:
+        return defines[name]
+    except KeyError:
+        try:
+            return _units[name]
+        except KeyError as err:
+            msg = f"<= Undefined variable : {name}"
+            if not err.args:
+                err.args = ("",)
+            err.args = (*err.args, msg)
+            raise
+
+
+def _matrixElement(matrix, *indices):
+    return matrix.values_asarray[tuple(indices)]
+
+
+def _tokenise(expression):
+    tokens = []
+    pos = 0
+    while pos < len(expression):
+        match = _tokenRegex.match(expression, pos)
+        if not match:
+            msg = f"Unexpected character {expression[pos]!r}"
+            raise CompileError(msg)
+        pos = match.end()
+        kind = match.lastgroup
+        if kind == "ws":
+            continue
+        text = match.group()
+        if kind == "name" and text in _keywords:
+            kind = "keyword"
+        tokens.append((kind, text))
+    return tokens
+
+
+class _Parser:
+    """
+    Recursive descent parser producing python source for an expression. The float
+    conversions match those made by GdmlExpressionEvalVisitor so results are identical.
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+        self.variables = []
+        self.functions = {}
+
+    def peek(self):
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return (None, None)
+
+    def next(self):
+        token = self.peek()
+        if token[0] is None:
+            msg = "Unexpected end of expression"
+            raise CompileError(msg)
+        self.pos += 1
+        return token
+
+    def expect(self, text):
+        token = self.next()
+        if token != ("op", text):
+            msg = f"Expected {text!r} got {token[1]!r}"
+            raise CompileError(msg)
+
+    def parse(self):
+        source = self.expression()
+        if self.pos != len(self.tokens):
+            msg = f"Unexpected trailing {self.peek()[1]!r}"
+            raise CompileError(msg)
+        return source
+
+    def expression(self):
+        source = self.multiplyingExpression()
+        while self.peek() in (("op", "+"), ("op", "-")):
+            op = self.next()[1]
+            source = f"({source} {op} {self.multiplyingExpression()})"
+        return source
+
+    def multiplyingExpression(self):
+        source = self.powExpression()
+        while self.peek() in (("op", "*"), ("op", "/")):
+            op = self.next()[1]
+            source = f"({source} {op} {self.powExpression()})"
+        return source
+
+    def powExpression(self):
+        source = self.signedAtom()
+        if self.peek() != ("op", "^"):
+            return source
+        # left associative, unlike python **
+        while self.peek() == ("op", "^"):
+            self.next()
+            source = f"({source} ** {self.signedAtom()})"
+        return f"float({source})"
+
+    def signedAtom(self):
+        kind, text = self.peek()
+        if (kind, text) == ("op", "+"):
+            self.next()
+            return self.signedAtom()
+        elif (kind, text) == ("op", "-"):
+            self.next()
+            return f"(-{self.signedAtom()})"
+        elif kind == "keyword" and text in _functionNames:
+            return self.func()
+        return self.atom()
+
+    def func(self):
+        functionName = self.next()[1]
+        key = f"_f_{functionName}"
+        self.functions[key] = _resolveFunction(functionName)
+        self.expect("(")
+        arguments = [self.expression()]
+        while self.peek() == ("op", ","):
+            self.next()
+            arguments.append(self.expression())
+        self.expect(")")
+        return f"float({key}({', '.join(arguments)}))"
+
+    def atom(self):
+        kind, text = self.next()
+        if kind == "number":
+            try:
+                value = float(text)
+            except ValueError:
+                msg = f"Invalid number {text!r}"
+                raise CompileError(msg)
+            if not math.isfinite(value):
+                return f"float({text!r})"
+            return repr(value)
+        elif kind == "keyword" and text == "pi":
+            return repr(math.pi)
+        elif kind == "keyword" and text == "e":
+            return repr(math.e)
+        elif kind == "name":
+            self.variables.append(text)
+            variable = f"_variable(_defines, {text!r})"
+            if self.peek() == ("op", "["):
+                self.next()
+                indices = [f"int({self.expression()}) - 1"]
+                while self.peek() == ("op", ","):
+                    self.next()
+                    indices.append(f"int({self.expression()}) - 1")
+                self.expect("]")
+                return f"float(_matrixElement({variable}, {', '.join(indices)}))"
+            return f"float({variable})"
+        elif (kind, text) == ("op", "("):
+            source = self.expression()
+            self.expect(")")
+            return source
+        msg = f"Unexpected {text!r}"
+        raise CompileError(msg)
+
+
+class CompiledExpression:
+    """
+    Expression compiled to a python function of the define dictionary.
+
+    :param expression: expression string
+    :type expression: str
+    """
+
+    def __init__(self, expression):
+        self.expression = expression
+        try:
+            parser = _Parser(_tokenise(expression))
+            source = parser.parse()
+            namespace = {
+                "__builtins__": {},
+                "float": float,
+                "int": int,
+                "_variable": _variable,
+                "_matrixElement": _matrixElement,
+            }
+            namespace.update(parser.functions)
+            # source is generated from the parsed expression, not the raw string
+            self.function = eval(f"lambda _defines: {source}", namespace)  # noqa: PGH001
+        except (RecursionError, SyntaxError, MemoryError) as err:
+            raise CompileError(str(err))
+        self.variables = parser.variables
+
+    def evaluate(self, define_dict):
+        return self.function(define_dict)
@@ -3,12 +3,14 @@ from antlr4 import *
 from .GdmlExpressionLexer import GdmlExpressionLexer
 from .GdmlExpressionParser import GdmlExpressionParser
 from .GdmlExpressionVisitor import GdmlExpressionVisitor
+from .GdmlExpressionCompiler import CompiledExpression, CompileError
 
 from ..Units import units as _units
 
 import math
 import numpy
 import builtins
+from collections import OrderedDict as _OrderedDict
 
 # from IPython import embed
 # import traceback
@@ -172,10 +174,56 @@ class GdmlExpressionEvalVisitor(GdmlExpressionVisitor):
                 return getattr(math, constant().getText())
 
 
+class ParsedExpression:
+    """
+    Expression parsed once by ANTLR. Used for expressions the compiled fast path
+    does not handle, with the same interface as CompiledExpression.
+    """
+
+    def __init__(self, expressionParser, expression):
+        self.expressionParser = expressionParser
+        self.expression = expression
+        self.parseTree = expressionParser.parse(expression)
+        self.variables = expressionParser.get_variables(self.parseTree)
+
+    def evaluate(self, define_dict):
+        return self.expressionParser.evaluate(self.parseTree, define_dict)
+
+
 class ExpressionParser:
+    """
+    Parses and evaluates GDML expression strings. Expressions are compiled once and kept in
+    a least recently used cache of at most cacheSize entries keyed by the expression string.
+    """
+
+    cacheSize = 100000
+
     def __init__(self):
         self.visitor = GdmlExpressionEvalVisitor()
         self.defines_dict = {}
+        self.compiled = _OrderedDict()
+
+    def compile(self, expression):
+        """
+        Return a compiled form of expression with an evaluate(define_dict) method and a
+        list of variables. The ANTLR parser is only used if the fast path fails.
+        """
+        try:
+            compiled = self.compiled[expression]
+            self.compiled.move_to_end(expression)
+            return compiled
+        except KeyError:
+            pass
+
+        try:
+            compiled = CompiledExpression(expression)
+        except CompileError:
+            compiled = ParsedExpression(self, expression)
+
+        self.compiled[expression] = compiled
+        if len(self.compiled) > self.cacheSize:
+            self.compiled.popitem(last=False)
+        return compiled
 
     def parse(self, expression):
         # Make a char stream out of the expression
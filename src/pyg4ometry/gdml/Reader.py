@@ -2,6 +2,7 @@ from collections import defaultdict as _defaultdict
 import re as _re
 from xml.dom import minidom as _minidom
 import xml.parsers.expat as _expat
+import xml.etree.ElementTree as _ElementTree
 from . import Defines as _defines
 import logging as _log
 import pyg4ometry.geant4 as _g4
@@ -13,6 +14,80 @@ def isComment(node):
     return not node.attributes
 
 
+class _Attribute:
+    def __init__(self, value):
+        self.value = value
+
+
+class _Attributes:
+    """
+    Attributes of an ElementTree element with the interface of a minidom NamedNodeMap.
+    """
+
+    def __init__(self, attrib):
+        self._attrib = attrib
+
+    def __getitem__(self, key):
+        return _Attribute(self._attrib[key])
+
+    def __contains__(self, key):
+        return key in self._attrib
+
+    def __len__(self):
+        return len(self._attrib)
+
+    def keys(self):
+        return list(self._attrib.keys())
+
+    def values(self):
+        return [_Attribute(v) for v in self._attrib.values()]
+
+
+class _TextNode:
+    nodeType = _minidom.Node.TEXT_NODE
+    ELEMENT_NODE = _minidom.Node.ELEMENT_NODE
+    TEXT_NODE = _minidom.Node.TEXT_NODE
+    attributes = None
+
+    def __init__(self, text):
+        self.nodeValue = text
+        self.data = text
+
+
+class _Node:
+    """
+    Minimal minidom style view of an ElementTree element so the same parse methods are
+    used by the streaming and the minidom readers. Text is whitespace normalised and
+    blank text is dropped, as the minidom reader does when preparing a file.
+    """
+
+    nodeType = _minidom.Node.ELEMENT_NODE
+    ELEMENT_NODE = _minidom.Node.ELEMENT_NODE
+    TEXT_NODE = _minidom.Node.TEXT_NODE
+
+    def __init__(self, element):
+        self._element = element
+        self.tagName = element.tag
+        self.attributes = _Attributes(element.attrib)
+
+    @staticmethod
+    def _text(text):
+        if text and not text.isspace():
+            return [_TextNode(" ".join(text.split()))]
+        return []
+
+    @property
+    def childNodes(self):
+        nodes = self._text(self._element.text)
+        for child in self._element:
+            nodes.append(_Node(child))
+            nodes.extend(self._text(child.tail))
+        return nodes
+
+    def getElementsByTagName(self, tagName):
+        return [_Node(e) for e in self._element.iter(tagName) if e is not self._element]
+
+
 class Reader:
     """
     Read a GDML file.
@@ -23,22 +98,35 @@ class Reader:
     :type registryOn: bool
     :param reduceNISTMaterialsToPredefined: change NIST-named materials to predefined ones
     :type reduceNISTMaterialsToPredefined: bool
+    :param streaming: stream parse the file rather than building a DOM of the whole file
+    :type streaming: bool
 
     When loading a GDML file that was exported by Geant4, the NIST materials may be
     fully expanded to include their full element / isotope composition. With the
     reduceNISTMaterialsToPredefined flag set to True, these will be ignored and the
     materials that have a name that matches a NIST one will be 'reduced' back to a
     predefined material by name only.
+
+    The streaming reader processes each define, solid and volume as soon as it is read
+    and then releases it, so the memory used does not grow with the size of the file.
+    The sections are processed in the order they appear in the file (as Geant4 does).
+    With streaming=False the whole file is parsed into a minidom DOM first.
     """
 
     def __init__(
-        self, fileName, registryOn=True, skipMaterials=False, reduceNISTMaterialsToPredefined=False
+        self,
+        fileName,
+        registryOn=True,
+        skipMaterials=False,
+        reduceNISTMaterialsToPredefined=False,
+        streaming=True,
     ):
         super().__init__()
         self.filename = fileName
         self.registryOn = registryOn
         self._reduceNISTMaterialsToPredefined = reduceNISTMaterialsToPredefined
         self._skipMaterials = skipMaterials
+        self._streaming = streaming
 
         if self.registryOn:
             self._registry = _g4.Registry()
@@ -52,62 +140,67 @@ class Reader:
         _log.info("Reader.load>")
         self._physVolumeNameCount.clear()
 
-        # open file
-        data = open(self.filename)
+        if self._streaming:
+            self.loadStreaming()
+        else:
+            self.loadMinidom()
 
-        # Render out the ENTITY includes
-        # Only look at the starting block - no need to iterate over the whole file
-        start_block = ""
-        for line in data:
-            if line.startswith("<gdml"):
-                break
-            start_block += line
-        data.seek(0)  # Reset the file iterator
-
-        # Extract the information from entities and store in a dict
-        entities = {}
-        en_block = _re.search("<!DOCTYPE(\\s+)gdml([\\s\\S]*)>", start_block)
+    def _entityFiles(self):
+        """
+        Dictionary of ENTITY name to included file name from the DOCTYPE of the file.
+        Only the starting block is read - no need to iterate over the whole file.
+        """
+        start_block = []
+        with open(self.filename) as data:
+            for line in data:
+                if line.startswith("<gdml"):
+                    break
+                start_block.append(line)
+
+        en_block = _re.search("<!DOCTYPE(\\s+)gdml([\\s\\S]*)>", "".join(start_block))
 
         try:
             ents = en_block.group(0).split("<")
         except AttributeError:  # No entities
             ents = []
 
+        entities = {}
         for en in ents:
             if "ENTITY" in en:
                 name = en.split()[1]
                 filename = _re.search(r"[^\"]+", " ".join(en.split()[3:])).group(0)
-                filename = _os.path.dirname(self.filename) + "/" + filename
-
-                with open(filename) as content_file:
-                    # ensure the contents are properly prepared for parsing
-                    contents = ""
-                    for l in content_file:
-                        l = l.strip()
-                        if l.endswith(">"):
-                            end = ""
-                        else:
-                            end = " "
-                        if len(l) != 0:
-                            contents += l + end
-                entities[name] = (filename, contents)
+                entities[name] = _os.path.join(_os.path.dirname(self.filename), filename)
+        return entities
+
+    @staticmethod
+    def _entityName(line):
+        return _re.search(r"&([\s\S]+)\;", line).group(1)
 
+    @staticmethod
+    def _stripLines(lines):
         # remove all newline charecters and whitespaces outside tags
-        fs = ""
-        for l in data:
+        for l in lines:
             l = l.strip()
-            # Render out entities in those lines
-            if l.startswith("&"):
-                name = _re.search(r"&([\s\S]+)\;", l).group(1)
-                fs += entities[name][1]
-                continue
-
-            if l.endswith(">"):
-                end = ""
-            else:
-                end = " "
             if len(l) != 0:
-                fs += l + end
+                yield l + ("" if l.endswith(">") else " ")
+
+    def loadMinidom(self):
+        # Render out the ENTITY includes
+        entities = {}
+        for name, filename in self._entityFiles().items():
+            with open(filename) as content_file:
+                # ensure the contents are properly prepared for parsing
+                entities[name] = (filename, "".join(self._stripLines(content_file)))
+
+        fs = []
+        with open(self.filename) as data:
+            for l in data:
+                # Render out entities in those lines
+                if l.strip().startswith("&"):
+                    fs.append(entities[self._entityName(l)][1])
+                else:
+                    fs.extend(self._stripLines([l]))
+        fs = "".join(fs)
 
         # parse xml
         _log.info("Reader.load> minidom parse")
@@ -133,7 +226,66 @@ class Reader:
 
         self.parseUserInfo(xmldoc)
 
-        data.close()
+    def _chunks(self, chunkSize=1024**2):
+        # file contents with ENTITY includes rendered out, in chunks of about chunkSize
+        entities = self._entityFiles()
+        chunk = []
+        size = 0
+        with open(self.filename) as data:
+            for line in data:
+                if line.strip().startswith("&"):
+                    yield "".join(chunk)
+                    chunk = []
+                    size = 0
+                    with open(entities[self._entityName(line)]) as content_file:
+                        yield from iter(lambda: content_file.read(chunkSize), "")
+                    continue
+                chunk.append(line)
+                size += len(line)
+                if size >= chunkSize:
+                    yield "".join(chunk)
+                    chunk = []
+                    size = 0
+        yield "".join(chunk)
+
+    def loadStreaming(self):
+        _log.info("Reader.load> streaming parse")
+
+        # section -> method to process each of its children as soon as they are read
+        childParsers = {
+            "define": self.parseDefine,
+            "solids": self.parseSolid,
+            "structure": lambda node: self.extractStructureNodeData(
+                node, materialSubstitutionNames
+            ),
+        }
+        materialSubstitutionNames = None
+
+        parser = _ElementTree.XMLPullParser(events=("start", "end"))
+        stack = []
+        for chunk in self._chunks():
+            parser.feed(chunk)
+            for event, element in parser.read_events():
+                if event == "start":
+                    if element.tag.startswith("{"):
+                        element.tag = element.tag.split("}", 1)[1]
+                    stack.append(element)
+                    continue
+
+                stack.pop()
+                depth = len(stack)
+                if depth == 2 and stack[1].tag in childParsers:
+                    childParsers[stack[1].tag](_Node(element))
+                    stack[1].remove(element)
+                elif depth == 1:
+                    if element.tag == "materials" and not self._skipMaterials:
+                        materialSubstitutionNames = self.parseMaterials(_Node(stack[0]))
+                    elif element.tag == "userinfo":
+                        self.parseUserInfo(_Node(stack[0]))
+                    elif element.tag == "setup":
+                        self.parseSetup(_Node(stack[0]))
+                    stack[0].remove(element)
+        parser.close()
 
     def getRegistry(self):
         return self._registry
@@ -147,73 +299,76 @@ class Reader:
             return
 
         for df in self.xmldefines.childNodes:
-            try:
-                define_type = df.tagName
-            except AttributeError:
-                # comment so continue
-                continue
+            self.parseDefine(df)
 
-            name = df.attributes["name"].value
-            attrs = df.attributes
+    def parseDefine(self, df):
+        try:
+            define_type = df.tagName
+        except AttributeError:
+            # comment so continue
+            return
 
-            keys = attrs.keys()
-            vals = [attr.value for attr in attrs.values()]
-            def_attrs = dict(zip(keys, vals))
+        name = df.attributes["name"].value
+        attrs = df.attributes
 
-            # parse positions and rotations
-            def getXYZ(def_attrs):
-                x = def_attrs.get("x", "0.0")
-                y = def_attrs.get("y", "0.0")
-                z = def_attrs.get("z", "0.0")
-                u = def_attrs.get("unit", None)
-                return (x, y, z, u)
+        keys = attrs.keys()
+        vals = [attr.value for attr in attrs.values()]
+        def_attrs = dict(zip(keys, vals))
 
-            # parse matrices
-            def getMatrix(def_attrs):
-                try:
-                    coldim = def_attrs["coldim"]
-                except KeyError:
-                    coldim = 0
-                values = def_attrs["values"].split()
-                return (coldim, values)
-
-            if define_type == "constant":
-                value = def_attrs["value"]
-                _defines.Constant(name, value, self._registry, True)
-            elif define_type == "quantity":
-                value = def_attrs["value"]
-                try:
-                    unit = def_attrs["unit"]
-                except KeyError:
-                    unit = None
-                try:
-                    qtype = def_attrs["type"]
-                except KeyError:
-                    qtype = None
-                _defines.Quantity(name, value, unit, qtype, self._registry, True)
-            elif define_type == "variable":
-                value = def_attrs["value"]
-                _defines.Variable(name, value, self._registry, True)
-            elif define_type == "expression":
-                value = df.childNodes[0].nodeValue
-                _defines.Expression(name, value, self._registry, True)
-            elif define_type == "position":
-                (x, y, z, u) = getXYZ(def_attrs)
-                unit = u if u else "mm"
-                _defines.Position(name, x, y, z, unit, self._registry, True)
-            elif define_type == "rotation":
-                (x, y, z, u) = getXYZ(def_attrs)
-                unit = u if u else "rad"
-                _defines.Rotation(name, x, y, z, unit, self._registry, True)
-            elif define_type == "scale":
-                (x, y, z, u) = getXYZ(def_attrs)
-                unit = u if u else "none"
-                _defines.Scale(name, x, y, z, unit, self._registry, True)
-            elif define_type == "matrix":
-                (coldim, values) = getMatrix(def_attrs)
-                _defines.Matrix(name, coldim, values, self._registry, True)
-            else:
-                print("Warning : unrecognised define: ", define_type)
+        # parse positions and rotations
+        def getXYZ(def_attrs):
+            x = def_attrs.get("x", "0.0")
+            y = def_attrs.get("y", "0.0")
+            z = def_attrs.get("z", "0.0")
+            u = def_attrs.get("unit", None)
+            return (x, y, z, u)
+
+        # parse matrices
+        def getMatrix(def_attrs):
+            try:
+                coldim = def_attrs["coldim"]
+            except KeyError:
+                coldim = 0
+            values = def_attrs["values"].split()
+            return (coldim, values)
+
+        if define_type == "constant":
+            value = def_attrs["value"]
+            _defines.Constant(name, value, self._registry, True)
+        elif define_type == "quantity":
+            value = def_attrs["value"]
+            try:
+                unit = def_attrs["unit"]
+            except KeyError:
+                unit = None
+            try:
+                qtype = def_attrs["type"]
+            except KeyError:
+                qtype = None
+            _defines.Quantity(name, value, unit, qtype, self._registry, True)
+        elif define_type == "variable":
+            value = def_attrs["value"]
+            _defines.Variable(name, value, self._registry, True)
+        elif define_type == "expression":
+            value = df.childNodes[0].nodeValue
+            _defines.Expression(name, value, self._registry, True)
+        elif define_type == "position":
+            (x, y, z, u) = getXYZ(def_attrs)
+            unit = u if u else "mm"
+            _defines.Position(name, x, y, z, unit, self._registry, True)
+        elif define_type == "rotation":
+            (x, y, z, u) = getXYZ(def_attrs)
+            unit = u if u else "rad"
+            _defines.Rotation(name, x, y, z, unit, self._registry, True)
+        elif define_type == "scale":
+            (x, y, z, u) = getXYZ(def_attrs)
+            unit = u if u else "none"
+            _defines.Scale(name, x, y, z, unit, self._registry, True)
+        elif define_type == "matrix":
+            (coldim, values) = getMatrix(def_attrs)
+            _defines.Matrix(name, coldim, values, self._registry, True)
+        else:
+            print("Warning : unrecognised define: ", define_type)
 
     def parseVector(self, node, type="position", addRegistry=True):
         try:
@@ -546,82 +701,85 @@ class Reader:
         self.xmlsolids = xmldoc.getElementsByTagName("solids")[0]
 
         for node in self.xmlsolids.childNodes:
-            try:
-                solid_type = node.tagName
-            except AttributeError:
-                continue  # node is probably a comment so continue
-
-            if solid_type == "box":  # solid test 001
-                self.parseBox(node)
-            elif solid_type == "tube":  # solid test 002
-                self.parseTube(node)
-            elif solid_type == "cutTube":  # solid test 003
-                self.parseCutTube(node)
-            elif solid_type == "cone":  # solid test 004 (problem when rmin1 == rmin2 != 0)
-                self.parseCone(node)
-            elif solid_type == "para":  # solid test 005
-                self.parsePara(node)
-            elif solid_type == "trd":  # solid test 006
-                self.parseTrd(node)
-            elif solid_type == "trap":  # solid test 007
-                self.parseTrap(node)
-            elif solid_type == "sphere":  # solid test 008
-                self.parseSphere(node)
-            elif solid_type == "orb":  # solid test 009
-                self.parseOrb(node)
-            elif solid_type == "torus":  # solid test 010
-                self.parseTorus(node)
-            elif solid_type == "polycone":  # solid test 011
-                self.parsePolycone(node)
-            elif solid_type == "genericPolycone":  # solid test 012
-                self.parseGenericPolycone(node)
-            elif solid_type == "polyhedra":  # solid test 013
-                self.parsePolyhedra(node)
-            elif solid_type == "genericPolyhedra":  # solid test 014
-                self.parseGenericPolyhedra(node)
-            elif solid_type == "eltube":  # solid test 015
-                self.parseEllipticalTube(node)
-            elif solid_type == "ellipsoid":  # solid test 016
-                self.parseEllipsoid(node)
-            elif solid_type == "elcone":  # solid test 017
-                self.parseEllipticalCone(node)
-            elif solid_type == "paraboloid":  # solid test 018
-                self.parseParaboloid(node)
-            elif solid_type == "hype":  # solid test 019
-                self.parseHype(node)
-            elif solid_type == "tet":  # solid test 020
-                self.parseTet(node)
-            elif solid_type == "xtru":  # solid test 021
-                self.parseExtrudedSolid(node)
-            elif solid_type == "twistedbox":  # solid test 022
-                self.parseTwistedBox(node)
-            elif solid_type == "twistedtrap":  # solid test 023
-                self.parseTwistedTrap(node)
-            elif solid_type == "twistedtrd":  # solid test 024
-                self.parseTwistedTrd(node)
-            elif solid_type == "twistedtubs":  # solid test 025
-                self.parseTwistedTubs(node)
-            elif solid_type == "arb8":  # solid test 026
-                self.parseGenericTrap(node)
-            elif solid_type == "tessellated":  # solid test 027
-                self.parseTessellatedSolid(node)
-            elif solid_type == "union":  # solid test 028
-                self.parseUnion(node)
-            elif solid_type == "subtraction":  # solid test 029
-                self.parseSubtraction(node)
-            elif solid_type == "intersection":  # solid test 030
-                self.parseIntersection(node)
-            elif solid_type == "multiUnion":  # solid test 031
-                self.parseMultiUnion(node)
-            elif solid_type == "opticalsurface":
-                self.parseOpticalSurface(node)
-            elif solid_type == "scaledSolid":
-                self.parseScaledSolid(node)
-            elif solid_type == "loop":
-                pass
-                # self.parseSolidLoop(node)
-            else:
-                print(solid_type, node.attributes["name"].value)
+            self.parseSolid(node)
+
+    def parseSolid(self, node):
+        try:
+            solid_type = node.tagName
+        except AttributeError:
+            return  # node is probably a comment so continue
+
+        if solid_type == "box":  # solid test 001
+            self.parseBox(node)
+        elif solid_type == "tube":  # solid test 002
+            self.parseTube(node)
+        elif solid_type == "cutTube":  # solid test 003
+            self.parseCutTube(node)
+        elif solid_type == "cone":  # solid test 004 (problem when rmin1 == rmin2 != 0)
+            self.parseCone(node)
+        elif solid_type == "para":  # solid test 005
+            self.parsePara(node)
+        elif solid_type == "trd":  # solid test 006
+            self.parseTrd(node)
+        elif solid_type == "trap":  # solid test 007
+            self.parseTrap(node)
+        elif solid_type == "sphere":  # solid test 008
+            self.parseSphere(node)
+        elif solid_type == "orb":  # solid test 009
+            self.parseOrb(node)
+        elif solid_type == "torus":  # solid test 010
+            self.parseTorus(node)
+        elif solid_type == "polycone":  # solid test 011
+            self.parsePolycone(node)
+        elif solid_type == "genericPolycone":  # solid test 012
+            self.parseGenericPolycone(node)
+        elif solid_type == "polyhedra":  # solid test 013
+            self.parsePolyhedra(node)
+        elif solid_type == "genericPolyhedra":  # solid test 014
+            self.parseGenericPolyhedra(node)
+        elif solid_type == "eltube":  # solid test 015
+            self.parseEllipticalTube(node)
+        elif solid_type == "ellipsoid":  # solid test 016
+            self.parseEllipsoid(node)
+        elif solid_type == "elcone":  # solid test 017
+            self.parseEllipticalCone(node)
+        elif solid_type == "paraboloid":  # solid test 018
+            self.parseParaboloid(node)
+        elif solid_type == "hype":  # solid test 019
+            self.parseHype(node)
+        elif solid_type == "tet":  # solid test 020
+            self.parseTet(node)
+        elif solid_type == "xtru":  # solid test 021
+            self.parseExtrudedSolid(node)
+        elif solid_type == "twistedbox":  # solid test 022
+            self.parseTwistedBox(node)
+        elif solid_type == "twistedtrap":  # solid test 023
+            self.parseTwistedTrap(node)
+        elif solid_type == "twistedtrd":  # solid test 024
+            self.parseTwistedTrd(node)
+        elif solid_type == "twistedtubs":  # solid test 025
+            self.parseTwistedTubs(node)
+        elif solid_type == "arb8":  # solid test 026
+            self.parseGenericTrap(node)
+        elif solid_type == "tessellated":  # solid test 027
+            self.parseTessellatedSolid(node)
+        elif solid_type == "union":  # solid test 028
+            self.parseUnion(node)
+        elif solid_type == "subtraction":  # solid test 029
+            self.parseSubtraction(node)
+        elif solid_type == "intersection":  # solid test 030
+            self.parseIntersection(node)
+        elif solid_type == "multiUnion":  # solid test 031
+            self.parseMultiUnion(node)
+        elif solid_type == "opticalsurface":
+            self.parseOpticalSurface(node)
+        elif solid_type == "scaledSolid":
+            self.parseScaledSolid(node)
+        elif solid_type == "loop":
+            pass
+            # self.parseSolidLoop(node)
+        else:
+            print(solid_type, node.attributes["name"].value)
 
     def parseBox(self, node):
         solid_name = node.attributes["name"].value
@@ -1833,6 +1991,9 @@ class Reader:
         for node in self.xmlstructure.childNodes:
             self.extractStructureNodeData(node, materialSubstitutionNames)
 
+        self.parseSetup(xmldoc)
+
+    def parseSetup(self, xmldoc):
         # find world logical volume
         self.xmlsetup = xmldoc.getElementsByTagName("setup")[0]
         worldLvName = self.xmlsetup.childNodes[0].attributes["ref"].value
@@ -1938,7 +2099,9 @@ class Reader:
                 except IndexError:
                     fileref = chNode.getElementsByTagName("file")[0].attributes["name"].value
                     print(fileref)
-                    r = Reader(fileref, skipMaterials=self._skipMaterials)
+                    r = Reader(
+                        fileref, skipMaterials=self._skipMaterials, streaming=self._streaming
+                    )
                     fileReg = r.getRegistry()
                     fileReg.name = fileref
                     fileLV = r.getRegistry().getWorldVolume()
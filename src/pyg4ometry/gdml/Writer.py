@@ -1,19 +1,187 @@
+import io as _io
 from xml.dom import getDOMImplementation
+from xml.dom import Node as _Node
 from ..geant4._Material import Material as _Material
 from ..geant4._Material import Element as _Element
 from ..geant4._Material import Isotope as _Isotope
 from ..gdml import Defines as _Defines
 import pyg4ometry.geant4 as _g4
 import logging as _log
+import numpy as _np
+
+
+def _minidomEscapes(attribute):
+    """
+    Replacements minidom of the running Python makes for special characters (other than &)
+    in attribute values or text. Python 3.13 escapes whitespace in attribute values and no
+    longer escapes quotes in text.
+    """
+    document = getDOMImplementation().createDocument(None, "a", None)
+    element = document.documentElement
+    escapes = []
+    for char in '<>"\r\n\t':
+        writer = _io.StringIO()
+        if attribute:
+            element.setAttribute("b", char)
+            element.writexml(writer)
+            written = writer.getvalue()[len('<a b="') : -len('"/>')]
+        else:
+            document.createTextNode(char).writexml(writer)
+            written = writer.getvalue()
+        if written != char:
+            escapes.append((char, written))
+    return escapes
+
+
+_textEscapes = _minidomEscapes(False)
+_attributeEscapes = _minidomEscapes(True)
+
+
+def _escape(data, escapes=_textEscapes):
+    # same escaping as minidom
+    data = data.replace("&", "&amp;")
+    for char, escaped in escapes:
+        data = data.replace(char, escaped)
+    return data
+
+
+def _startTag(tagName, attributes):
+    return "<" + tagName + "".join(f' {k}="{_escape(v, _attributeEscapes)}"' for k, v in attributes)
+
+
+def _numericArray(values):
+    """
+    Values as a numpy array, or None if they are not all numbers (e.g. expressions)
+    """
+    try:
+        array = _np.asarray(values)
+    except ValueError:
+        return None
+    if array.dtype.kind not in "biuf" or len(array) == 0:
+        return None
+    return array.astype(float)
+
+
+class _Text:
+    nodeType = _Node.TEXT_NODE
+
+    def __init__(self, data):
+        self.data = data
+
+    def writexml(self, writer, indent="", addindent="", newl=""):
+        writer.write(_escape(f"{indent}{self.data}{newl}"))
+
+
+class _XmlElement:
+    """
+    Light weight element with the parts of the minidom Element interface used by the
+    Writer. Written out exactly as minidom writes an element.
+    """
+
+    __slots__ = ("tagName", "_attributes", "childNodes")
+    nodeType = _Node.ELEMENT_NODE
+
+    def __init__(self, tagName):
+        self.tagName = tagName
+        self._attributes = {}
+        self.childNodes = []
+
+    def setAttribute(self, name, value):
+        self._attributes[name] = value
+
+    def getAttribute(self, name):
+        return self._attributes.get(name, "")
+
+    def appendChild(self, node):
+        self.childNodes.append(node)
+        return node
+
+    def removeChild(self, node):
+        self.childNodes.remove(node)
+        return node
+
+    def writexml(self, writer, indent="", addindent="", newl=""):
+        writer.write(indent + _startTag(self.tagName, self._attributes.items()))
+        if not self.childNodes:
+            writer.write("/>" + newl)
+            return
+
+        writer.write(">")
+        if len(self.childNodes) == 1 and self.childNodes[0].nodeType == _Node.TEXT_NODE:
+            self.childNodes[0].writexml(writer)
+        else:
+            writer.write(newl)
+            for node in self.childNodes:
+                node.writexml(writer, indent + addindent, addindent, newl)
+            writer.write(indent)
+        writer.write(f"</{self.tagName}>{newl}")
+
+
+class _XmlRows:
+    """
+    Block of elements without children, e.g. tessellated facets, generated only when
+    written so no node is kept for each of them. rows is a function returning an
+    iterable of (tagName, [(attribute, value), ...]).
+    """
+
+    nodeType = _Node.ELEMENT_NODE
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def writexml(self, writer, indent="", addindent="", newl=""):
+        writer.writelines(
+            indent + _startTag(tagName, attributes) + "/>" + newl
+            for tagName, attributes in self.rows()
+        )
+
+
+class _XmlDocument:
+    """
+    Light weight replacement for a minidom Document that is written straight to a
+    file rather than through one string of the whole document.
+    """
+
+    def __init__(self, tagName):
+        self.documentElement = _XmlElement(tagName)
+
+    def createElement(self, tagName):
+        return _XmlElement(tagName)
+
+    def createTextNode(self, data):
+        return _Text(data)
+
+    def writexml(self, writer, indent="", addindent="", newl=""):
+        writer.write('<?xml version="1.0" ?>' + newl)
+        self.documentElement.writexml(writer, indent, addindent, newl)
+
+    def toprettyxml(self, indent="\t", newl="\n"):
+        writer = _io.StringIO()
+        self.writexml(writer, "", indent, newl)
+        return writer.getvalue()
 
 
 class Writer:
-    def __init__(self, prepend=""):
+    """
+    Write a registry to a GDML file.
+
+    :param prepend: prefix for the names of all solids, volumes and the world
+    :type prepend: str
+    :param streaming: build a light weight document written straight to the file,
+                      otherwise a minidom document is used
+    :type streaming: bool
+    """
+
+    def __init__(self, prepend="", streaming=True):
         super().__init__()
         self.prepend = prepend
+        self._streaming = streaming
 
-        self.imp = getDOMImplementation()
-        self.doc = self.imp.createDocument(None, "gdml", None)
+        if streaming:
+            self.doc = _XmlDocument("gdml")
+        else:
+            self.imp = getDOMImplementation()
+            self.doc = self.imp.createDocument(None, "gdml", None)
         self.top = self.doc.documentElement
         self.top.setAttribute("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance")
         self.top.setAttribute(
@@ -97,11 +265,35 @@ class Writer:
         we.setAttribute("ref", self.prepend + registry.worldName)
         self.setup.appendChild(we)
 
-    def write(self, filename):
-        f = open(filename, "w")
-        xmlString = self.doc.toprettyxml()
-        f.write(xmlString)
-        f.close()
+    def write(self, filename, compact=False):
+        """
+        Write the GDML file. The document is written element by element rather than
+        as one string.
+
+        :param filename: output file name
+        :type filename: str
+        :param compact: do not indent the elements (one element per line)
+        :type compact: bool
+        """
+        addindent = "" if compact else "\t"
+        with open(filename, "w", buffering=1024**2) as f:
+            self.doc.writexml(f, "", addindent, "\n")
+
+    def _appendRows(self, node, rows):
+        """
+        Append elements without children given by rows, a function returning an iterable
+        of (tagName, [(attribute, value), ...]). For the streaming document they are only
+        generated when written.
+        """
+        if self._streaming:
+            node.appendChild(_XmlRows(rows))
+            return
+
+        for tagName, attributes in rows():
+            e = self.doc.createElement(tagName)
+            for k, v in attributes:
+                e.setAttribute(k, v)
+            node.appendChild(e)
 
     def writeGMADTesterNoBeamline(self, gmad, gdml):
         text = f"""test: placement, geometryFile="gdml:{gdml}";
@@ -889,43 +1081,62 @@ option, preprocessGDML=0;
         name = instance.name
         oe.setAttribute("name", self.prepend + name)
 
-        facet_makers = {3: self.createTriangularFacet, 4: self.createQuadrangularFacet}
         if instance.meshtype == instance.MeshType.Gdml:
-            for f in instance.meshtess:
-                oe.appendChild(facet_makers[len(f)](*f))
+            facets = [[str(v) for v in f] for f in instance.meshtess]
 
         elif instance.meshtype == instance.MeshType.Freecad:
             verts = instance.meshtess[0]
             facet = instance.meshtess[1]
 
-            vert_names = []
-            for vertex_id, v in enumerate(verts):
-                defname = f"{name}_{vertex_id}"
-                vert_names.append(defname)
-
-                self.writeDefine(_Defines.Position(defname, v[0], v[1], v[2]))
+            vertices = _numericArray(verts)
+            if vertices is not None and vertices.shape[1:] == (3,):
+                self._appendRows(self.defines, lambda: self._positionRows(name + "_", vertices))
+            else:
+                for vertex_id, v in enumerate(verts):
+                    self.writeDefine(_Defines.Position(f"{name}_{vertex_id}", v[0], v[1], v[2]))
 
-            for f in facet:
-                oe.appendChild(facet_makers[len(f)](*[vert_names[fi] for fi in f]))
-                # oe.appendChild(self.createTriangularFacet(vert_names[f[0]],
-                #                                           vert_names[f[1]],
-                #                                           vert_names[f[2]]))
+            facets = [[f"{name}_{fi}" for fi in f] for f in facet]
         else:
             facet = instance.meshtess
 
-            for facet_id, f in enumerate(facet):
-                vertex_names = []
-                for vertex_id, v in enumerate(f[0]):
-                    defname = f"{name}_f{facet_id}_v{vertex_id}"
-                    vertex_names.append(defname)
-                    self.writeDefine(_Defines.Position(defname, v[0], v[1], v[2]))
+            vertices = _numericArray([f[0] for f in facet])
+            if vertices is not None and vertices.shape[1:] == (3, 3):
+                vertices = vertices.reshape(-1, 3)
+                self._appendRows(self.defines, lambda: self._positionRows(name + "_", vertices, 3))
+            else:
+                for facet_id, f in enumerate(facet):
+                    for vertex_id, v in enumerate(f[0]):
+                        defname = f"{name}_f{facet_id}_v{vertex_id}"
+                        self.writeDefine(_Defines.Position(defname, v[0], v[1], v[2]))
 
-                oe.appendChild(
-                    self.createTriangularFacet(vertex_names[0], vertex_names[1], vertex_names[2])
-                )
+            facets = [[f"{name}_f{i}_v{j}" for j in range(3)] for i in range(len(facet))]
+
+        if facets:
+            self._appendRows(oe, lambda: self._facetRows(facets))
 
         self.solids.appendChild(oe)
 
+    @staticmethod
+    def _positionRows(prefix, vertices, verticesPerFacet=None):
+        # positions written as by writeDefine for _Defines.Position(name, x, y, z)
+        values = ["%.15f" % x for x in vertices.ravel().tolist()]
+        for i in range(len(vertices)):
+            if verticesPerFacet is None:
+                name = f"{prefix}{i}"
+            else:
+                name = f"{prefix}f{i // verticesPerFacet}_v{i % verticesPerFacet}"
+            x, y, z = values[3 * i : 3 * i + 3]
+            yield "position", [("name", name), ("x", x), ("y", y), ("z", z), ("unit", "mm")]
+
+    @staticmethod
+    def _facetRows(facets):
+        # facets written as by createTriangularFacet and createQuadrangularFacet
+        tagNames = {3: "triangular", 4: "quadrangular"}
+        for f in facets:
+            attributes = [(f"vertex{i + 1}", v) for i, v in enumerate(f)]
+            attributes.append(("type", "ABSOLUTE"))
+            yield tagNames[len(f)], attributes
+
     def writeHype(self, instance):
         oe = self.doc.createElement("hype")
         oe.setAttribute("name", self.prepend + instance.name)
@@ -1,4 +1,6 @@
 from .PhysicalVolume import PhysicalVolume as _PhysicalVolume
+from .ReplicaVolume import _instanceMeshes
+from .solid.MeshCache import meshCacheKey as _meshCacheKey
 import pyg4ometry.geant4.solid as _solid
 from pyg4ometry.visualisation import Mesh as _Mesh
 from pyg4ometry.visualisation import VisualisationOptions as _VisOptions
@@ -66,14 +68,58 @@ class DivisionVolume(_PhysicalVolume):
         if motherVolume.solid.type != logicalVolume.solid.type:
             msg = f"Can not have divisions with a different solid type than the mother volume. Mother : {motherVolume.solid.type}, Division : {logicalVolume.solid.type}"
             raise ValueError(msg)
+        if not hasattr(self, f"divide{logicalVolume.solid.type}"):
+            msg = f"Division with solid {logicalVolume.solid.type} is not supported yet."
+            raise ValueError(msg)
         if addRegistry:
             registry.addPhysicalVolume(self)
 
         # physical visualisation options
         self.visOptions = _VisOptions()
 
-        # Create division meshes
-        [self.meshes, self.transforms] = self.createDivisionMeshes()
+        # division meshes are made when first used
+        self._uniqueMeshes = None
+        self._meshIndex = None
+        self._transforms = None
+
+    def _makeMeshes(self):
+        if self._uniqueMeshes is None:
+            meshes, transforms = self.createDivisionMeshes()
+            self._uniqueMeshes, self._meshIndex = _instanceMeshes(meshes)
+            self._transforms = _np.array(transforms, dtype=float).reshape(-1, 2, 3)
+
+    @property
+    def meshes(self):
+        """
+        Mesh of each division, made when first used. Divisions of the same shape share one
+        mesh, see uniqueMeshes and meshIndex.
+        """
+        self._makeMeshes()
+        return [self._uniqueMeshes[i] if i >= 0 else None for i in self._meshIndex]
+
+    @property
+    def uniqueMeshes(self):
+        """
+        Distinct meshes of the divisions
+        """
+        self._makeMeshes()
+        return self._uniqueMeshes
+
+    @property
+    def meshIndex(self):
+        """
+        Index in uniqueMeshes of the mesh of each division, an int32 array
+        """
+        self._makeMeshes()
+        return self._meshIndex
+
+    @property
+    def transforms(self):
+        """
+        Rotation and translation of each division, an array (n, 2, 3)
+        """
+        self._makeMeshes()
+        return self._transforms
 
     def getMotherSize(self):
         sd = self.motherVolume.solid
@@ -141,11 +187,27 @@ class DivisionVolume(_PhysicalVolume):
             msg = f"Division along axis {self.axis} not supported for solid {self.logicalVolume.solid.type}"
             raise ValueError(msg)
 
+    def _divisionMeshes(self, solids):
+        """
+        Mesh of each division solid. Solids with identical parameters share one mesh.
+        """
+        meshes = []
+        shapes = {}
+        for solid in solids:
+            key = _meshCacheKey(solid)
+            if key is None:
+                meshes.append(_Mesh(solid))
+                continue
+            if key not in shapes:
+                shapes[key] = _Mesh(solid)
+            meshes.append(shapes[key])
+        return meshes
+
     def divideBox(self, offset, width, ndiv):
         allowed_axes = [self.Axis.kXAxis, self.Axis.kYAxis, self.Axis.kZAxis]
         self.checkAxis(allowed_axes)
 
-        meshes = []
+        solids = []
         transforms = []
 
         msize = self.getMotherSize()
@@ -178,14 +240,14 @@ class DivisionVolume(_PhysicalVolume):
                 solid.pZ.expression.expressionString = str(width)
                 transforms.append([[0, 0, 0], [0, 0, v]])
 
-            meshes.append(_Mesh(solid))
-        return meshes, transforms
+            solids.append(solid)
+        return self._divisionMeshes(solids), transforms
 
     def divideTubs(self, offset, width, ndiv):
         allowed_axes = [self.Axis.kRho, self.Axis.kPhi, self.Axis.kZAxis]
         self.checkAxis(allowed_axes)
 
-        meshes = []
+        solids = []
         transforms = []
 
         if self.axis == self.Axis.kPhi:
@@ -238,15 +300,15 @@ class DivisionVolume(_PhysicalVolume):
                 solid.pDPhi.expression.expressionString = str(width)
                 transforms.append([[0, 0, 0], [0, 0, 0]])
 
-            meshes.append(_Mesh(solid))
+            solids.append(solid)
 
-        return meshes, transforms
+        return self._divisionMeshes(solids), transforms
 
     def divideCons(self, offset, width, ndiv):
         allowed_axes = [self.Axis.kRho, self.Axis.kPhi, self.Axis.kZAxis]
         self.checkAxis(allowed_axes)
 
-        meshes = []
+        solids = []
         transforms = []
 
         msize = self.getMotherSize()
@@ -324,15 +386,15 @@ class DivisionVolume(_PhysicalVolume):
                 solid.pDPhi.expression.expressionString = str(width)
                 transforms.append([[0, 0, 0], [0, 0, 0]])
 
-            meshes.append(_Mesh(solid))
+            solids.append(solid)
 
-        return meshes, transforms
+        return self._divisionMeshes(solids), transforms
 
     def dividePara(self, offset, width, ndiv):
         allowed_axes = [self.Axis.kXAxis, self.Axis.kYAxis, self.Axis.kZAxis]
         self.checkAxis(allowed_axes)
 
-        meshes = []
+        solids = []
         transforms = []
 
         msize = self.getMotherSize()
@@ -376,15 +438,15 @@ class DivisionVolume(_PhysicalVolume):
                     ]
                 )
 
-            meshes.append(_Mesh(solid))
+            solids.append(solid)
 
-        return meshes, transforms
+        return self._divisionMeshes(solids), transforms
 
     def divideTrd(self, offset, width, ndiv):
         allowed_axes = [self.Axis.kXAxis, self.Axis.kYAxis, self.Axis.kZAxis]
         self.checkAxis(allowed_axes)
 
-        meshes = []
+        solids = []
         transforms = []
 
         msize = self.getMotherSize()
@@ -438,15 +500,15 @@ class DivisionVolume(_PhysicalVolume):
                 solid.pZ.expression.expressionString = str(width)
                 transforms.append([[0, 0, 0], [0, 0, v]])
 
-            meshes.append(_Mesh(solid))
+            solids.append(solid)
 
-        return meshes, transforms
+        return self._divisionMeshes(solids), transforms
 
     def dividePolycone(self, offset, width, ndiv):
         allowed_axes = [self.Axis.kRho, self.Axis.kPhi, self.Axis.kZAxis]
         self.checkAxis(allowed_axes)
 
-        meshes = []
+        solids = []
         transforms = []
 
         msize = self.getMotherSize()
@@ -561,15 +623,15 @@ class DivisionVolume(_PhysicalVolume):
                     solid.pZpl = [v, v + width]
                     transforms.append([[0, 0, 0], [0, 0, 0]])
 
-            meshes.append(_Mesh(solid))
+            solids.append(solid)
 
-        return meshes, transforms
+        return self._divisionMeshes(solids), transforms
 
     def dividePolyhedra(self, offset, width, ndiv):
         allowed_axes = [self.Axis.kRho, self.Axis.kPhi, self.Axis.kZAxis]
         self.checkAxis(allowed_axes)
 
-        meshes = []
+        solids = []
         transforms = []
 
         msize = self.getMotherSize()
@@ -686,9 +748,9 @@ class DivisionVolume(_PhysicalVolume):
                     solid.zPlane = [v, v + width]
                     transforms.append([[0, 0, 0], [0, 0, 0]])
 
-            meshes.append(_Mesh(solid))
+            solids.append(solid)
 
-        return meshes, transforms
+        return self._divisionMeshes(solids), transforms
 
     def createDivisionMeshes(self):
         ndivisions = int(
@@ -8,6 +8,10 @@ from pyg4ometry import config as _config
 from pyg4ometry.visualisation import Mesh as _Mesh
 from pyg4ometry.visualisation import Convert as _Convert
 from pyg4ometry.visualisation import OverlapType as _OverlapType
+from pyg4ometry.visualisation import _meshToArrays
+from pyg4ometry.visualisation import _meshFromArrays
+from pyg4ometry.visualisation import _meshVertices
+from pyg4ometry.meshutils import aabbCandidatePairs as _aabbCandidatePairs
 from . import solid as _solid
 from . import _Material as _mat
 import pyg4ometry.transformation as _trans
@@ -47,6 +51,88 @@ def _solid2tessellated(solid):
     return tesselated_solid
 
 
+def _meshesAABB(meshes):
+    """
+    Axis-aligned bounding boxes of a list of meshes as a numpy array of shape (n,2,3),
+    where [i,0] is the minimum and [i,1] the maximum corner of mesh i.
+    """
+    aabbs = _np.zeros((len(meshes), 2, 3))
+    for i, mesh in enumerate(meshes):
+        vertices = _meshVertices(mesh)
+        if len(vertices) == 0:
+            # null mesh - place an inverted box so it never overlaps anything
+            aabbs[i, 0] = 1e99
+            aabbs[i, 1] = -1e99
+            continue
+        aabbs[i, 0] = vertices.min(axis=0)
+        aabbs[i, 1] = vertices.max(axis=0)
+    return aabbs
+
+
+def _overlapCheckOperation(overlapType, mesh1, mesh2):
+    """
+    Narrow phase mesh operation for an overlap check. Any vertices in the result
+    indicate an overlap.
+
+    :param overlapType: OverlapType.overlap (intersection), OverlapType.protrusion (mesh1 - mesh2)
+                        or OverlapType.coplanar (coplanar intersection)
+    """
+    if overlapType == _OverlapType.overlap:
+        return mesh1.intersect(mesh2)
+    elif overlapType == _OverlapType.protrusion:
+        return mesh1.subtract(mesh2)
+    elif overlapType == _OverlapType.coplanar:
+        return mesh1.coplanarIntersection(mesh2)
+    else:
+        msg = f"Unknown overlap type {overlapType}"
+        raise ValueError(msg)
+
+
+def _overlapCheckWorker(overlapType, vertices1, faces1, vertices2, faces2):
+    """
+    Process pool worker for an overlap check. Meshes are passed and returned as vertex
+    and face arrays (see visualisation._meshToArrays). Returns None if there is no overlap.
+    """
+    mesh1 = _meshFromArrays(vertices1, faces1)
+    mesh2 = _meshFromArrays(vertices2, faces2)
+    resultMesh = _overlapCheckOperation(overlapType, mesh1, mesh2)
+    if resultMesh.vertexCount() == 0:
+        return None
+    return _meshToArrays(resultMesh)
+
+
+def _runOverlapCheckJobs(jobs, workers):
+    """
+    Evaluate overlap check jobs, as returned by LogicalVolume._getOverlapCheckJobs, in a pool
+    of processes. Returns a list of result meshes (or None for no overlap) in job order.
+    """
+    from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+
+    # meshes are shared between jobs (e.g. the mother), so serialise each only once
+    meshArrays = {}
+
+    def _arrays(mesh):
+        if id(mesh) not in meshArrays:
+            meshArrays[id(mesh)] = _meshToArrays(mesh)
+        return meshArrays[id(mesh)]
+
+    results = []
+    with _ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        for overlapType, mesh1, mesh2, _ in jobs:
+            vertices1, faces1 = _arrays(mesh1)
+            vertices2, faces2 = _arrays(mesh2)
+            futures.append(
+                executor.submit(
+                    _overlapCheckWorker, overlapType, vertices1, faces1, vertices2, faces2
+                )
+            )
+        for future in futures:
+            arrays = future.result()
+            results.append(None if arrays is None else _meshFromArrays(*arrays))
+    return results
+
+
 class LogicalVolume:
     """
     LogicalVolume : G4LogicalVolume
@@ -94,7 +180,9 @@ class LogicalVolume:
         self.daughterVolumes = []
         self._daughterVolumesDict = {}
         self.bdsimObjects = []
-        if _config.doMeshing:
+        self._mesh = None
+        self._meshed = False
+        if _config.doMeshing and not _config.lazyMeshing:
             self.reMesh()
         self.auxiliary = []
         self.addAuxiliaryInfo(kwargs.get("auxiliary", None))
@@ -110,6 +198,27 @@ class LogicalVolume:
     def __repr__(self):
         return "Logical volume : " + self.name + " " + str(self.solid) + " " + str(self.material)
 
+    @property
+    def mesh(self):
+        """
+        Mesh of the solid. With config.lazyMeshing it is made when first used, unless
+        config.doMeshing is False (then it is None until reMesh is called).
+        """
+        if not self._meshed and _config.doMeshing:
+            self.reMesh()
+        return self._mesh
+
+    @mesh.setter
+    def mesh(self, mesh):
+        self._mesh = mesh
+        self._meshed = True
+
+    def isMeshed(self):
+        """
+        Whether the mesh has been made (see config.lazyMeshing)
+        """
+        return self._meshed
+
     def reMesh(self, recursive=False):
         """
         Regenerate the visualisation for this logical volume. Required if the geometry is modified
@@ -612,45 +721,12 @@ class LogicalVolume:
         self.solid = newSolid
         self.reMesh(False)
 
-    def checkOverlaps(
-        self,
-        recursive=False,
-        coplanar=False,
-        debugIO=False,
-        printOut=True,
-        nOverlapsDetected=[0],
-    ):
+    def _getTransformedDaughterMeshes(self):
         """
-        Check based on the meshes in each logical volume if there are any geometrical overlaps. By
-        default, overlaps are checked between daughter volumes and with the mother volume itself (protrusion).
-        Coplanar overlaps may also be checked (default on).
-
-        Print out will be given for any overlaps detected and the visualiser will show the
-        colour coded overlaps.
-
-        :param recursive: bool - Whether to descend into the daughter volumes and check their contents also.
-        :param coplanar: bool - Whether to check for coplanar overlaps
-        :param debugIO: bool - Print out for every check made
-        :param printOut: bool - (internal) Whether to print out a summary of N overlaps detected
-        :param nOverlapsDetected: [int] - (internal) counter for recursion - ignore
+        Return the meshes, bounding meshes and names of the placement daughters transformed
+        into the frame of this logical volume. An assembly daughter contributes one mesh per
+        volume inside it.
         """
-        from pyg4ometry.geant4 import IsAReplica as _IsAReplica
-
-        if printOut:
-            print("LogicalVolume.checkOverlaps> ", self.name)
-
-        # return if overlaps already checked
-        if self.overlapChecked:
-            if debugIO:
-                print("Overlaps already checked - skipping")
-            return
-
-        if _IsAReplica(self):
-            self.daughterVolumes[0]._checkInternalOverlaps(debugIO, nOverlapsDetected)
-            self.overlapChecked = True
-            return
-
-        # local meshes
         transformedMeshes = []
         transformedBoundingMeshes = []
         transformedMeshesNames = []
@@ -711,110 +787,213 @@ class LogicalVolume:
                 transformedBoundingMeshes.append(boundingmesh)
                 transformedMeshesNames.append(name)
 
+        return transformedMeshes, transformedBoundingMeshes, transformedMeshesNames
+
+    def _getOverlapCheckJobs(self, coplanar=False, cullStatistics=None):
+        """
+        Return the narrow phase overlap checks required for the daughters of this logical
+        volume after culling with the bounding box broad phase. Each job is a tuple of
+        (OverlapType, mesh1, mesh2, description) where the overlap type determines the
+        mesh operation (see _overlapCheckOperation).
+
+        :param coplanar: bool - Whether to include coplanar checks
+        :param cullStatistics: dict - number of checks culled and tested, updated in place
+        """
+        if cullStatistics is None:
+            cullStatistics = {"culled": 0, "tested": 0}
+
+        (
+            transformedMeshes,
+            transformedBoundingMeshes,
+            transformedMeshesNames,
+        ) = self._getTransformedDaughterMeshes()
+        names = transformedMeshesNames
+
+        # broad phase - axis-aligned bounding boxes of the transformed bounding meshes
+        tolerance = _config.overlapBoundingBoxTolerance
+        nDaughters = len(transformedMeshes)
+        nDaughterPairs = nDaughters * (nDaughters - 1) // 2
+        daughterAABBs = _meshesAABB(transformedBoundingMeshes)
+        motherAABB = _meshesAABB([self.mesh.localboundingmesh])[0]
+
+        jobs = []
+
         # overlap daughter pv checks
-        for i in range(len(transformedMeshes)):
-            for j in range(i + 1, len(transformedMeshes)):
-                if debugIO:
-                    print(
-                        f"LogicalVolume.checkOverlaps> daughter-daughter bounding mesh intersection test: {transformedMeshesNames[i]} {transformedMeshesNames[j]}"
-                    )
+        overlapPairs = _aabbCandidatePairs(daughterAABBs)
+        cullStatistics["culled"] += nDaughterPairs - len(overlapPairs)
+        cullStatistics["tested"] += len(overlapPairs)
+        for i, j in overlapPairs:
+            jobs.append(
+                (
+                    _OverlapType.overlap,
+                    transformedMeshes[i],
+                    transformedMeshes[j],
+                    f"overlap between daughters of {self.name} \033[0m {names[i]} {names[j]}",
+                )
+            )
 
-                # first check if bounding mesh intersects
-                cullIntersection = transformedBoundingMeshes[i].intersect(
-                    transformedBoundingMeshes[j]
+        # coplanar daughter pv checks - touching bounding boxes are candidates too
+        if coplanar:
+            coplanarPairs = _aabbCandidatePairs(daughterAABBs, tolerance)
+            cullStatistics["culled"] += nDaughterPairs - len(coplanarPairs)
+            cullStatistics["tested"] += len(coplanarPairs)
+            for i, j in coplanarPairs:
+                jobs.append(
+                    (
+                        _OverlapType.coplanar,
+                        transformedMeshes[i],
+                        transformedMeshes[j],
+                        f"coplanar overlap between daughters \033[0m {names[i]} {names[j]}",
+                    )
                 )
-                if cullIntersection.vertexCount() == 0:
-                    continue
-
-                # bounding meshes collide, so check full mesh properly
-                interMesh = transformedMeshes[i].intersect(transformedMeshes[j])
-                _log.info(
-                    "LogicalVolume.checkOverlaps> full daughter-daughter intersection test: %d %d %d %d"
-                    % (i, j, interMesh.vertexCount(), interMesh.polygonCount())
+
+        # protrusion from mother solid - a daughter box contained in the mother box cannot protrude
+        contained = _np.all(daughterAABBs[:, 0, :] >= motherAABB[0] - tolerance, axis=1) & _np.all(
+            daughterAABBs[:, 1, :] <= motherAABB[1] + tolerance, axis=1
+        )
+        cullStatistics["culled"] += int(contained.sum())
+        cullStatistics["tested"] += int(nDaughters - contained.sum())
+        for i in _np.flatnonzero(~contained):
+            jobs.append(
+                (
+                    _OverlapType.protrusion,
+                    transformedMeshes[i],
+                    self.mesh.localmesh,
+                    f"overlap with mother \033[0m {names[i]}",
                 )
-                if interMesh.vertexCount() != 0:
-                    nOverlapsDetected[0] += 1
-                    print(
-                        f"\033[1mOVERLAP DETECTED> overlap between daughters of {self.name} \033[0m {transformedMeshesNames[i]} {transformedMeshesNames[j]} {interMesh.vertexCount()}"
-                    )
-                    self.mesh.addOverlapMesh([interMesh, _OverlapType.overlap])
+            )
 
-        # coplanar daughter pv checks
-        # print 'coplanar with pvs'
-        # print "LogicalVolume.checkOverlaps> daughter coplanar overlaps"
+        # coplanar with solid - a daughter box disjoint from the mother box cannot share a surface
         if coplanar:
-            for i in range(len(transformedMeshes)):
-                for j in range(i + 1, len(transformedMeshes)):
-                    if debugIO:
-                        print(
-                            f"LogicalVolume.checkOverlaps> full coplanar test between daughters {transformedMeshesNames[i]} {transformedMeshesNames[j]}"
-                        )
-
-                    # first check if bounding mesh intersects
-                    cullIntersection = transformedBoundingMeshes[i].intersect(
-                        transformedBoundingMeshes[j]
+            touching = _np.all(
+                daughterAABBs[:, 0, :] <= motherAABB[1] + tolerance, axis=1
+            ) & _np.all(daughterAABBs[:, 1, :] >= motherAABB[0] - tolerance, axis=1)
+            cullStatistics["culled"] += int(nDaughters - touching.sum())
+            cullStatistics["tested"] += int(touching.sum())
+            for i in _np.flatnonzero(touching):
+                # Need mother.coplanar(daughter) as typically mother is larger
+                jobs.append(
+                    (
+                        _OverlapType.coplanar,
+                        self.mesh.localmesh,
+                        transformedMeshes[i],
+                        f"coplanar overlap between daughter and mother\033[0m {names[i]}",
                     )
-                    cullCoplanar = transformedBoundingMeshes[i].coplanarIntersection(
-                        transformedBoundingMeshes[j]
-                    )
-                    print(cullIntersection.vertexCount(), cullCoplanar.vertexCount())
-                    if cullIntersection.vertexCount() == 0 and cullCoplanar.vertexCount() == 0:
-                        continue
-
-                    coplanarMesh = transformedMeshes[i].coplanarIntersection(transformedMeshes[j])
-                    if coplanarMesh.vertexCount() != 0:
-                        nOverlapsDetected[0] += 1
-                        print(
-                            f"\033[1mOVERLAP DETECTED> coplanar overlap between daughters \033[0m {transformedMeshesNames[i]} {transformedMeshesNames[j]} {coplanarMesh.vertexCount()}"
-                        )
-                        self.mesh.addOverlapMesh([coplanarMesh, _OverlapType.coplanar])
-
-        # protrusion from mother solid
-        for i in range(len(transformedMeshes)):
-            if debugIO:
-                print(
-                    f"LogicalVolume.checkOverlaps> full daughter-mother intersection test {transformedMeshesNames[i]}"
                 )
 
-            cullIntersection = transformedBoundingMeshes[i].subtract(self.mesh.localboundingmesh)
-            if cullIntersection.vertexCount() == 0:
-                continue
+        return jobs
 
-            interMesh = transformedMeshes[i].subtract(self.mesh.localmesh)
-            _log.info(
-                "LogicalVolume.checkOverlaps> daughter container %d %d %d"
-                % (i, interMesh.vertexCount(), interMesh.polygonCount())
-            )
+    def _addOverlapCheckResult(self, job, resultMesh, nOverlapsDetected):
+        """
+        Report the result mesh of a narrow phase overlap check and keep it for visualisation
+        if it is not empty.
+        """
+        overlapType, _, _, description = job
+        if resultMesh is None or resultMesh.vertexCount() == 0:
+            return
+        nOverlapsDetected[0] += 1
+        print(f"\033[1mOVERLAP DETECTED> {description} {resultMesh.vertexCount()}")
+        self.mesh.addOverlapMesh([resultMesh, overlapType])
+
+    def _collectOverlapCheckJobs(
+        self, recursive, coplanar, debugIO, nOverlapsDetected, cullStatistics, jobs
+    ):
+        """
+        Gather the overlap check jobs of this logical volume and, if recursive, all logical
+        volumes below it as (logicalVolume, job) tuples. Each logical volume is visited once.
+        """
+        from pyg4ometry.geant4 import IsAReplica as _IsAReplica
+
+        if self.overlapChecked:
+            return
 
-            if interMesh.vertexCount() != 0:
-                nOverlapsDetected[0] += 1
-                print(
-                    f"\033[1mOVERLAP DETECTED> overlap with mother \033[0m {transformedMeshesNames[i]} {interMesh.vertexCount()}"
+        if _IsAReplica(self):
+            self.daughterVolumes[0]._checkInternalOverlaps(debugIO, nOverlapsDetected)
+            self.overlapChecked = True
+            return
+
+        jobs.extend((self, job) for job in self._getOverlapCheckJobs(coplanar, cullStatistics))
+        self.overlapChecked = True
+
+        if recursive:
+            for d in self.daughterVolumes:
+                if type(d.logicalVolume) is _pyg4ometry.geant4.AssemblyVolume:
+                    continue  # no specific overlap check - handled by the PV of an assembly
+                d.logicalVolume._collectOverlapCheckJobs(
+                    recursive, coplanar, debugIO, nOverlapsDetected, cullStatistics, jobs
                 )
-                self.mesh.addOverlapMesh([interMesh, _OverlapType.protrusion])
 
-        # coplanar with solid
-        # print 'coplanar with solid'
-        if coplanar:
-            for i in range(len(transformedMeshes)):
-                if debugIO:
-                    print(
-                        f"LogicalVolume.checkOverlaps> full daughter-mother coplanar test {transformedMeshesNames[i]}"
-                    ),
-
-                # cullCoplanar = self.mesh.localboundingmesh.coplanarIntersection(transformedBoundingMeshes[i])
-                # if cullCoplanar.vertexCount() == 0 :
-                #    continue
-                # print(self.mesh.localboundingmesh,transformedBoundingMeshes[i])
-                coplanarMesh = self.mesh.localmesh.coplanarIntersection(
-                    transformedMeshes[i]
-                )  # Need mother.coplanar(daughter) as typically mother is larger
-                if coplanarMesh.vertexCount() != 0:
-                    nOverlapsDetected[0] += 1
-                    print(
-                        f"\033[1mOVERLAP DETECTED> coplanar overlap between daughter and mother\033[0m {transformedMeshesNames[i]} {coplanarMesh.vertexCount()}"
-                    )
-                    self.mesh.addOverlapMesh([coplanarMesh, _OverlapType.coplanar])
+    def checkOverlaps(
+        self,
+        recursive=False,
+        coplanar=False,
+        debugIO=False,
+        printOut=True,
+        nOverlapsDetected=[0],
+        cullStatistics=None,
+        workers=None,
+    ):
+        """
+        Check based on the meshes in each logical volume if there are any geometrical overlaps. By
+        default, overlaps are checked between daughter volumes and with the mother volume itself (protrusion).
+        Coplanar overlaps may also be checked (default on).
+
+        Print out will be given for any overlaps detected and the visualiser will show the
+        colour coded overlaps.
+
+        With workers, the candidate checks for the whole tree are collected first and then
+        evaluated in a pool of processes. Meshes are sent to the processes as vertex and face
+        arrays.
+
+        :param recursive: bool - Whether to descend into the daughter volumes and check their contents also.
+        :param coplanar: bool - Whether to check for coplanar overlaps
+        :param debugIO: bool - Print out for every check made
+        :param printOut: bool - (internal) Whether to print out a summary of N overlaps detected
+        :param nOverlapsDetected: [int] - (internal) counter for recursion - ignore
+        :param cullStatistics: dict - (internal) number of checks culled and tested by the bounding box broad phase
+        :param workers: int or None - Number of processes to use for the mesh checks (None for serial in this process)
+        """
+        from pyg4ometry.geant4 import IsAReplica as _IsAReplica
+
+        if cullStatistics is None:
+            cullStatistics = {"culled": 0, "tested": 0}
+
+        if printOut:
+            print("LogicalVolume.checkOverlaps> ", self.name)
+
+        # return if overlaps already checked
+        if self.overlapChecked:
+            if debugIO:
+                print("Overlaps already checked - skipping")
+            return
+
+        if workers:
+            jobs = []
+            self._collectOverlapCheckJobs(
+                recursive, coplanar, debugIO, nOverlapsDetected, cullStatistics, jobs
+            )
+            results = _runOverlapCheckJobs([job for _, job in jobs], workers)
+            for (lv, job), resultMesh in zip(jobs, results):
+                lv._addOverlapCheckResult(job, resultMesh, nOverlapsDetected)
+
+            if printOut:
+                self._printOverlapSummary(nOverlapsDetected, cullStatistics)
+            return
+
+        if _IsAReplica(self):
+            self.daughterVolumes[0]._checkInternalOverlaps(debugIO, nOverlapsDetected)
+            self.overlapChecked = True
+            return
+
+        for job in self._getOverlapCheckJobs(coplanar, cullStatistics):
+            if debugIO:
+                print(f"LogicalVolume.checkOverlaps> full test for {job[3]}")
+            resultMesh = _overlapCheckOperation(job[0], job[1], job[2])
+            _log.info(
+                "LogicalVolume.checkOverlaps> %s %d %d"
+                % (job[3], resultMesh.vertexCount(), resultMesh.polygonCount())
+            )
+            self._addOverlapCheckResult(job, resultMesh, nOverlapsDetected)
 
         # recursively check entire tree
         if recursive:
@@ -828,13 +1007,23 @@ class LogicalVolume:
                     debugIO=debugIO,
                     printOut=False,
                     nOverlapsDetected=nOverlapsDetected,
+                    cullStatistics=cullStatistics,
                 )
 
         # ok this logical has been checked
         self.overlapChecked = True
 
         if printOut:
-            print(nOverlapsDetected[0], " overlaps detected")
+            self._printOverlapSummary(nOverlapsDetected, cullStatistics)
+
+    def _printOverlapSummary(self, nOverlapsDetected, cullStatistics):
+        print(nOverlapsDetected[0], " overlaps detected")
+        print(
+            cullStatistics["culled"],
+            " checks culled by bounding box,",
+            cullStatistics["tested"],
+            " checks tested",
+        )
 
     def setSolid(self, solid):
         """
@@ -1,4 +1,5 @@
 from .ReplicaVolume import ReplicaVolume as _ReplicaVolume
+from .ReplicaVolume import _instanceMeshes
 import pyg4ometry.geant4.solid as _solid
 from pyg4ometry.visualisation import Mesh as _Mesh
 from pyg4ometry.visualisation import VisualisationOptions as _VisOptions
@@ -9,6 +10,27 @@ import numpy as _np
 import logging as _log
 
 
+def _paramKey(paramData):
+    """
+    Hashable key of the evaluated values of the dimensions of a copy
+    """
+
+    def value(v):
+        if isinstance(v, str):
+            return v
+        if isinstance(v, (list, tuple)):
+            return tuple(value(e) for e in v)
+        try:
+            return float(v)
+        except (TypeError, ValueError):
+            return id(v)
+
+    return (
+        type(paramData).__name__,
+        *((k, value(v)) for k, v in sorted(vars(paramData).items())),
+    )
+
+
 class ParameterisedVolume(_ReplicaVolume):
     """ParametrisedVolume
     :param name: of parametrised volume
@@ -215,266 +237,256 @@ class ParameterisedVolume(_ReplicaVolume):
         # physical visualisation options
         self.visOptions = _VisOptions()
 
-        # Create parameterised meshes
-        self.meshes = self.createParameterisedMeshes()
+        # parameterised meshes are made when first used
+        self._uniqueMeshes = None
+        self._meshIndex = None
+
+    def _makeMeshes(self):
+        if self._uniqueMeshes is None:
+            self._uniqueMeshes, self._meshIndex = _instanceMeshes(self.createParameterisedMeshes())
+
+    @property
+    def transforms(self):
+        """
+        Rotation and position of each copy
+        """
+        return self._transforms
+
+    @transforms.setter
+    def transforms(self, transforms):
+        self._transforms = transforms
+
+    def _createSolid(self, paramData, i):
+        """
+        Solid of copy i with dimensions paramData, or None if paramData does not match the
+        type of the solid of the logical volume.
+        """
+        # box
+        if self.logicalVolume.solid.type == "Box" and isinstance(paramData, self.BoxDimensions):
+            solid = _solid.Box(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pX,
+                paramData.pY,
+                paramData.pZ,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Tubs" and isinstance(paramData, self.TubeDimensions):
+            solid = _solid.Tubs(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pRMin,
+                paramData.pRMax,
+                paramData.pDz,
+                paramData.pSPhi,
+                paramData.pDPhi,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                self.logicalVolume.solid.nslice,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Cons" and isinstance(paramData, self.ConeDimensions):
+            solid = _solid.Cons(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pRMin1,
+                paramData.pRMax1,
+                paramData.pRMin2,
+                paramData.pRMax2,
+                paramData.pDz,
+                paramData.pSPhi,
+                paramData.pDPhi,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                self.logicalVolume.solid.nslice,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Orb" and isinstance(paramData, self.OrbDimensions):
+            solid = _solid.Orb(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pRMax,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                self.logicalVolume.solid.nslice,
+                self.logicalVolume.solid.nstack,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Sphere" and isinstance(
+            paramData, self.SphereDimensions
+        ):
+            solid = _solid.Sphere(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pRMin,
+                paramData.pRMax,
+                paramData.pSPhi,
+                paramData.pDPhi,
+                paramData.pSTheta,
+                paramData.pDTheta,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                self.logicalVolume.solid.nslice,
+                self.logicalVolume.solid.nstack,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Torus" and isinstance(
+            paramData, self.TorusDimensions
+        ):
+            solid = _solid.Torus(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pRMin,
+                paramData.pRMax,
+                paramData.pRTor,
+                paramData.pSPhi,
+                paramData.pDPhi,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                self.logicalVolume.solid.nslice,
+                self.logicalVolume.solid.nstack,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Hype" and isinstance(paramData, self.HypeDimensions):
+            solid = _solid.Hype(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.innerRadius,
+                paramData.outerRadius,
+                paramData.innerStereo,
+                paramData.outerStereo,
+                paramData.lenZ,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                self.logicalVolume.solid.nslice,
+                self.logicalVolume.solid.nstack,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Para" and isinstance(paramData, self.ParaDimensions):
+            solid = _solid.Para(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pX,
+                paramData.pY,
+                paramData.pZ,
+                paramData.pAlpha,
+                paramData.pTheta,
+                paramData.pPhi,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Trd" and isinstance(paramData, self.TrdDimensions):
+            solid = _solid.Trd(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pX1,
+                paramData.pX2,
+                paramData.pY1,
+                paramData.pY2,
+                paramData.pZ,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Trap" and isinstance(paramData, self.TrapDimensions):
+            solid = _solid.Trap(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pDz,
+                paramData.pTheta,
+                paramData.pDPhi,
+                paramData.pDy1,
+                paramData.pDx1,
+                paramData.pDx2,
+                paramData.pAlp1,
+                paramData.pDy2,
+                paramData.pDx3,
+                paramData.pDx4,
+                paramData.pAlp2,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Polycone" and isinstance(
+            paramData, self.PolyconeDimensions
+        ):
+            solid = _solid.Polycone(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pSPhi,
+                paramData.pDPhi,
+                paramData.pZpl,
+                paramData.pRMin,
+                paramData.pRMax,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                self.logicalVolume.solid.nslice,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Polyhedra" and isinstance(
+            paramData, self.PolyhedraDimensions
+        ):
+            solid = _solid.Polyhedra(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pSPhi,
+                paramData.pDPhi,
+                paramData.numSide,
+                len(paramData.pZpl),
+                paramData.pZpl,
+                paramData.pRMin,
+                paramData.pRMax,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Ellipsoid" and isinstance(
+            paramData, self.EllipsoidDimensions
+        ):
+            solid = _solid.Ellipsoid(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pxSemiAxis,
+                paramData.pySemiAxis,
+                paramData.pzSemiAxis,
+                paramData.pzBottomCut,
+                paramData.pzTopCut,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                self.logicalVolume.solid.nslice,
+                self.logicalVolume.solid.nstack,
+                False,
+            )
+
+        else:
+            solid = None
+
+        return solid
 
     def createParameterisedMeshes(self):
+        """
+        Mesh of each copy (or None). Copies with identical dimensions share one mesh.
+        """
         meshes = []
+        shapes = {}
 
         for paramData, i in zip(self.paramData, range(0, int(self.ncopies), 1)):
-            # box
-            if self.logicalVolume.solid.type == "Box" and isinstance(paramData, self.BoxDimensions):
-                solid = _solid.Box(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pX,
-                    paramData.pY,
-                    paramData.pZ,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    False,
-                )
-
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Tubs" and isinstance(
-                paramData, self.TubeDimensions
-            ):
-                solid = _solid.Tubs(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pRMin,
-                    paramData.pRMax,
-                    paramData.pDz,
-                    paramData.pSPhi,
-                    paramData.pDPhi,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    self.logicalVolume.solid.nslice,
-                    False,
-                )
-
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Cons" and isinstance(
-                paramData, self.ConeDimensions
-            ):
-                solid = _solid.Cons(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pRMin1,
-                    paramData.pRMax1,
-                    paramData.pRMin2,
-                    paramData.pRMax2,
-                    paramData.pDz,
-                    paramData.pSPhi,
-                    paramData.pDPhi,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    self.logicalVolume.solid.nslice,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Orb" and isinstance(
-                paramData, self.OrbDimensions
-            ):
-                solid = _solid.Orb(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pRMax,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    self.logicalVolume.solid.nslice,
-                    self.logicalVolume.solid.nstack,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Sphere" and isinstance(
-                paramData, self.SphereDimensions
-            ):
-                solid = _solid.Sphere(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pRMin,
-                    paramData.pRMax,
-                    paramData.pSPhi,
-                    paramData.pDPhi,
-                    paramData.pSTheta,
-                    paramData.pDTheta,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    self.logicalVolume.solid.nslice,
-                    self.logicalVolume.solid.nstack,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Torus" and isinstance(
-                paramData, self.TorusDimensions
-            ):
-                solid = _solid.Torus(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pRMin,
-                    paramData.pRMax,
-                    paramData.pRTor,
-                    paramData.pSPhi,
-                    paramData.pDPhi,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    self.logicalVolume.solid.nslice,
-                    self.logicalVolume.solid.nstack,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Hype" and isinstance(
-                paramData, self.HypeDimensions
-            ):
-                solid = _solid.Hype(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.innerRadius,
-                    paramData.outerRadius,
-                    paramData.innerStereo,
-                    paramData.outerStereo,
-                    paramData.lenZ,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    self.logicalVolume.solid.nslice,
-                    self.logicalVolume.solid.nstack,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Para" and isinstance(
-                paramData, self.ParaDimensions
-            ):
-                solid = _solid.Para(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pX,
-                    paramData.pY,
-                    paramData.pZ,
-                    paramData.pAlpha,
-                    paramData.pTheta,
-                    paramData.pPhi,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Trd" and isinstance(
-                paramData, self.TrdDimensions
-            ):
-                solid = _solid.Trd(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pX1,
-                    paramData.pX2,
-                    paramData.pY1,
-                    paramData.pY2,
-                    paramData.pZ,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Trap" and isinstance(
-                paramData, self.TrapDimensions
-            ):
-                solid = _solid.Trap(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pDz,
-                    paramData.pTheta,
-                    paramData.pDPhi,
-                    paramData.pDy1,
-                    paramData.pDx1,
-                    paramData.pDx2,
-                    paramData.pAlp1,
-                    paramData.pDy2,
-                    paramData.pDx3,
-                    paramData.pDx4,
-                    paramData.pAlp2,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Polycone" and isinstance(
-                paramData, self.PolyconeDimensions
-            ):
-                solid = _solid.Polycone(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pSPhi,
-                    paramData.pDPhi,
-                    paramData.pZpl,
-                    paramData.pRMin,
-                    paramData.pRMax,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    self.logicalVolume.solid.nslice,
-                    False,
-                )
-
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Polyhedra" and isinstance(
-                paramData, self.PolyhedraDimensions
-            ):
-                solid = _solid.Polyhedra(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pSPhi,
-                    paramData.pDPhi,
-                    paramData.numSide,
-                    len(paramData.pZpl),
-                    paramData.pZpl,
-                    paramData.pRMin,
-                    paramData.pRMax,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Ellipsoid" and isinstance(
-                paramData, self.EllipsoidDimensions
-            ):
-                solid = _solid.Ellipsoid(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pxSemiAxis,
-                    paramData.pySemiAxis,
-                    paramData.pzSemiAxis,
-                    paramData.pzBottomCut,
-                    paramData.pzTopCut,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    self.logicalVolume.solid.nslice,
-                    self.logicalVolume.solid.nstack,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            else:
-                pass
+            key = _paramKey(paramData)
+            if key not in shapes:
+                solid = self._createSolid(paramData, i)
+                shapes[key] = None if solid is None else _Mesh(solid)
+            meshes.append(shapes[key])
 
         return meshes
 
@@ -488,6 +500,9 @@ class ParameterisedVolume(_ReplicaVolume):
         vMax = [-1e99, -1e99, -1e99]
 
         for trans, mesh in zip(self.transforms, self.meshes):
+            if mesh is None:
+                continue
+
             # transform daughter meshes to parent coordinates
             dvmrot = _trans.tbxyz2matrix(trans[0].eval())
             dvtra = _np.array(trans[1].eval())
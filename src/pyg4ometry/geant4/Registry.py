@@ -1,4 +1,5 @@
 from collections import defaultdict as _defaultdict
+import re as _re
 import pyg4ometry.exceptions as _exceptions
 from . import _Material as _mat
 from . import solid
@@ -11,6 +12,53 @@ def solidName(var):
         return var
 
 
+_identifierRegex = _re.compile(r"[A-Za-z_][A-Za-z_0-9]*")
+
+
+def _defineNamesUsedBy(var):
+    """
+    Names of the defines a solid parameter may refer to. This errs on the side of too many
+    names (any identifier in an expression string) as it is only used for invalidation.
+    """
+    import pyg4ometry.gdml.Defines as _Defines
+
+    if isinstance(var, str):
+        return set(_identifierRegex.findall(var))
+    elif isinstance(var, (list, tuple)):
+        names = set()
+        for v in var:
+            names |= _defineNamesUsedBy(v)
+        return names
+    elif isinstance(var, _Defines.ScalarBase):
+        return {var.name} | _defineNamesUsedBy(var.expression.expressionString)
+    elif isinstance(var, _Defines.VectorBase):
+        return {var.name} | _defineNamesUsedBy(
+            [var.x.expressionString, var.y.expressionString, var.z.expressionString]
+        )
+    else:
+        return set()
+
+
+def _solidDefineNames(solid):
+    """
+    Names of the defines used directly by the parameters of a solid.
+    """
+    names = set()
+    for varName in getattr(solid, "varNames", []):
+        # gdml tessellated solids list the vertex define names themselves
+        names |= _defineNamesUsedBy(getattr(solid, varName, varName))
+    return names
+
+
+def _solidConstituents(solid):
+    """
+    Solids (or solid names) a boolean, scaled or multi-union solid is built from.
+    """
+    constituents = [getattr(solid, a) for a in ("obj1", "obj2", "solid") if hasattr(solid, a)]
+    constituents += getattr(solid, "objects", [])
+    return constituents
+
+
 def removeprefix(string: str, prefix: str, /) -> str:
     if string.startswith(prefix):
         return string[len(prefix) :]
@@ -64,6 +112,15 @@ class Registry:
         self.logicalVolumeUsageCountDict = _defaultdict(int)  # named logical usage in physical
 
         self.editedSolids = []  # Solids changed post-initialisation
+        self.editedLogicalVolumes = []  # Logical volumes whose solid changed post-initialisation
+
+        self.defineValueCache = {}  # define name -> evaluated value
+        self.defineDependencies = {}  # define name -> variable names used by the define
+        self.defineDependents = _defaultdict(set)  # name -> names of defines using it
+        self.solidDefines = {}  # solid name -> names of the defines used by the solid
+        self.defineSolids = _defaultdict(set)  # define name -> names of solids using it
+        self.solidDependents = _defaultdict(set)  # solid name -> names of solids built from it
+        self.solidLogicalVolumes = _defaultdict(set)  # solid name -> names of lvs using it
 
         self.expressionParser = None
 
@@ -101,6 +158,15 @@ class Registry:
         self.logicalVolumeUsageCountDict.clear()
 
         self.editedSolids = []
+        self.editedLogicalVolumes = []
+
+        self.defineValueCache.clear()
+        self.defineDependencies.clear()
+        self.defineDependents.clear()
+        self.solidDefines.clear()
+        self.defineSolids.clear()
+        self.solidDependents.clear()
+        self.solidLogicalVolumes.clear()
 
     def getExpressionParser(self):
         if not self.expressionParser:
@@ -111,9 +177,118 @@ class Registry:
         return self.expressionParser
 
     def registerSolidEdit(self, solid):
-        if solid.name in self.solidDict:
+        if solid.name in self.solidDict and solid.name not in self.editedSolids:
             self.editedSolids.append(solid.name)
 
+    def registerLogicalVolumeEdit(self, logicalVolume):
+        if (
+            logicalVolume.name in self.logicalVolumeDict
+            and logicalVolume.name not in self.editedLogicalVolumes
+        ):
+            self.editedLogicalVolumes.append(logicalVolume.name)
+
+    def getDefineValue(self, define, evaluate):
+        """
+        Return the cached value of a registered define, calling evaluate to compute it
+        if it is not cached. The variables of the define are recorded so the value can be
+        invalidated when any of them changes.
+
+        :param define: registered define
+        :type define: ScalarBase, VectorBase
+        :param evaluate: function computing the value of the define
+        :type evaluate: callable
+        """
+        try:
+            return self.defineValueCache[define.name]
+        except KeyError:
+            pass
+
+        value = evaluate()
+
+        variables = set(define.variables())
+        for v in self.defineDependencies.get(define.name, set()) - variables:
+            self.defineDependents[v].discard(define.name)
+        for v in variables:
+            self.defineDependents[v].add(define.name)
+        self.defineDependencies[define.name] = variables
+
+        self.defineValueCache[define.name] = value
+        return value
+
+    def indexSolidDefines(self, solid):
+        """
+        Record the defines used by a registered solid, and which solids it is built from,
+        so the solid is found directly when one of the defines changes (see
+        invalidateDefine). Called when a solid is added and when its parameters are set.
+        Unregistered constituents are included in the defines of the solid.
+
+        :param solid: registered solid
+        :type solid: SolidBase
+        """
+        names = _solidDefineNames(solid)
+        toVisit = _solidConstituents(solid)
+        visited = set()
+        while toVisit:
+            c = toVisit.pop()
+            cName = solidName(c)
+            if cName in self.solidDict:
+                self.solidDependents[cName].add(solid.name)
+            elif not isinstance(c, str) and id(c) not in visited:
+                visited.add(id(c))
+                names |= _solidDefineNames(c)
+                toVisit.extend(_solidConstituents(c))
+
+        for n in self.solidDefines.get(solid.name, set()) - names:
+            self.defineSolids[n].discard(solid.name)
+        for n in names:
+            self.defineSolids[n].add(solid.name)
+        self.solidDefines[solid.name] = names
+
+    def invalidateDefine(self, name):
+        """
+        Drop the cached value of a define and of all defines that depend on it directly
+        or indirectly. Solids and logical volumes using any of these defines are flagged
+        as edited so their meshes are regenerated.
+
+        :param name: name of the define that changed
+        :type name: str
+        :return: names of all invalidated defines
+        :rtype: set
+        """
+        invalidated = set()
+        toVisit = [name]
+        while toVisit:
+            n = toVisit.pop()
+            if n in invalidated:
+                continue
+            invalidated.add(n)
+            self.defineValueCache.pop(n, None)
+            toVisit.extend(self.defineDependents.get(n, ()))
+
+        # solids using the defines and the solids built from them
+        solids = set()
+        toVisit = [s for n in invalidated for s in self.defineSolids.get(n, ())]
+        while toVisit:
+            s = toVisit.pop()
+            if s in solids:
+                continue
+            solids.add(s)
+            toVisit.extend(self.solidDependents.get(s, ()))
+
+        # each name is flagged once, however many times it has been edited
+        editedSolids = set(self.editedSolids)
+        editedLogicalVolumes = set(self.editedLogicalVolumes)
+        for s in sorted(solids):
+            if s in self.solidDict and s not in editedSolids:
+                editedSolids.add(s)
+                self.editedSolids.append(s)
+            for lvName in sorted(self.solidLogicalVolumes.get(s, ())):
+                if lvName in self.logicalVolumeDict and lvName not in editedLogicalVolumes:
+                    editedLogicalVolumes.add(lvName)
+                    self.editedLogicalVolumes.append(lvName)
+
+        return invalidated
+
     def addMaterial(self, material, dontWarnIfAlreadyAdded=False):
         """
         Register a material with this registry.
@@ -196,6 +371,7 @@ class Registry:
 
         self.solidTypeCountDict[solid.type] += 1
         self.solidNameCount[solid.name] += 1
+        self.indexSolidDefines(solid)
 
     def transferSolid(self, solid, incrementRenameDict={}, userRenameDict=None):
         """
@@ -227,6 +403,7 @@ class Registry:
 
         self.solidTypeCountDict[solid.type] += 1
         self.solidNameCount[solid.name] += 1
+        self.indexSolidDefines(solid)
 
     def addLogicalVolume(self, volume):
         """
@@ -245,6 +422,7 @@ class Registry:
         # material doesn't exist for an assembly volume, which this function is also used for
         if volume.type == "logical":
             self.materialUsageCount[volume.material.name] += 1
+            self.solidLogicalVolumes[solidName(volume.solid)].add(volume.name)
         elif volume.type == "assembly":
             self.assemblyVolumeDict[volume.name] = volume
             self.assemblyVolumeNameCount[volume.name] += 1
@@ -273,6 +451,8 @@ class Registry:
 
         self.logicalVolumeDict[volume.name] = volume
         volume.registry = self
+        if volume.type == "logical":
+            self.solidLogicalVolumes[solidName(volume.solid)].add(volume.name)
 
         self.logicalVolumeNameCount[volume.name] += 1
         self.volumeTypeCountDict["logicalVolume"] += 1
@@ -385,6 +565,10 @@ class Registry:
         else:
             self.defineDict[define.name] = define
 
+        # a define may already have been used under this name (e.g. resolved as a unit)
+        if define.name in self.defineDependents:
+            self.invalidateDefine(define.name)
+
         self.defineNameCount[define.name] += 1
 
         return define.name  # why do we need this?
@@ -412,6 +596,9 @@ class Registry:
         self.defineDict[define.name] = define
         define.registry = self
 
+        if define.name in self.defineDependents:
+            self.invalidateDefine(define.name)
+
         self.defineNameCount[define.name] += 1
 
     def transferDefines(self, var, otherRegistry, incrementRenameDict={}, userRenameDict=None):
@@ -854,6 +1041,30 @@ class Registry:
     def getWorldVolume(self):
         return self.worldVolume
 
+    def meshAll(self, parallel=True, workers=None):
+        """
+        Make the meshes of all logical volumes now, rather than when each is first used
+        (see config.lazyMeshing).
+
+        :param parallel: mesh the solids in a pool of processes first
+        :type parallel: bool
+        :param workers: number of processes, os.cpu_count() by default
+        :type workers: int
+        """
+        from .solid.MeshCache import meshSolids as _meshSolids
+
+        volumes = [
+            lv
+            for lv in self.logicalVolumeDict.values()
+            if lv.type == "logical" and not lv.isMeshed()
+        ]
+
+        if parallel:
+            _meshSolids([lv.solid for lv in volumes], workers)
+
+        for lv in volumes:
+            lv.reMesh()
+
     def printStats(self):
         print(self.solidTypeCountDict)
         print(self.logicalVolumeUsageCountDict)
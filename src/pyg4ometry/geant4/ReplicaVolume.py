@@ -10,6 +10,25 @@ import copy as _copy
 import logging as _log
 
 
+def _instanceMeshes(meshes):
+    """
+    Distinct meshes of a list in which meshes may be repeated (or None) and the index
+    of each entry in the distinct meshes (-1 for None) as an int32 array.
+    """
+    uniqueMeshes = []
+    index = {}
+    meshIndex = _np.empty(len(meshes), dtype=_np.int32)
+    for i, mesh in enumerate(meshes):
+        if mesh is None:
+            meshIndex[i] = -1
+            continue
+        if id(mesh) not in index:
+            index[id(mesh)] = len(uniqueMeshes)
+            uniqueMeshes.append(mesh)
+        meshIndex[i] = index[id(mesh)]
+    return uniqueMeshes, meshIndex
+
+
 class ReplicaVolume(_PhysicalVolume):
     """
     ReplicaVolume: G4PVReplica
@@ -68,8 +87,49 @@ class ReplicaVolume(_PhysicalVolume):
         # physical visualisation options
         self.visOptions = _VisOptions()
 
-        # Create replica meshes
-        [self.meshes, self.transforms] = self.createReplicaMeshes()
+        # replica meshes are made when first used
+        self._uniqueMeshes = None
+        self._meshIndex = None
+        self._transforms = None
+
+    def _makeMeshes(self):
+        if self._uniqueMeshes is None:
+            meshes, transforms = self.createReplicaMeshes()
+            self._uniqueMeshes, self._meshIndex = _instanceMeshes(meshes)
+            self._transforms = _np.array(transforms, dtype=float).reshape(-1, 2, 3)
+
+    @property
+    def meshes(self):
+        """
+        Mesh of each replica, made when first used. Replicas of the same shape share one
+        mesh, see uniqueMeshes and meshIndex.
+        """
+        self._makeMeshes()
+        return [self._uniqueMeshes[i] if i >= 0 else None for i in self._meshIndex]
+
+    @property
+    def uniqueMeshes(self):
+        """
+        Distinct meshes of the replicas
+        """
+        self._makeMeshes()
+        return self._uniqueMeshes
+
+    @property
+    def meshIndex(self):
+        """
+        Index in uniqueMeshes of the mesh of each replica (-1 for no mesh), an int32 array
+        """
+        self._makeMeshes()
+        return self._meshIndex
+
+    @property
+    def transforms(self):
+        """
+        Rotation and translation of each replica, an array (n, 2, 3)
+        """
+        self._makeMeshes()
+        return self._transforms
 
     def GetAxisName(self):
         names = {1: "kXAxis", 2: "kYAxis", 3: "kZAxis", 4: "kRho", 5: "kPhi"}
@@ -159,14 +219,11 @@ class ReplicaVolume(_PhysicalVolume):
                 transforms.append([rot, trans])
                 meshes.append(self.logicalVolume.mesh)
 
-                # if daughter contains a replica
+                # if daughter contains a replica (its meshes are shared by all replicas)
                 if len(self.logicalVolume.daughterVolumes) == 1:
-                    if isinstance(self.logicalVolume.daughterVolumes[0], ReplicaVolume):
-                        [
-                            daughter_meshes,
-                            daughter_transforms,
-                        ] = self.logicalVolume.daughterVolumes[0].createReplicaMeshes()
-                        for m, t in zip(daughter_meshes, daughter_transforms):
+                    daughter = self.logicalVolume.daughterVolumes[0]
+                    if isinstance(daughter, ReplicaVolume):
+                        for m, t in zip(daughter.meshes, daughter.transforms):
                             meshes.append(m)
                             transforms.append(
                                 [rot, _np.array(trans) + _np.array(t[1])]
@@ -340,6 +397,9 @@ class ReplicaVolume(_PhysicalVolume):
         vMax = [-1e99, -1e99, -1e99]
 
         for trans, mesh in zip(self.transforms, self.meshes):
+            if mesh is None:
+                continue
+
             # transform daughter meshes to parent coordinates
             dvmrot = _trans.tbxyz2matrix(trans[0])
             dvtra = _np.array(trans[1])
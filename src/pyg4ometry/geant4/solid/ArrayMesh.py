@@ -0,0 +1,247 @@
+import logging as _log
+import multiprocessing as _multiprocessing
+import numpy as _np
+
+from pyg4ometry import config as _config
+from pyg4ometry.meshutils import aabbCandidatePairs as _aabbCandidatePairs
+
+# vertices closer than this are merged (the same tolerance as Surface_mesh.toCGALSurfaceMesh)
+_mergeDecimals = 11
+_mergeOffset = 1.23456789
+
+
+def polygonsToArrays(*blocks):
+    """
+    Merge blocks of polygons into shared vertex and face arrays.
+
+    :param blocks: polygon coordinates, each block an array (M, k, 3) of M polygons with k vertices
+    :type blocks: numpy.ndarray
+    :returns: vertices (N, 3) float64 and a list of faces (M, k) int32, one per non-empty block
+
+    Coincident vertices (to 1e-11) are merged and kept in order of first use.
+    """
+    blocks = [_np.asarray(b, dtype=float) for b in blocks]
+    blocks = [b for b in blocks if b.size != 0]
+    if len(blocks) == 0:
+        return _np.zeros((0, 3)), []
+
+    points = _np.concatenate([b.reshape(-1, 3) for b in blocks])
+
+    key = _np.where(_np.abs(points) < 10.0**-_mergeDecimals, 0.0, points)
+    key = _np.round(key + _mergeOffset, _mergeDecimals)
+    _, first, inverse = _np.unique(key, axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+
+    # renumber the unique vertices in order of first use
+    order = _np.argsort(first)
+    rank = _np.empty_like(order)
+    rank[order] = _np.arange(len(order))
+    vertices = points[first[order]]
+    indices = rank[inverse].astype(_np.int32)
+
+    faces = []
+    start = 0
+    for b in blocks:
+        n = b.shape[0] * b.shape[1]
+        faces.append(indices[start : start + n].reshape(b.shape[0], b.shape[1]))
+        start += n
+
+    return vertices, faces
+
+
+def meshFromArrays(vertices, faces):
+    """
+    Mesh of the configured backend from vertex and face arrays.
+
+    :param vertices: vertex positions (N, 3)
+    :type vertices: numpy.ndarray
+    :param faces: convex faces as vertex indices, an array (M, k) or a list of them
+    :type faces: numpy.ndarray or list
+    """
+    vertices = _np.asarray(vertices, dtype=float)
+    if isinstance(faces, _np.ndarray):
+        faces = [faces]
+    faces = [_np.asarray(f) for f in faces if len(f) != 0]
+
+    if _config.meshing == _config.meshingType.pycsg:
+        from pyg4ometry.pycsg.core import CSG as _CSG
+        from pyg4ometry.pycsg.geom import Vertex as _Vertex
+        from pyg4ometry.pycsg.geom import Polygon as _Polygon
+
+        # pycsg flips vertices in place so each polygon has its own
+        coords = vertices.tolist()
+        polygons = [
+            _Polygon([_Vertex(coords[i]) for i in face]) for f in faces for face in f.tolist()
+        ]
+        return _CSG.fromPolygons(polygons)
+    else:
+        from pyg4ometry.pycgal.core import CSG as _CSG
+
+        return _CSG.fromArrays(vertices, [f.astype(_np.int32, copy=False) for f in faces])
+
+
+def concatenateMeshes(meshes):
+    """
+    Single mesh made of the faces of all the meshes, which must not overlap.
+
+    :param meshes: meshes to concatenate
+    :type meshes: list
+    """
+    from pyg4ometry.visualisation.Mesh import _meshToArrays, _meshFromArrays
+
+    arrays = [_meshToArrays(m) for m in meshes]
+    offsets = _np.cumsum([0] + [len(v) for v, _ in arrays[:-1]])
+    vertices = _np.concatenate([_np.asarray(v, dtype=float).reshape(-1, 3) for v, _ in arrays])
+
+    if all(isinstance(f, _np.ndarray) for _, f in arrays):
+        faces = _np.concatenate([f.reshape(-1, 3) + o for (_, f), o in zip(arrays, offsets)])
+        return _meshFromArrays(vertices, faces.astype(_np.int32))
+
+    faces = [[int(i + o) for i in face] for (_, f), o in zip(arrays, offsets) for face in f]
+    return _meshFromArrays(vertices, faces)
+
+
+def _unionWorker(vertices1, faces1, vertices2, faces2):
+    """
+    Process pool worker for unionMeshes. Meshes are passed and returned as arrays.
+    """
+    from pyg4ometry.visualisation.Mesh import _meshToArrays, _meshFromArrays
+
+    mesh = _meshFromArrays(vertices1, faces1).union(_meshFromArrays(vertices2, faces2))
+    return _meshToArrays(mesh)
+
+
+def _unionExecutor(workers):
+    """
+    Pool of forked processes for the unions of unionMeshes, so the workers inherit any
+    runtime changes to the configuration (e.g. config.meshing). None, to unite serially,
+    if workers is not set or processes can't be forked.
+    """
+    if not workers:
+        return None
+    if "fork" not in _multiprocessing.get_all_start_methods():
+        _log.warning("Processes cannot be forked, uniting meshes serially")
+        return None
+
+    from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+
+    return _ProcessPoolExecutor(
+        max_workers=workers, mp_context=_multiprocessing.get_context("fork")
+    )
+
+
+def _isExactMesh(mesh):
+    # pycgal EPECK meshes, whose coordinates would be rounded to doubles as arrays
+    isExact = getattr(mesh, "isExact", None)
+    return isExact is not None and isExact()
+
+
+def _unionPairs(pairs, executor):
+    """
+    Union of each pair of meshes, in the executor if there is more than one pair and
+    an executor is given. Meshes are passed to the executor as double coordinate arrays,
+    so pairs with an exact (EPECK) mesh are united in this process to stay exact.
+    """
+    if executor is None or len(pairs) < 2:
+        return [m1.union(m2) for m1, m2 in pairs]
+
+    from pyg4ometry.visualisation.Mesh import _meshToArrays, _meshFromArrays
+
+    futures = {
+        k: executor.submit(_unionWorker, *_meshToArrays(m1), *_meshToArrays(m2))
+        for k, (m1, m2) in enumerate(pairs)
+        if not (_isExactMesh(m1) or _isExactMesh(m2))
+    }
+    return [
+        _meshFromArrays(*futures[k].result()) if k in futures else m1.union(m2)
+        for k, (m1, m2) in enumerate(pairs)
+    ]
+
+
+def unionMeshes(meshes, workers=None):
+    """
+    Union of a list of meshes.
+
+    :param meshes: meshes to unite, at least one
+    :type meshes: list
+    :param workers: number of processes for the unions (None for serial in this process)
+    :type workers: int
+
+    Meshes are grouped by overlapping axis-aligned bounding boxes. The groups do not
+    overlap, so they are concatenated rather than united. Each group is reduced as a
+    balanced tree of pairwise unions between neighbours along the direction of largest
+    spread, where a pair with disjoint bounding boxes is again concatenated. The unions
+    at each level of the trees are independent and are made in one pool of forked
+    processes with workers, or serially if processes can't be forked. Unions of exact
+    (EPECK) meshes are always made in this process, so the result is as exact as the
+    serial reduction.
+    """
+    # circular import
+    from pyg4ometry.geant4.LogicalVolume import _meshesAABB
+
+    if len(meshes) == 0:
+        msg = "No meshes to unite"
+        raise ValueError(msg)
+    if len(meshes) == 1:
+        return meshes[0]
+
+    tolerance = _config.overlapBoundingBoxTolerance
+    aabbs = _meshesAABB(meshes)
+
+    # connected groups of overlapping (or touching) bounding boxes
+    parents = list(range(len(meshes)))
+
+    def root(i):
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    for i, j in _aabbCandidatePairs(aabbs, tolerance):
+        parents[root(j)] = root(i)
+
+    members = {}
+    for i in range(len(meshes)):
+        members.setdefault(root(i), []).append(i)
+
+    groups = []
+    for indices in members.values():
+        centres = aabbs[indices].mean(axis=1)
+        axis = int(_np.argmax(centres.std(axis=0)))
+        order = _np.argsort(centres[:, axis], kind="stable")
+        groups.append([[meshes[indices[k]], aabbs[indices[k]]] for k in order])
+
+    # one pool for all the levels of the trees
+    executor = _unionExecutor(workers)
+    try:
+        while any(len(group) > 1 for group in groups):
+            pairs = []
+            slots = []
+            for ig, group in enumerate(groups):
+                reduced = []
+                for k in range(0, len(group) - 1, 2):
+                    (mesh1, aabb1), (mesh2, aabb2) = group[k], group[k + 1]
+                    aabb = _np.array(
+                        [_np.minimum(aabb1[0], aabb2[0]), _np.maximum(aabb1[1], aabb2[1])]
+                    )
+                    if _np.any(aabb1[0] > aabb2[1] + tolerance) or _np.any(
+                        aabb2[0] > aabb1[1] + tolerance
+                    ):
+                        reduced.append([concatenateMeshes([mesh1, mesh2]), aabb])
+                    else:
+                        pairs.append((mesh1, mesh2))
+                        slots.append((ig, len(reduced)))
+                        reduced.append([None, aabb])
+                if len(group) % 2 == 1:
+                    reduced.append(group[-1])
+                groups[ig] = reduced
+
+            for (ig, k), mesh in zip(slots, _unionPairs(pairs, executor)):
+                groups[ig][k][0] = mesh
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if len(groups) == 1:
+        return groups[0][0][0]
+    return concatenateMeshes([group[0][0] for group in groups])
@@ -1,17 +1,7 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
-
-if _config.meshing == _config.meshingType.pycsg:
-    from pyg4ometry.pycsg.core import CSG as _CSG
-    from pyg4ometry.pycsg.geom import Vector as _Vector
-    from pyg4ometry.pycsg.geom import Vertex as _Vertex
-    from pyg4ometry.pycsg.geom import Polygon as _Polygon
-elif _config.meshing == _config.meshingType.cgal_sm:
-    from pyg4ometry.pycgal.core import CSG as _CSG
-    from pyg4ometry.pycgal.geom import Vector as _Vector
-    from pyg4ometry.pycgal.geom import Vertex as _Vertex
-    from pyg4ometry.pycgal.geom import Polygon as _Polygon
+from .ArrayMesh import meshFromArrays as _meshFromArrays
 
 import numpy as _np
 
@@ -140,6 +130,12 @@ class Cons(_SolidBase):
         )
 
     def mesh(self):
+        return _meshFromArrays(*self.meshArrays())
+
+    def meshArrays(self):
+        """
+        Surface as vertex and face arrays of the equivalent GenericPolyhedra.
+        """
         _log.info("cons.antlr>")
 
         import pyg4ometry.gdml.Units as _Units  # TODO move circular import
@@ -174,6 +170,4 @@ class Cons(_SolidBase):
             "rad",
             addRegistry=False,
         )
-        return ps.mesh()
-
-        return mesh
+        return ps.meshArrays()
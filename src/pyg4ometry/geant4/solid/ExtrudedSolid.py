@@ -8,7 +8,7 @@ if _config.meshing == _config.meshingType.pycsg:
     from pyg4ometry.pycsg.geom import Vector as _Vector
     from pyg4ometry.pycsg.geom import Vertex as _Vertex
     from pyg4ometry.pycsg.geom import Polygon as _Polygon
-elif _config.meshing == _config.meshingType.cgal_sm:
+elif _config.meshing in (_config.meshingType.cgal_sm, _config.meshingType.cgal_epick):
     from pyg4ometry.pycgal.core import CSG as _CSG
     from pyg4ometry.pycgal.core import PolygonProcessing as _PolygonProcessing
     from pyg4ometry.pycgal.geom import Vector as _Vector
@@ -1,6 +1,7 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
+from .ArrayMesh import meshFromArrays as _meshFromArrays
 from .GenericPolyhedra import GenericPolyhedra as _GenericPolyhedra
 
 import logging as _log
@@ -79,6 +80,12 @@ class GenericPolycone(_SolidBase):
             raise ValueError(msg)
 
     def mesh(self):
+        return _meshFromArrays(*self.meshArrays())
+
+    def meshArrays(self):
+        """
+        Surface as vertex and face arrays of the equivalent GenericPolyhedra.
+        """
         _log.info("genericpolycone.antlr>")
 
         import pyg4ometry.gdml.Units as _Units  # TODO move circular import
@@ -104,4 +111,4 @@ class GenericPolycone(_SolidBase):
             addRegistry=False,
         )
 
-        return ps.mesh()
+        return ps.meshArrays()
@@ -1,20 +1,9 @@
-from ... import config as _config
-
 from .SolidBase import SolidBase as _SolidBase
-
-if _config.meshing == _config.meshingType.pycsg:
-    from pyg4ometry.pycsg.core import CSG as _CSG
-    from pyg4ometry.pycsg.geom import Vector as _Vector
-    from pyg4ometry.pycsg.geom import Vertex as _Vertex
-    from pyg4ometry.pycsg.geom import Polygon as _Polygon
-elif _config.meshing == _config.meshingType.cgal_sm:
-    from pyg4ometry.pycgal.core import CSG as _CSG
-    from pyg4ometry.pycgal.core import PolygonProcessing as _PolygonProcessing
-    from pyg4ometry.pycgal.geom import Vector as _Vector
-    from pyg4ometry.pycgal.geom import Vertex as _Vertex
-    from pyg4ometry.pycgal.geom import Polygon as _Polygon
+from .ArrayMesh import meshFromArrays as _meshFromArrays
+from .ArrayMesh import polygonsToArrays as _polygonsToArrays
 
 import pyg4ometry.pycgal as _pycgal
+from pyg4ometry.pycgal.core import PolygonProcessing as _PolygonProcessing
 
 import logging as _log
 import numpy as _np
@@ -88,6 +77,14 @@ class GenericPolyhedra(_SolidBase):
             raise ValueError(msg)
 
     def mesh(self):
+        _log.info("genericpolyhedra.pycsgmesh>")
+
+        return _meshFromArrays(*self.meshArrays())
+
+    def meshArrays(self):
+        """
+        Surface of the solid as vertex and face arrays, see ArrayMesh.polygonsToArrays.
+        """
         _log.info("genericpolyhedra.antlr>")
 
         import pyg4ometry.gdml.Units as _Units  # TODO move circular import
@@ -98,97 +95,56 @@ class GenericPolyhedra(_SolidBase):
         pSPhi = self.evaluateParameter(self.pSPhi) * auval
         pDPhi = self.evaluateParameter(self.pDPhi) * auval
         numSide = int(self.evaluateParameter(self.numSide))
-        pR = [val * luval for val in self.evaluateParameter(self.pR)]
-        pZ = [val * luval for val in self.evaluateParameter(self.pZ)]
+        pR = _np.array([val * luval for val in self.evaluateParameter(self.pR)], dtype=float)
+        pZ = _np.array([val * luval for val in self.evaluateParameter(self.pZ)], dtype=float)
 
         dPhi = pDPhi / numSide
 
-        zrList = [[z, r] for z, r in zip(pZ, pR)]
-        zrList.reverse()
-        zrArray = _np.array(zrList)
-
-        zrListConvex = _PolygonProcessing.decomposePolygon2d(zrArray)
-
-        # def plotConvex() :
-        #     import matplotlib.pyplot as _plt
-        #     _plt.figure(1)
-        #     _plt.plot(pZ,pR)
-        #
-        #     for cvPolygon in zrListConvex:
-        #         _plt.plot(cvPolygon[:,0],cvPolygon[:,1])
-
-        # plotConvex()
-
-        polygons = []
-
-        for i in range(0, len(pZ), 1):
-            i1 = i
-            i2 = (i + 1) % len(pZ)
-
-            zMin = pZ[i1]
-            zMax = pZ[i2]
-
-            for j in range(0, numSide, 1):
-                j1 = j
-                j2 = j + 1
-
-                phi1 = dPhi * j1 + pSPhi
-                phi2 = dPhi * j2 + pSPhi
-
-                xZMinP1 = pR[i1] * _np.cos(phi1)
-                yZMinP1 = pR[i1] * _np.sin(phi1)
-
-                xZMaxP1 = pR[i2] * _np.cos(phi1)
-                yZMaxP1 = pR[i2] * _np.sin(phi1)
-
-                xZMinP2 = pR[i1] * _np.cos(phi2)
-                yZMinP2 = pR[i1] * _np.sin(phi2)
-
-                xZMaxP2 = pR[i2] * _np.cos(phi2)
-                yZMaxP2 = pR[i2] * _np.sin(phi2)
-
-                vFace = []
-                if pR[i1] != 0:
-                    vFace.append(_Vertex([xZMinP1, yZMinP1, zMin]))
-                vFace.append(_Vertex([xZMaxP1, yZMaxP1, zMax]))
-                if pR[i2] != 0:
-                    vFace.append(_Vertex([xZMaxP2, yZMaxP2, zMax]))
-                vFace.append(_Vertex([xZMinP2, yZMinP2, zMin]))
-
-                vFace.reverse()
-                if pR[i1] == 0 and pR[i2] == 0:
-                    pass
-                else:
-                    polygons.append(_Polygon(vFace))
+        # side faces between profile points i1 and i2 for each of the numSide segments
+        phi = dPhi * _np.arange(numSide + 1) + pSPhi
+        cosPhi = _np.cos(phi)
+        sinPhi = _np.sin(phi)
+
+        def points(r, z):
+            # [profile edge, phi, xyz]
+            x = r[:, None] * cosPhi
+            y = r[:, None] * sinPhi
+            return _np.stack([x, y, _np.broadcast_to(z[:, None], x.shape)], axis=-1)
+
+        i2 = _np.roll(_np.arange(len(pZ)), -1)
+        zMin = points(pR, pZ)
+        zMax = points(pR[i2], pZ[i2])
+        zMinP1, zMinP2 = zMin[:, :-1], zMin[:, 1:]
+        zMaxP1, zMaxP2 = zMax[:, :-1], zMax[:, 1:]
+
+        # a zero radius collapses the edge to a point on the axis
+        r1 = pR != 0
+        r2 = pR[i2] != 0
+        quad = r1 & r2
+        apex1 = ~r1 & r2
+        apex2 = r1 & ~r2
+
+        blocks = [
+            _np.stack([zMinP2, zMaxP2, zMaxP1, zMinP1], axis=2)[quad].reshape(-1, 4, 3),
+            _np.stack([zMinP2, zMaxP2, zMaxP1], axis=2)[apex1].reshape(-1, 3, 3),
+            _np.stack([zMinP2, zMaxP1, zMinP1], axis=2)[apex2].reshape(-1, 3, 3),
+        ]
 
         if pDPhi != 2 * _np.pi:
-            for cvPolygon in zrListConvex:
-                vPhi1 = []
-                for cvPolygonPoint in cvPolygon:
-                    z = cvPolygonPoint[0]
-                    r = cvPolygonPoint[1]
+            zrArray = _np.stack([pZ, pR], axis=1)[::-1]
+            zrListConvex = _PolygonProcessing.decomposePolygon2d(zrArray)
 
-                    xP1 = r * _np.cos(pSPhi)
-                    yP1 = r * _np.sin(pSPhi)
-
-                    vPhi1.append(_Vertex([xP1, yP1, z]))
-
-                vPhi1.reverse()
-                polygons.append(_Polygon(vPhi1))
-
-                vPhi2 = []
-                for cvPolygonPoint in reversed(cvPolygon):
-                    z = cvPolygonPoint[0]
-                    r = cvPolygonPoint[1]
-
-                    xP2 = r * _np.cos(pSPhi + pDPhi)
-                    yP2 = r * _np.sin(pSPhi + pDPhi)
-
-                    vPhi2.append(_Vertex([xP2, yP2, z]))
+            for cvPolygon in zrListConvex:
+                cvPolygon = _np.asarray(cvPolygon, dtype=float)
+                z = cvPolygon[:, 0]
+                r = cvPolygon[:, 1]
 
-                vPhi2.reverse()
-                polygons.append(_Polygon(vPhi2))
+                vPhi1 = _np.stack([r * _np.cos(pSPhi), r * _np.sin(pSPhi), z], axis=-1)
+                blocks.append(vPhi1[None, ::-1])
 
-        mesh = _CSG.fromPolygons(polygons)
+                vPhi2 = _np.stack(
+                    [r * _np.cos(pSPhi + pDPhi), r * _np.sin(pSPhi + pDPhi), z], axis=-1
+                )
+                blocks.append(vPhi2[None])
 
-        return mesh
+        return _polygonsToArrays(*blocks)
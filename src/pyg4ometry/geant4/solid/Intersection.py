@@ -1,4 +1,5 @@
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
 from pyg4ometry.transformation import *
 
 import logging as _log
@@ -73,9 +74,9 @@ class Intersection(_SolidBase):
 
         # get meshes
         _log.info("Intersection.mesh> mesh1")
-        m1 = obj1.mesh()
+        m1 = _cachedMesh(obj1)
         _log.info("Intersection.mesh> mesh2")
-        m2 = obj2.mesh().clone()
+        m2 = _cachedMesh(obj2)
 
         # apply transform to second mesh
         m2.rotate(rot[0], -rad2deg(rot[1]))
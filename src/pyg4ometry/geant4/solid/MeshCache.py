@@ -0,0 +1,445 @@
+import hashlib as _hashlib
+import numbers as _numbers
+import os as _os
+import re as _re
+import logging as _log
+import multiprocessing as _multiprocessing
+import tempfile as _tempfile
+from collections import OrderedDict as _OrderedDict
+
+import numpy as _np
+
+from pyg4ometry import config as _config
+
+_identifierRegex = _re.compile(r"[A-Za-z_][A-Za-z_0-9]*")
+
+# attributes of a solid that do not change its mesh
+_ignoredAttributes = {"_name", "name", "registry", "dependents", "obj2mesh", "_meshCacheKey"}
+
+# rough memory cost of a mesh used to apply config.meshCacheMemory
+_bytesPerVertex = 128
+_bytesPerPolygon = 256
+
+# guard against walking arbitrarily deep object graphs when building a key
+_maxKeyDepth = 64
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+def _valueKey(value, registry, depth):
+    import pyg4ometry.gdml.Defines as _Defines
+    from .SolidBase import SolidBase as _SolidBase
+
+    if depth > _maxKeyDepth:
+        raise _Uncacheable()
+    depth += 1
+
+    if value is None or isinstance(value, bool):
+        return value
+    elif isinstance(value, _numbers.Real):
+        return float(value)
+    elif isinstance(value, str):
+        # an expression string depends on the current value of the defines it uses
+        if registry is None:
+            return value
+        defines = [
+            (n, _valueKey(registry.defineDict[n], registry, depth))
+            for n in _identifierRegex.findall(value)
+            if n in registry.defineDict
+        ]
+        return (value, tuple(defines)) if defines else value
+    elif isinstance(value, _Defines.ScalarBase):
+        return ("scalar", float(value.eval()))
+    elif isinstance(value, _Defines.VectorBase):
+        return ("vector", tuple(float(v) for v in value.eval()))
+    elif isinstance(value, _Defines.Matrix):
+        return ("matrix", _valueKey(value.eval(), registry, depth))
+    elif isinstance(value, _np.ndarray):
+        if value.dtype == _np.object_:
+            return ("array", value.shape, _valueKey(value.tolist(), registry, depth))
+        return ("array", value.shape, value.dtype.str, value.tobytes())
+    elif isinstance(value, (list, tuple)):
+        return tuple(_valueKey(v, registry, depth) for v in value)
+    elif isinstance(value, dict):
+        return tuple((k, _valueKey(v, registry, depth)) for k, v in value.items())
+    elif isinstance(value, _SolidBase):
+        return _solidKey(value, depth)
+    elif hasattr(value, "toVerticesAndPolygons"):
+        # meshes kept on a solid are derived from its parameters
+        return None
+    elif hasattr(value, "__dict__"):
+        return (type(value).__name__, _valueKey(vars(value), registry, depth))
+
+    try:
+        hash(value)
+    except TypeError:
+        raise _Uncacheable()
+    return value
+
+
+def _solidKey(solid, depth=0):
+    attributes = dict(vars(solid))
+
+    # parameters are keyed by value so e.g. "2*a" and 20 give the same key
+    for varName in getattr(solid, "varNames", []):
+        if hasattr(solid, varName):
+            attributes.pop("_" + varName, None)
+            attributes[varName] = solid.evaluateParameter(getattr(solid, varName))
+
+    # boolean operands may be given by name
+    if hasattr(solid, "object1"):
+        attributes["obj1"] = solid.object1()
+        attributes["obj2"] = solid.object2()
+
+    items = [
+        (name, _valueKey(value, solid.registry, depth))
+        for name, value in sorted(attributes.items())
+        if name not in _ignoredAttributes
+    ]
+    return (type(solid).__name__, tuple(items))
+
+
+def meshCacheKey(solid):
+    """
+    Key identifying the mesh of a solid by content: the type of the solid, the evaluated
+    value of all of its parameters (including the values of the defines they use), its
+    nslice/nstack and the meshing backend. Solids with the same key have the same mesh.
+    None is returned for a solid whose parameters can't be hashed.
+
+    :param solid: solid to make a key for
+    :type solid: SolidBase
+    """
+    try:
+        return (_config.backendName(), _solidKey(solid))
+    except _Uncacheable:
+        return None
+
+
+def _meshMemory(mesh):
+    return mesh.vertexCount() * _bytesPerVertex + mesh.polygonCount() * _bytesPerPolygon
+
+
+class MeshCache:
+    """
+    In memory least recently used cache of solid meshes keyed by meshCacheKey. The total
+    (approximate) memory of the cached meshes is kept below config.meshCacheMemory.
+    """
+
+    def __init__(self):
+        self.meshes = _OrderedDict()  # key -> [mesh, memory]
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.meshes)
+
+    def get(self, key):
+        entry = self.meshes.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.meshes.move_to_end(key)
+        return entry[0]
+
+    def add(self, key, mesh):
+        """
+        Add a mesh to the cache, evicting the least recently used meshes to stay within
+        config.meshCacheMemory. Returns False if the mesh is too large to be kept.
+        """
+        memory = _meshMemory(mesh)
+        if memory > _config.meshCacheMemory:
+            return False
+
+        if key in self.meshes:
+            self.memory -= self.meshes.pop(key)[1]
+        self.meshes[key] = [mesh, memory]
+        self.memory += memory
+
+        while self.memory > _config.meshCacheMemory:
+            _, (_, evictedMemory) = self.meshes.popitem(last=False)
+            self.memory -= evictedMemory
+
+        return True
+
+    def remove(self, key):
+        entry = self.meshes.pop(key, None)
+        if entry is not None:
+            self.memory -= entry[1]
+
+    def invalidate(self, solid):
+        """
+        Drop the cached mesh of a solid and of all solids built from it (e.g. Booleans)
+        after one of its parameters has been changed.
+        """
+        key = solid.__dict__.pop("_meshCacheKey", None)
+        if key is not None:
+            self.remove(key)
+        for dependent in getattr(solid, "dependents", []):
+            self.invalidate(dependent)
+
+    def clear(self):
+        self.meshes.clear()
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+
+
+meshCache = MeshCache()
+
+
+class MeshDiskCache:
+    """
+    Persistent cache of solid meshes in a directory, shared between sessions. Each mesh
+    is stored as binary vertex and face index arrays in a file named by a hash of its
+    meshCacheKey (which includes the meshing backend), the cache format version and the
+    pyg4ometry version, so meshes made by other versions are not used. The modification
+    time of a file is updated when it is used so pruning removes the least recently used
+    meshes.
+
+    :param directory: cache directory, created if needed
+    :type directory: str
+    """
+
+    suffix = ".npz"
+
+    # increment when the file format or the mesh generated for any solid changes
+    formatVersion = 2
+
+    def __init__(self, directory):
+        self.directory = _os.path.expanduser(directory)
+
+    @classmethod
+    def digest(cls, key):
+        """
+        Stable hash of a mesh cache key, the cache format version and the pyg4ometry
+        version, or None if the key does not have a stable form.
+        """
+        import pyg4ometry as _pyg4ometry
+
+        text = repr((cls.formatVersion, _pyg4ometry.__version__, key))
+        # objects only identified by their address can't be matched between sessions
+        if " at 0x" in text:
+            return None
+        return _hashlib.sha256(text.encode()).hexdigest()
+
+    def path(self, digest):
+        return _os.path.join(self.directory, digest + self.suffix)
+
+    def contains(self, key):
+        """
+        Whether a mesh is cached for the key, without loading it
+        """
+        digest = self.digest(key)
+        return digest is not None and _os.path.isfile(self.path(digest))
+
+    def load(self, key):
+        from pyg4ometry.visualisation.Mesh import _meshFromArrays
+
+        digest = self.digest(key)
+        if digest is None:
+            return None
+
+        path = self.path(digest)
+        try:
+            with _np.load(path) as data:
+                vertices = data["vertices"]
+                indices = data["indices"]
+                counts = data["counts"]
+        except (OSError, KeyError, ValueError):
+            return None
+
+        _os.utime(path)
+        if len(counts) != 0 and (counts == counts[0]).all():
+            return _meshFromArrays(vertices, indices.reshape(len(counts), counts[0]))
+        faces = _np.split(indices, _np.cumsum(counts)[:-1])
+        return _meshFromArrays(vertices, [f.tolist() for f in faces])
+
+    def save(self, key, mesh):
+        from pyg4ometry.visualisation.Mesh import _meshToArrays
+
+        digest = self.digest(key)
+        if digest is None:
+            return
+
+        vertices, faces = _meshToArrays(mesh)
+        if isinstance(faces, _np.ndarray):
+            counts = _np.full(len(faces), faces.shape[1], dtype=_np.int32)
+            indices = faces.astype(_np.int32).ravel()
+        else:
+            counts = _np.array([len(f) for f in faces], dtype=_np.int32)
+            indices = _np.array([i for f in faces for i in f], dtype=_np.int32)
+
+        # write then rename so a partly written file is never read
+        try:
+            _os.makedirs(self.directory, exist_ok=True)
+            fd, tmpPath = _tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+            with _os.fdopen(fd, "wb") as f:
+                _np.savez(f, vertices=vertices, counts=counts, indices=indices)
+            _os.replace(tmpPath, self.path(digest))
+        except OSError as err:
+            _log.warning("MeshDiskCache.save> cannot write mesh to %s : %s", self.directory, err)
+
+    def entries(self):
+        """
+        List of (path, size, modification time) of the cached meshes, oldest first.
+        """
+        if not _os.path.isdir(self.directory):
+            return []
+
+        entries = []
+        for fileName in _os.listdir(self.directory):
+            if fileName.endswith(self.suffix):
+                path = _os.path.join(self.directory, fileName)
+                stat = _os.stat(path)
+                entries.append((path, stat.st_size, stat.st_mtime))
+        return sorted(entries, key=lambda e: e[2])
+
+    def info(self):
+        """
+        Number of cached meshes and their total size in bytes
+        """
+        entries = self.entries()
+        return len(entries), sum(e[1] for e in entries)
+
+    def prune(self, maxSize=None):
+        """
+        Remove the least recently used meshes until the cache is at most maxSize bytes.
+
+        :param maxSize: size in bytes to prune to, config.meshDiskCacheSize by default
+        :type maxSize: int
+        :return: number of meshes removed
+        :rtype: int
+        """
+        if maxSize is None:
+            maxSize = _config.meshDiskCacheSize
+
+        entries = self.entries()
+        size = sum(e[1] for e in entries)
+        nRemoved = 0
+        for path, fileSize, _ in entries:
+            if size <= maxSize:
+                break
+            _os.remove(path)
+            size -= fileSize
+            nRemoved += 1
+        return nRemoved
+
+    def clear(self):
+        """
+        Remove all cached meshes
+
+        :return: number of meshes removed
+        :rtype: int
+        """
+        entries = self.entries()
+        for path, _, _ in entries:
+            _os.remove(path)
+        return len(entries)
+
+
+def cachedMesh(solid):
+    """
+    Mesh of a solid, taken from the mesh cache if an identical solid has already been
+    meshed, or from the on-disk cache in config.meshDiskCacheDir if set. A mesh kept in
+    the cache is cloned so the returned mesh may be modified freely.
+
+    :param solid: solid to mesh
+    :type solid: SolidBase
+    """
+    diskCache = None
+    if _config.meshDiskCacheDir:
+        diskCache = MeshDiskCache(_config.meshDiskCacheDir)
+
+    if _config.meshCacheMemory <= 0 and diskCache is None:
+        return solid.mesh()
+
+    key = meshCacheKey(solid)
+    if key is None:
+        return solid.mesh()
+
+    solid._meshCacheKey = key
+    mesh = meshCache.get(key)
+    if mesh is not None:
+        return mesh.clone()
+
+    _log.info("MeshCache.cachedMesh> miss %s", solid.name)
+    if diskCache is not None:
+        mesh = diskCache.load(key)
+    if mesh is None:
+        mesh = solid.mesh()
+        if diskCache is not None:
+            diskCache.save(key, mesh)
+
+    if meshCache.add(key, mesh):
+        return mesh.clone()
+    return mesh
+
+
+# solids to be meshed by the worker processes of meshSolids (inherited when forked)
+_workerSolids = []
+
+
+def _meshSolidWorker(index):
+    from pyg4ometry.visualisation.Mesh import _meshToArrays
+
+    try:
+        return _meshToArrays(_workerSolids[index].mesh())
+    except Exception:
+        # the solid is meshed again (and the error reported) when it is used
+        return None
+
+
+def meshSolids(solids, workers=None):
+    """
+    Mesh solids in a pool of processes and add the meshes to the mesh cache (and the
+    on-disk cache if used), so they are taken from the cache when the solids are used.
+    Identical solids and solids already in the cache are only meshed once. Nothing is
+    done if the mesh cache is disabled or processes can't be forked.
+
+    :param solids: solids to mesh
+    :type solids: list of SolidBase
+    :param workers: number of processes, os.cpu_count() by default
+    :type workers: int
+    """
+    from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+    from pyg4ometry.visualisation.Mesh import _meshFromArrays
+
+    if _config.meshCacheMemory <= 0 or "fork" not in _multiprocessing.get_all_start_methods():
+        return
+
+    diskCache = None
+    if _config.meshDiskCacheDir:
+        diskCache = MeshDiskCache(_config.meshDiskCacheDir)
+
+    keys = {}
+    for solid in solids:
+        key = meshCacheKey(solid)
+        if key is None or key in keys or key in meshCache.meshes:
+            continue
+        if diskCache is not None and diskCache.contains(key):
+            continue
+        keys[key] = solid
+
+    if not keys:
+        return
+
+    _workerSolids[:] = keys.values()
+    try:
+        with _ProcessPoolExecutor(
+            max_workers=workers, mp_context=_multiprocessing.get_context("fork")
+        ) as executor:
+            results = list(executor.map(_meshSolidWorker, range(len(_workerSolids))))
+    finally:
+        _workerSolids.clear()
+
+    for key, arrays in zip(keys, results):
+        if arrays is None:
+            continue
+        mesh = _meshFromArrays(*arrays)
+        if diskCache is not None:
+            diskCache.save(key, mesh)
+        meshCache.add(key, mesh)
@@ -1,4 +1,7 @@
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
+from .ArrayMesh import unionMeshes as _unionMeshes
+from pyg4ometry import config as _config
 import pyg4ometry.exceptions
 from pyg4ometry.transformation import *
 
@@ -51,16 +54,8 @@ class MultiUnion(_SolidBase):
     def mesh(self):
         _log.info("MultiUnion.pycsgmesh>")
 
-        result = self.objects[0].mesh()
-        tra2 = self.transformations[0]
-        rot = tbxyz2axisangle(tra2[0].eval())
-        tlate = tra2[1].eval()
-        result.rotate(rot[0], -rad2deg(rot[1]))
-        result.translate(tlate)
-
-        for idx, (solid, tra2) in enumerate(
-            zip(self.objects[1:], self.transformations[1:]), start=1
-        ):
+        meshes = []
+        for idx, (solid, tra2) in enumerate(zip(self.objects, self.transformations)):
             # tranformation
             rot = tbxyz2axisangle(tra2[0].eval())
             tlate = tra2[1].eval()
@@ -68,13 +63,12 @@ class MultiUnion(_SolidBase):
 
             # get meshes
             _log.info("union.mesh> mesh %s" % str(idx))
-            mesh = solid.mesh()
+            mesh = _cachedMesh(solid)
 
-            # apply transform to second mesh
+            # apply transform
             mesh.rotate(rot[0], -rad2deg(rot[1]))
             mesh.translate(tlate)
+            meshes.append(mesh)
 
-            _log.info("MultiUnion.mesh> union")
-            result = result.union(mesh)
-
-        return result
+        _log.info("MultiUnion.mesh> union")
+        return _unionMeshes(meshes, workers=_config.meshUnionWorkers)
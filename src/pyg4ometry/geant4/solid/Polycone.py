@@ -1,6 +1,7 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
+from .ArrayMesh import meshFromArrays as _meshFromArrays
 from .GenericPolyhedra import GenericPolyhedra as _GenericPolyhedra
 
 import logging as _log
@@ -80,6 +81,12 @@ class Polycone(_SolidBase):
         )
 
     def mesh(self):
+        return _meshFromArrays(*self.meshArrays())
+
+    def meshArrays(self):
+        """
+        Surface as vertex and face arrays of the equivalent GenericPolyhedra.
+        """
         _log.info("polycone.pycsgmesh>")
 
         _log.info("polycone.antlr>")
@@ -124,4 +131,4 @@ class Polycone(_SolidBase):
             addRegistry=False,
         )
 
-        return ps.mesh()
+        return ps.meshArrays()
@@ -1,5 +1,6 @@
 from .GenericPolyhedra import GenericPolyhedra as _GenericPolyhedra
 from .SolidBase import SolidBase as _SolidBase
+from .ArrayMesh import meshFromArrays as _meshFromArrays
 import logging as _log
 import numpy as _np
 
@@ -93,6 +94,12 @@ class Polyhedra(_SolidBase):
         )
 
     def mesh(self):
+        return _meshFromArrays(*self.meshArrays())
+
+    def meshArrays(self):
+        """
+        Surface as vertex and face arrays of the equivalent GenericPolyhedra.
+        """
         _log.info("polyhedra.antlr>")
 
         import pyg4ometry.gdml.Units as _Units  # TODO move circular import
@@ -138,4 +145,4 @@ class Polyhedra(_SolidBase):
             addRegistry=False,
         )
 
-        return ps.mesh()
+        return ps.meshArrays()
@@ -1,4 +1,5 @@
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
 from pyg4ometry.pycsg.core import CSG as _CSG
 
 import logging as _log
@@ -54,7 +55,7 @@ class Scaled(_SolidBase):
         pY = self.evaluateParameter(self.pY)
         pZ = self.evaluateParameter(self.pZ)
 
-        mesh = self.solid.mesh()
+        mesh = _cachedMesh(self.solid)
         mesh.scale([pX, pY, pZ])
 
         _log.info("scaled.pycsgmesh> mesh")
@@ -1,5 +1,6 @@
 import numpy as _np
 from pyg4ometry import config as _config
+from .MeshCache import meshCache as _meshCache
 
 
 class SolidBase:
@@ -71,7 +72,10 @@ class SolidBase:
         # to a list of edited solids in the registry. This forces a fresh
         # meshing for visualisation, instead of using the cached mesh.
         self.registry.registerSolidEdit(self)
+        _meshCache.invalidate(self)
         setattr(self, "_" + attribute, value)
+        if self.registry.solidDict.get(self.name) is self:
+            self.registry.indexSolidDefines(self)
 
     def _getProperty(self, attribute):
         # print "Getting: %s" %str(attribute) # DEBUG
@@ -1,17 +1,8 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
-
-if _config.meshing == _config.meshingType.pycsg:
-    from pyg4ometry.pycsg.core import CSG as _CSG
-    from pyg4ometry.pycsg.geom import Vector as _Vector
-    from pyg4ometry.pycsg.geom import Vertex as _Vertex
-    from pyg4ometry.pycsg.geom import Polygon as _Polygon
-elif _config.meshing == _config.meshingType.cgal_sm:
-    from pyg4ometry.pycgal.core import CSG as _CSG
-    from pyg4ometry.pycgal.geom import Vector as _Vector
-    from pyg4ometry.pycgal.geom import Vertex as _Vertex
-    from pyg4ometry.pycgal.geom import Polygon as _Polygon
+from .ArrayMesh import meshFromArrays as _meshFromArrays
+from .ArrayMesh import polygonsToArrays as _polygonsToArrays
 
 import sys as _sys
 from copy import deepcopy as _dc
@@ -127,14 +118,33 @@ class Sphere(_SolidBase):
         )
 
     def mesh(self):
+        tBefore = _time.process_time()
+        vertices, faces = self.meshArrays()
+        tAfter = _time.process_time()
+
+        mBefore = _resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss
+        mesh = _meshFromArrays(vertices, faces)
+        mAfter = _resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss
+        _log.info(
+            "Sphere.pycsgmesh> profile {} {} {} {} {}".format(
+                self.nstack,
+                self.nslice,
+                mesh.getNumberPolys(),
+                mAfter - mBefore,
+                tAfter - tBefore,
+            )
+        )
+        return mesh
+
+    def meshArrays(self):
         """
+        Surface of the sphere as vertex and face arrays, see ArrayMesh.polygonsToArrays.
+
         working off
         0 < phi < 2pi
         0 < theta < pi
         """
 
-        tBefore = _time.process_time()
-
         _log.info("sphere.antlr>")
         import pyg4ometry.gdml.Units as _Units  # TODO move circular import
 
@@ -148,180 +158,67 @@ class Sphere(_SolidBase):
         pSTheta = self.evaluateParameter(self.pSTheta) * auval
         pDTheta = self.evaluateParameter(self.pDTheta) * auval
 
-        _log.info("Sphere.pycsgmesh>")
-
-        polygons = []
+        _log.info("Sphere.meshArrays>")
 
         # changed from d - s/ st
 
         dPhi = (pDPhi) / self.nslice
         dTheta = (pDTheta) / self.nstack
 
-        for i in range(0, self.nslice, 1):
-            i1 = i
-            i2 = i + 1
-
-            p1 = dPhi * i1 + pSPhi
-            p2 = dPhi * i2 + pSPhi
-
-            for j in range(0, self.nstack, 1):
-                j1 = j
-                j2 = j + 1
-
-                t1 = dTheta * j1 + pSTheta
-                t2 = dTheta * j2 + pSTheta
-
-                if pRmin != 0:
-                    xRMinP1T1 = pRmin * _np.sin(t1) * _np.cos(p1)
-                    yRMinP1T1 = pRmin * _np.sin(t1) * _np.sin(p1)
-                    zRMinP1T1 = pRmin * _np.cos(t1)
-
-                    xRMinP2T1 = pRmin * _np.sin(t1) * _np.cos(p2)
-                    yRMinP2T1 = pRmin * _np.sin(t1) * _np.sin(p2)
-                    zRMinP2T1 = pRmin * _np.cos(t1)
-
-                    xRMinP1T2 = pRmin * _np.sin(t2) * _np.cos(p1)
-                    yRMinP1T2 = pRmin * _np.sin(t2) * _np.sin(p1)
-                    zRMinP1T2 = pRmin * _np.cos(t2)
-
-                    xRMinP2T2 = pRmin * _np.sin(t2) * _np.cos(p2)
-                    yRMinP2T2 = pRmin * _np.sin(t2) * _np.sin(p2)
-                    zRMinP2T2 = pRmin * _np.cos(t2)
-                else:
-                    xRMinP1T1 = 0.0
-                    yRMinP1T1 = 0.0
-                    zRMinP1T1 = 0.0
-
-                    xRMinP2T1 = 0.0
-                    yRMinP2T1 = 0.0
-                    zRMinP2T1 = 0.0
-
-                    xRMinP1T2 = 0.0
-                    yRMinP1T2 = 0.0
-                    zRMinP1T2 = 0.0
-
-                    xRMinP2T2 = 0.0
-                    yRMinP2T2 = 0.0
-                    zRMinP2T2 = 0.0
-
-                xRMaxP1T1 = pRmax * _np.sin(t1) * _np.cos(p1)
-                yRMaxP1T1 = pRmax * _np.sin(t1) * _np.sin(p1)
-                zRMaxP1T1 = pRmax * _np.cos(t1)
-
-                xRMaxP2T1 = pRmax * _np.sin(t1) * _np.cos(p2)
-                yRMaxP2T1 = pRmax * _np.sin(t1) * _np.sin(p2)
-                zRMaxP2T1 = pRmax * _np.cos(t1)
-
-                xRMaxP1T2 = pRmax * _np.sin(t2) * _np.cos(p1)
-                yRMaxP1T2 = pRmax * _np.sin(t2) * _np.sin(p1)
-                zRMaxP1T2 = pRmax * _np.cos(t2)
-
-                xRMaxP2T2 = pRmax * _np.sin(t2) * _np.cos(p2)
-                yRMaxP2T2 = pRmax * _np.sin(t2) * _np.sin(p2)
-                zRMaxP2T2 = pRmax * _np.cos(t2)
-
-                ###########################
-                # Curved sphere faces
-                ###########################
-                if t1 == 0:  # if north pole (triangles)
-                    vCurv = []
-                    vCurv.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                    vCurv.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                    vCurv.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                    # print "outer  north pole",len(polygons)
-                    polygons.append(_Polygon(vCurv))
-                elif t2 == _np.pi:  # if south pole (triangleS)
-                    vCurv = []
-                    vCurv.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                    vCurv.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                    vCurv.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                    # print "outer south pole",len(polygons)
-                    polygons.append(_Polygon(vCurv))
-                else:  # normal curved quad
-                    vCurv = []
-                    vCurv.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                    vCurv.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                    vCurv.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                    vCurv.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                    # print "outer normal quad",len(polygons)
-                    polygons.append(_Polygon(vCurv))
-
-                if pRmin != 0:
-                    if t1 == 0:  # if north pole (triangles)
-                        vCurv = []
-                        vCurv.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        vCurv.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                        vCurv.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        # print "inner north pole", len(polygons)
-                        polygons.append(_Polygon(vCurv))
-                    elif t2 == _np.pi:  # if south pole
-                        vCurv = []
-                        vCurv.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                        vCurv.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        vCurv.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        # print "inner south pole", len(polygons)
-                        polygons.append(_Polygon(vCurv))
-                    else:  # normal curved quad
-                        vCurv = []
-                        vCurv.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                        vCurv.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        vCurv.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                        vCurv.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        # print "inner quad ", len(polygons)
-                        polygons.append(_Polygon(vCurv))
-                if pDPhi != 2 * _np.pi:
-                    if i == 0 and pSPhi != 0:
-                        vEnd = []
-                        if pRmin != 0:
-                            vEnd.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        vEnd.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                        vEnd.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                        vEnd.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                        # print "theta low end ", len(polygons)
-                        polygons.append(_Polygon(vEnd))
-
-                    if i == self.nslice - 1 and pSPhi + pDPhi != 2 * _np.pi:
-                        vEnd = []
-                        if pRmin != 0:
-                            vEnd.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                        vEnd.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                        vEnd.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                        vEnd.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        # print "theta low end ", len(polygons)
-                        polygons.append(_Polygon(vEnd))
-
-                if pDTheta != _np.pi:
-                    if j == 0 and pSTheta != 0:
-                        vEnd = []
-                        if pRmin != 0:
-                            vEnd.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        vEnd.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                        vEnd.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                        vEnd.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                        # print "theta low end ", len(polygons)
-                        polygons.append(_Polygon(vEnd))
-
-                    if j == self.nstack - 1 and pSTheta + pDTheta != _np.pi:
-                        vEnd = []
-                        if pRmin != 0:
-                            vEnd.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                        vEnd.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        vEnd.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                        vEnd.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                        # print "theta low end ", len(polygons)
-                        polygons.append(_Polygon(vEnd))
-        tAfter = _time.process_time()
+        phi = dPhi * _np.arange(self.nslice + 1) + pSPhi
+        theta = dTheta * _np.arange(self.nstack + 1) + pSTheta
+        cosPhi = _np.cos(phi)[:, None]
+        sinPhi = _np.sin(phi)[:, None]
 
-        mBefore = _resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss
-        mesh = _CSG.fromPolygons(polygons)
-        mAfter = _resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss
-        _log.info(
-            "Sphere.pycsgmesh> profile {} {} {} {} {}".format(
-                self.nstack,
-                self.nslice,
-                mesh.getNumberPolys(),
-                mAfter - mBefore,
-                tAfter - tBefore,
-            )
-        )
-        return mesh
+        def cells(r):
+            # [slice (phi), stack (theta), xyz] for the corners P1T1, P1T2, P2T2, P2T1
+            rSinTheta = r * _np.sin(theta)
+            z = _np.broadcast_to(r * _np.cos(theta), (self.nslice + 1, self.nstack + 1))
+            g = _np.stack([rSinTheta * cosPhi, rSinTheta * sinPhi, z], axis=-1)
+            return g[:-1, :-1], g[:-1, 1:], g[1:, 1:], g[1:, :-1]
+
+        maxP1T1, maxP1T2, maxP2T2, maxP2T1 = cells(pRmax)
+        minP1T1, minP1T2, minP2T2, minP2T1 = cells(pRmin)
+
+        # stacks touching a pole are triangles
+        north = theta[:-1] == 0
+        south = ~north & (theta[1:] == _np.pi)
+        quad = ~north & ~south
+
+        def faces(corners, mask):
+            return _np.stack(corners, axis=2)[:, mask].reshape(-1, len(corners), 3)
+
+        blocks = []
+
+        # curved sphere faces
+        blocks.append(faces([maxP1T1, maxP1T2, maxP2T2], north))
+        blocks.append(faces([maxP1T1, maxP2T2, maxP2T1], south))
+        blocks.append(faces([maxP1T1, maxP1T2, maxP2T2, maxP2T1], quad))
+
+        if pRmin != 0:
+            blocks.append(faces([minP2T2, minP1T2, minP1T1], north))
+            blocks.append(faces([minP2T1, minP2T2, minP1T1], south))
+            blocks.append(faces([minP2T1, minP2T2, minP1T2, minP1T1], quad))
+
+        # phi and theta ends, the inner edge collapses to the origin without an inner radius
+        inner = slice(None) if pRmin != 0 else slice(1, None)
+
+        if pDPhi != 2 * _np.pi:
+            if pSPhi != 0:
+                corners = [minP1T1[0], minP1T2[0], maxP1T2[0], maxP1T1[0]]
+                blocks.append(_np.stack(corners[inner], axis=1))
+
+            if pSPhi + pDPhi != 2 * _np.pi:
+                corners = [minP2T1[-1], maxP2T1[-1], maxP2T2[-1], minP2T2[-1]]
+                blocks.append(_np.stack(corners[inner], axis=1))
+
+        if pDTheta != _np.pi:
+            if pSTheta != 0:
+                corners = [minP1T1[:, 0], maxP1T1[:, 0], maxP2T1[:, 0], minP2T1[:, 0]]
+                blocks.append(_np.stack(corners[inner], axis=1))
+
+            if pSTheta + pDTheta != _np.pi:
+                corners = [minP1T2[:, -1], minP2T2[:, -1], maxP2T2[:, -1], maxP1T2[:, -1]]
+                blocks.append(_np.stack(corners[inner], axis=1))
+
+        return _polygonsToArrays(*blocks)
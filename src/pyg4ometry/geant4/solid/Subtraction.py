@@ -1,5 +1,6 @@
 from ... import config as _config
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
 import pyg4ometry.exceptions
 from pyg4ometry.transformation import *
 
@@ -62,9 +63,9 @@ class Subtraction(_SolidBase):
 
         # get meshes
         _log.info("subtraction.mesh> mesh1")
-        m1 = obj1.mesh()
+        m1 = _cachedMesh(obj1)
         _log.info("subtraction.mesh> mesh2")
-        m2 = obj2.mesh().clone()
+        m2 = _cachedMesh(obj2)
 
         m2.rotate(rot[0], -rad2deg(rot[1]))
         m2.translate(tlate)
@@ -1,17 +1,8 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
-
-if _config.meshing == _config.meshingType.pycsg:
-    from pyg4ometry.pycsg.core import CSG as _CSG
-    from pyg4ometry.pycsg.geom import Vector as _Vector
-    from pyg4ometry.pycsg.geom import Vertex as _Vertex
-    from pyg4ometry.pycsg.geom import Polygon as _Polygon
-elif _config.meshing == _config.meshingType.cgal_sm:
-    from pyg4ometry.pycgal.core import CSG as _CSG
-    from pyg4ometry.pycgal.geom import Vector as _Vector
-    from pyg4ometry.pycgal.geom import Vertex as _Vertex
-    from pyg4ometry.pycgal.geom import Polygon as _Polygon
+from .ArrayMesh import meshFromArrays as _meshFromArrays
+from .ArrayMesh import polygonsToArrays as _polygonsToArrays
 
 import numpy as _np
 import logging as _log
@@ -107,6 +98,14 @@ class Torus(_SolidBase):
         )
 
     def mesh(self):
+        _log.info("torus.pycsgmesh>")
+
+        return _meshFromArrays(*self.meshArrays())
+
+    def meshArrays(self):
+        """
+        Surface of the torus as vertex and face arrays, see ArrayMesh.polygonsToArrays.
+        """
         _log.info("torus.antlr>")
 
         import pyg4ometry.gdml.Units as _Units  # TODO move circular import
@@ -120,8 +119,7 @@ class Torus(_SolidBase):
         pSPhi = self.evaluateParameter(self.pSPhi) * auval
         pDPhi = self.evaluateParameter(self.pDPhi) * auval
 
-        _log.info("torus.pycsgmesh>")
-        polygons = []
+        _log.info("torus.meshArrays>")
 
         nstack = self.nstack
         nslice = self.nslice
@@ -129,84 +127,36 @@ class Torus(_SolidBase):
         dTheta = 2 * _np.pi / nstack
         dPhi = pDPhi / nslice
 
-        for j0 in range(nslice):
-            j1 = j0
-            j2 = j0 + 1
-
-            for i0 in range(nstack):
-                i1 = i0
-                i2 = i0 + 1
-
-                xRMaxP1T1 = (pRtor + (pRmax * _np.cos(dTheta * i1))) * _np.cos(pSPhi + dPhi * j1)
-                yRMaxP1T1 = (pRtor + (pRmax * _np.cos(dTheta * i1))) * _np.sin(pSPhi + dPhi * j1)
-                zRMaxP1T1 = pRmax * _np.sin(dTheta * i1)
-
-                xRMaxP1T2 = (pRtor + (pRmax * _np.cos(dTheta * i2))) * _np.cos(pSPhi + dPhi * j1)
-                yRMaxP1T2 = (pRtor + (pRmax * _np.cos(dTheta * i2))) * _np.sin(pSPhi + dPhi * j1)
-                zRMaxP1T2 = pRmax * _np.sin(dTheta * i2)
-
-                xRMaxP2T2 = (pRtor + (pRmax * _np.cos(dTheta * i2))) * _np.cos(pSPhi + dPhi * j2)
-                yRMaxP2T2 = (pRtor + (pRmax * _np.cos(dTheta * i2))) * _np.sin(pSPhi + dPhi * j2)
-                zRMaxP2T2 = pRmax * _np.sin(dTheta * i2)
-
-                xRMaxP2T1 = (pRtor + (pRmax * _np.cos(dTheta * i1))) * _np.cos(pSPhi + dPhi * j2)
-                yRMaxP2T1 = (pRtor + (pRmax * _np.cos(dTheta * i1))) * _np.sin(pSPhi + dPhi * j2)
-                zRMaxP2T1 = pRmax * _np.sin(dTheta * i1)
-
-                vertices_outer = []
-                vertices_outer.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                vertices_outer.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                vertices_outer.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                vertices_outer.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                vertices_outer.reverse()
-                polygons.append(_Polygon(vertices_outer))
-
-                xRMinP1T1 = (pRtor + (pRmin * _np.cos(dTheta * i1))) * _np.cos(pSPhi + dPhi * j1)
-                yRMinP1T1 = (pRtor + (pRmin * _np.cos(dTheta * i1))) * _np.sin(pSPhi + dPhi * j1)
-                zRMinP1T1 = pRmin * _np.sin(dTheta * i1)
-
-                xRMinP1T2 = (pRtor + (pRmin * _np.cos(dTheta * i2))) * _np.cos(pSPhi + dPhi * j1)
-                yRMinP1T2 = (pRtor + (pRmin * _np.cos(dTheta * i2))) * _np.sin(pSPhi + dPhi * j1)
-                zRMinP1T2 = pRmin * _np.sin(dTheta * i2)
-
-                xRMinP2T2 = (pRtor + (pRmin * _np.cos(dTheta * i2))) * _np.cos(pSPhi + dPhi * j2)
-                yRMinP2T2 = (pRtor + (pRmin * _np.cos(dTheta * i2))) * _np.sin(pSPhi + dPhi * j2)
-                zRMinP2T2 = pRmin * _np.sin(dTheta * i2)
-
-                xRMinP2T1 = (pRtor + (pRmin * _np.cos(dTheta * i1))) * _np.cos(pSPhi + dPhi * j2)
-                yRMinP2T1 = (pRtor + (pRmin * _np.cos(dTheta * i1))) * _np.sin(pSPhi + dPhi * j2)
-                zRMinP2T1 = pRmin * _np.sin(dTheta * i1)
-
-                if 0 < pRmin < pRmax:
-                    vertices_inner = []
-                    vertices_inner.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                    vertices_inner.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                    vertices_inner.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                    vertices_inner.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                    # vertices_inner.reverse()
-                    polygons.append(_Polygon(vertices_inner))
-
-                if pDPhi != 2 * _np.pi:
-                    if j1 == 0:
-                        end = []
-                        if pRmin != 0:
-                            end.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        end.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                        end.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                        end.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                        end.reverse()
-                        polygons.append(_Polygon(end))
-
-                    if j1 == nslice - 1:
-                        end = []
-                        if pRmin != 0:
-                            end.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                        end.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        end.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                        end.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                        # end.reverse()
-                        polygons.append(_Polygon(end))
-
-        mesh = _CSG.fromPolygons(polygons)
-
-        return mesh
+        theta = dTheta * _np.arange(nstack + 1)
+        phi = pSPhi + dPhi * _np.arange(nslice + 1)
+        cosPhi = _np.cos(phi)[:, None]
+        sinPhi = _np.sin(phi)[:, None]
+
+        def grid(r):
+            # [slice (phi), stack (theta), xyz]
+            radial = pRtor + (r * _np.cos(theta))
+            z = _np.broadcast_to(r * _np.sin(theta), (nslice + 1, nstack + 1))
+            return _np.stack([radial * cosPhi, radial * sinPhi, z], axis=-1)
+
+        def cells(g):
+            return g[:-1, :-1], g[:-1, 1:], g[1:, 1:], g[1:, :-1]
+
+        maxP1T1, maxP1T2, maxP2T2, maxP2T1 = cells(grid(pRmax))
+        minP1T1, minP1T2, minP2T2, minP2T1 = cells(grid(pRmin))
+
+        blocks = [_np.stack([maxP2T1, maxP2T2, maxP1T2, maxP1T1], axis=2).reshape(-1, 4, 3)]
+
+        if 0 < pRmin < pRmax:
+            blocks.append(_np.stack([minP1T1, minP1T2, minP2T2, minP2T1], axis=2).reshape(-1, 4, 3))
+
+        if pDPhi != 2 * _np.pi:
+            if pRmin != 0:
+                blocks.append(_np.stack([maxP1T1[0], maxP1T2[0], minP1T2[0], minP1T1[0]], axis=1))
+                blocks.append(
+                    _np.stack([minP2T1[-1], minP2T2[-1], maxP2T2[-1], maxP2T1[-1]], axis=1)
+                )
+            else:
+                blocks.append(_np.stack([maxP1T1[0], maxP1T2[0], minP1T2[0]], axis=1))
+                blocks.append(_np.stack([minP2T2[-1], maxP2T2[-1], maxP2T1[-1]], axis=1))
+
+        return _polygonsToArrays(*blocks)
@@ -1,17 +1,8 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
-
-if _config.meshing == _config.meshingType.pycsg:
-    from pyg4ometry.pycsg.core import CSG as _CSG
-    from pyg4ometry.pycsg.geom import Vector as _Vector
-    from pyg4ometry.pycsg.geom import Vertex as _Vertex
-    from pyg4ometry.pycsg.geom import Polygon as _Polygon
-elif _config.meshing == _config.meshingType.cgal_sm:
-    from pyg4ometry.pycgal.core import CSG as _CSG
-    from pyg4ometry.pycgal.geom import Vector as _Vector
-    from pyg4ometry.pycgal.geom import Vertex as _Vertex
-    from pyg4ometry.pycgal.geom import Polygon as _Polygon
+from .ArrayMesh import meshFromArrays as _meshFromArrays
+from .ArrayMesh import polygonsToArrays as _polygonsToArrays
 
 import numpy as _np
 import logging as _log
@@ -96,7 +87,15 @@ class Tubs(_SolidBase):
         )
 
     def mesh(self):
-        _log.info("tubs.pycsgmesh> antlr")
+        _log.info("tubs.pycsgmesh> mesh")
+
+        return _meshFromArrays(*self.meshArrays())
+
+    def meshArrays(self):
+        """
+        Surface of the tube as vertex and face arrays, see ArrayMesh.polygonsToArrays.
+        """
+        _log.info("tubs.meshArrays> antlr")
 
         import pyg4ometry.gdml.Units as _Units  # TODO move circular import
 
@@ -109,99 +108,48 @@ class Tubs(_SolidBase):
         pDz = self.evaluateParameter(self.pDz) * luval / 2
         pRMax = self.evaluateParameter(self.pRMax) * luval
 
-        _log.info("tubs.pycsgmesh> mesh")
-
-        polygons = []
+        _log.info("tubs.meshArrays> arrays")
 
         dPhi = pDPhi / self.nslice
-
-        for i in range(0, self.nslice, 1):
-            i1 = i
-            i2 = i + 1
-
-            p1 = dPhi * i1 + pSPhi
-            p2 = dPhi * i2 + pSPhi
-
-            xRMinP1 = pRMin * _np.cos(p1)
-            yRMinP1 = pRMin * _np.sin(p1)
-            xRMinP2 = pRMin * _np.cos(p2)
-            yRMinP2 = pRMin * _np.sin(p2)
-
-            xRMaxP1 = pRMax * _np.cos(p1)
-            yRMaxP1 = pRMax * _np.sin(p1)
-            xRMaxP2 = pRMax * _np.cos(p2)
-            yRMaxP2 = pRMax * _np.sin(p2)
-
-            ###########################
-            # wedge ends
-            ###########################
-            if pDPhi != 2 * _np.pi and i == 0:
-                vWedg = []
-                vWedg.append(_Vertex([xRMinP1, yRMinP1, -pDz]))
-                vWedg.append(_Vertex([xRMinP1, yRMinP1, pDz]))
-                vWedg.append(_Vertex([xRMaxP1, yRMaxP1, pDz]))
-                vWedg.append(_Vertex([xRMaxP1, yRMaxP1, -pDz]))
-                vWedg.reverse()
-                polygons.append(_Polygon(vWedg))
-
-            if pDPhi != 2 * _np.pi and i == self.nslice - 1:
-                vWedg = []
-                vWedg.append(_Vertex([xRMinP2, yRMinP2, -pDz]))
-                vWedg.append(_Vertex([xRMaxP2, yRMaxP2, -pDz]))
-                vWedg.append(_Vertex([xRMaxP2, yRMaxP2, pDz]))
-                vWedg.append(_Vertex([xRMinP2, yRMinP2, pDz]))
-                vWedg.reverse()
-                polygons.append(_Polygon(vWedg))
-
-            ###########################
-            # tube ends
-            ###########################
-            if pRMin == 0:
-                vEnd = []
-                vEnd.append(_Vertex([0, 0, -pDz]))
-                vEnd.append(_Vertex([xRMaxP2, yRMaxP2, -pDz]))
-                vEnd.append(_Vertex([xRMaxP1, yRMaxP1, -pDz]))
-                polygons.append(_Polygon(vEnd))
-
-                vEnd = []
-                vEnd.append(_Vertex([0, 0, pDz]))
-                vEnd.append(_Vertex([xRMaxP1, yRMaxP1, pDz]))
-                vEnd.append(_Vertex([xRMaxP2, yRMaxP2, pDz]))
-                polygons.append(_Polygon(vEnd))
-
-            else:
-                vEnd = []
-                vEnd.append(_Vertex([xRMinP1, yRMinP1, -pDz]))
-                vEnd.append(_Vertex([xRMinP2, yRMinP2, -pDz]))
-                vEnd.append(_Vertex([xRMaxP2, yRMaxP2, -pDz]))
-                vEnd.append(_Vertex([xRMaxP1, yRMaxP1, -pDz]))
-                polygons.append(_Polygon(vEnd))
-
-                vEnd = []
-                vEnd.append(_Vertex([xRMinP1, yRMinP1, pDz]))
-                vEnd.append(_Vertex([xRMaxP1, yRMaxP1, pDz]))
-                vEnd.append(_Vertex([xRMaxP2, yRMaxP2, pDz]))
-                vEnd.append(_Vertex([xRMinP2, yRMinP2, pDz]))
-                polygons.append(_Polygon(vEnd))
-
-            ###########################
-            # Curved cylinder faces
-            ###########################
-            vCurv = []
-            vCurv.append(_Vertex([xRMaxP1, yRMaxP1, -pDz]))
-            vCurv.append(_Vertex([xRMaxP2, yRMaxP2, -pDz]))
-            vCurv.append(_Vertex([xRMaxP2, yRMaxP2, pDz]))
-            vCurv.append(_Vertex([xRMaxP1, yRMaxP1, pDz]))
-            polygons.append(_Polygon(vCurv))
-
-            if pRMin != 0:
-                vCurv = []
-                vCurv.append(_Vertex([xRMinP1, yRMinP1, -pDz]))
-                vCurv.append(_Vertex([xRMinP1, yRMinP1, pDz]))
-                vCurv.append(_Vertex([xRMinP2, yRMinP2, pDz]))
-                vCurv.append(_Vertex([xRMinP2, yRMinP2, -pDz]))
-                polygons.append(_Polygon(vCurv))
-
-        mesh = _CSG.fromPolygons(polygons)
-
-        return mesh
+        phi = dPhi * _np.arange(self.nslice + 1) + pSPhi
+        cosPhi = _np.cos(phi)
+        sinPhi = _np.sin(phi)
+
+        def points(r, z, s):
+            x = r * cosPhi[s]
+            return _np.stack([x, r * sinPhi[s], _np.full_like(x, z)], axis=-1)
+
+        p1 = slice(0, -1)
+        p2 = slice(1, None)
+
+        # [slice, corner, xyz] for the nslice segments between p1 and p2
+        minP1L, minP1H = points(pRMin, -pDz, p1), points(pRMin, pDz, p1)
+        minP2L, minP2H = points(pRMin, -pDz, p2), points(pRMin, pDz, p2)
+        maxP1L, maxP1H = points(pRMax, -pDz, p1), points(pRMax, pDz, p1)
+        maxP2L, maxP2H = points(pRMax, -pDz, p2), points(pRMax, pDz, p2)
+
+        blocks = []
+
+        # wedge ends
+        if pDPhi != 2 * _np.pi:
+            blocks.append(_np.stack([maxP1L, maxP1H, minP1H, minP1L], axis=1)[:1])
+            blocks.append(_np.stack([minP2H, maxP2H, maxP2L, minP2L], axis=1)[-1:])
+
+        # tube ends
+        if pRMin == 0:
+            centreL = _np.zeros_like(maxP1L)
+            centreL[:, 2] = -pDz
+            centreH = _np.zeros_like(maxP1H)
+            centreH[:, 2] = pDz
+            blocks.append(_np.stack([centreL, maxP2L, maxP1L], axis=1))
+            blocks.append(_np.stack([centreH, maxP1H, maxP2H], axis=1))
+        else:
+            blocks.append(_np.stack([minP1L, minP2L, maxP2L, maxP1L], axis=1))
+            blocks.append(_np.stack([minP1H, maxP1H, maxP2H, minP2H], axis=1))
+
+        # curved cylinder faces
+        blocks.append(_np.stack([maxP1L, maxP2L, maxP2H, maxP1H], axis=1))
+        if pRMin != 0:
+            blocks.append(_np.stack([minP1L, minP1H, minP2H, minP2L], axis=1))
+
+        return _polygonsToArrays(*blocks)
@@ -61,3 +61,44 @@ def MeshShrink(m, shrinkFactor=1e-5):
     m.append(vertnormals)
 
     return vertnormals
+
+
+def aabbCandidatePairs(aabbs, tolerance=0.0):
+    """
+    Sweep and prune broad phase. Returns a sorted list of index pairs (i,j) with i < j
+    for which the axis-aligned bounding boxes overlap. With a tolerance of 0 boxes that
+    only touch are not returned, a positive tolerance will also return touching boxes.
+
+    :param aabbs: bounding boxes, [i,0] the minimum and [i,1] the maximum corner of box i
+    :type aabbs: numpy.ndarray (n,2,3)
+    :param tolerance: length by which each box is effectively enlarged
+    :type tolerance: float
+    """
+    n = len(aabbs)
+    if n < 2:
+        return []
+
+    lo = aabbs[:, 0, :]
+    hi = aabbs[:, 1, :]
+
+    # sweep along the axis with the largest spread of box centres
+    axis = int(_np.argmax((lo + hi).std(axis=0)))
+    order = _np.argsort(lo[:, axis], kind="stable")
+    sortedLo = lo[order, axis]
+
+    pairs = []
+    for k in range(n):
+        i = order[k]
+        # all boxes starting before this one ends along the sweep axis
+        kEnd = _np.searchsorted(sortedLo, hi[i, axis] + tolerance, side="left")
+        if kEnd <= k + 1:
+            continue
+        others = order[k + 1 : kEnd]
+        overlap = _np.all(lo[others] < hi[i] + tolerance, axis=1) & _np.all(
+            lo[i] < hi[others] + tolerance, axis=1
+        )
+        for j in others[overlap]:
+            pairs.append((min(i, j), max(i, j)))
+
+    pairs.sort()
+    return [(int(i), int(j)) for i, j in pairs]
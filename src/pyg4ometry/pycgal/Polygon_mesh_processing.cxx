@@ -63,23 +63,41 @@ PYBIND11_MODULE(Polygon_mesh_processing, m) {
         [](Aff_transformation_3_EPICK &transl, Surface_mesh_EPICK &sm) {
           CGAL::Polygon_mesh_processing::transform(transl, sm);
         });
-  m.def("corefine_and_compute_union", [](Surface_mesh_EPICK &pm1,
-                                         Surface_mesh_EPICK &pm2,
-                                         Surface_mesh_EPICK &out) {
-    CGAL::Polygon_mesh_processing::corefine_and_compute_union(pm1, pm2, out);
-  });
-  m.def("corefine_and_compute_intersection", [](Surface_mesh_EPICK &pm1,
-                                                Surface_mesh_EPICK &pm2,
-                                                Surface_mesh_EPICK &out) {
-    CGAL::Polygon_mesh_processing::corefine_and_compute_intersection(pm1, pm2,
-                                                                     out);
-  });
-  m.def("corefine_and_compute_difference", [](Surface_mesh_EPICK &pm1,
-                                              Surface_mesh_EPICK &pm2,
-                                              Surface_mesh_EPICK &out) {
-    CGAL::Polygon_mesh_processing::corefine_and_compute_difference(pm1, pm2,
-                                                                   out);
-  });
+  // EPICK corefinement returns false if the output is not valid and can
+  // optionally raise if the input meshes self intersect near the intersection
+  m.def(
+      "corefine_and_compute_union",
+      [](Surface_mesh_EPICK &pm1, Surface_mesh_EPICK &pm2,
+         Surface_mesh_EPICK &out, bool throw_on_self_intersection) {
+        return CGAL::Polygon_mesh_processing::corefine_and_compute_union(
+            pm1, pm2, out,
+            CGAL::parameters::throw_on_self_intersection(
+                throw_on_self_intersection));
+      },
+      py::arg("pm1"), py::arg("pm2"), py::arg("out"),
+      py::arg("throw_on_self_intersection") = false);
+  m.def(
+      "corefine_and_compute_intersection",
+      [](Surface_mesh_EPICK &pm1, Surface_mesh_EPICK &pm2,
+         Surface_mesh_EPICK &out, bool throw_on_self_intersection) {
+        return CGAL::Polygon_mesh_processing::corefine_and_compute_intersection(
+            pm1, pm2, out,
+            CGAL::parameters::throw_on_self_intersection(
+                throw_on_self_intersection));
+      },
+      py::arg("pm1"), py::arg("pm2"), py::arg("out"),
+      py::arg("throw_on_self_intersection") = false);
+  m.def(
+      "corefine_and_compute_difference",
+      [](Surface_mesh_EPICK &pm1, Surface_mesh_EPICK &pm2,
+         Surface_mesh_EPICK &out, bool throw_on_self_intersection) {
+        return CGAL::Polygon_mesh_processing::corefine_and_compute_difference(
+            pm1, pm2, out,
+            CGAL::parameters::throw_on_self_intersection(
+                throw_on_self_intersection));
+      },
+      py::arg("pm1"), py::arg("pm2"), py::arg("out"),
+      py::arg("throw_on_self_intersection") = false);
   m.def("does_self_intersect", [](Surface_mesh_EPICK &pm) {
     return CGAL::Polygon_mesh_processing::does_self_intersect(pm);
   });
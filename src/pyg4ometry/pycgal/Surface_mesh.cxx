@@ -1,5 +1,7 @@
+#include <cstdint>
 #include <vector>
 
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/pytypes.h>
 #include <pybind11/stl.h>
@@ -396,6 +398,105 @@ py::list *toVerticesAndPolygons(Surface_mesh_ECER &sm) {
   return ret;
 }
 
+/**********************************************************************
+NumPy arrays
+**********************************************************************/
+
+typedef py::array_t<double, py::array::c_style | py::array::forcecast>
+    VertexArray;
+typedef py::array_t<std::int32_t, py::array::c_style | py::array::forcecast>
+    FaceArray;
+
+// add vertices (N,3) and faces, an array (M,k) of vertex indices or a list of
+// them, to a surface mesh. Vertices are added as given (no merging).
+template <typename SM>
+void fromArrays(SM &sm, VertexArray &vertices, py::object &faces) {
+  if (vertices.ndim() != 2 || vertices.shape(1) != 3)
+    throw py::value_error("vertices must have shape (N, 3)");
+
+  auto v = vertices.unchecked<2>();
+  std::vector<typename SM::Vertex_index> index;
+  index.reserve(v.shape(0));
+  for (py::ssize_t i = 0; i < v.shape(0); ++i) {
+    index.push_back(
+        sm.add_vertex(typename SM::Point(v(i, 0), v(i, 1), v(i, 2))));
+  }
+
+  py::list faceArrays;
+  if (py::isinstance<py::list>(faces) || py::isinstance<py::tuple>(faces))
+    faceArrays = py::list(faces);
+  else
+    faceArrays.append(faces);
+
+  std::vector<typename SM::Vertex_index> cell;
+  for (auto faceHandle : faceArrays) {
+    FaceArray faceArray = FaceArray::ensure(faceHandle);
+    if (!faceArray || faceArray.ndim() != 2 ||
+        (faceArray.shape(0) != 0 && faceArray.shape(1) < 3))
+      throw py::value_error("faces must have shape (M, k) with k >= 3");
+
+    auto f = faceArray.unchecked<2>();
+    cell.resize(f.shape(1));
+    for (py::ssize_t i = 0; i < f.shape(0); ++i) {
+      for (py::ssize_t j = 0; j < f.shape(1); ++j) {
+        std::int32_t k = f(i, j);
+        if (k < 0 || (std::size_t)k >= index.size())
+          throw py::index_error("face vertex index out of range");
+        cell[j] = index[k];
+      }
+      sm.add_face(cell);
+    }
+  }
+}
+
+// vertices as float64 (N,3) and faces as int32 triangles (M,3), faces with
+// more than three vertices are split into a fan
+template <typename SM> py::tuple toArrays(SM &sm) {
+  py::ssize_t nVertices = sm.number_of_vertices();
+  py::array_t<double> vertices({nVertices, (py::ssize_t)3});
+  auto v = vertices.mutable_unchecked<2>();
+
+  // vertex indices are not contiguous if the mesh has removed elements
+  std::vector<std::int32_t> remap;
+  py::ssize_t i = 0;
+  for (typename SM::Vertex_index vd : sm.vertices()) {
+    std::size_t k = (std::size_t)vd;
+    if (k >= remap.size())
+      remap.resize(k + 1, -1);
+    remap[k] = (std::int32_t)i;
+
+    const typename SM::Point &p = sm.point(vd);
+    v(i, 0) = CGAL::to_double(p.x());
+    v(i, 1) = CGAL::to_double(p.y());
+    v(i, 2) = CGAL::to_double(p.z());
+    ++i;
+  }
+
+  py::ssize_t nTriangles = 0;
+  for (typename SM::Face_index fd : sm.faces())
+    nTriangles += sm.degree(fd) - 2;
+
+  py::array_t<std::int32_t> triangles({nTriangles, (py::ssize_t)3});
+  auto t = triangles.mutable_unchecked<2>();
+  std::vector<std::int32_t> cell;
+  py::ssize_t j = 0;
+  for (typename SM::Face_index fd : sm.faces()) {
+    cell.clear();
+    for (typename SM::Halfedge_index hd :
+         CGAL::halfedges_around_face(sm.halfedge(fd), sm)) {
+      cell.push_back(remap[(std::size_t)sm.source(hd)]);
+    }
+    for (std::size_t k = 1; k + 1 < cell.size(); ++k) {
+      t(j, 0) = cell[0];
+      t(j, 1) = cell[k];
+      t(j, 2) = cell[k + 1];
+      ++j;
+    }
+  }
+
+  return py::make_tuple(vertices, triangles);
+}
+
 PYBIND11_MODULE(Surface_mesh, m) {
   py::class_<Surface_mesh_EPICK::Vertex_index>(m, "Vertex_index")
       .def(py::init<>())
@@ -507,6 +608,11 @@ PYBIND11_MODULE(Surface_mesh, m) {
   });
   m.def("toVerticesAndPolygons",
         [](Surface_mesh_EPICK &sm) { return toVerticesAndPolygons(sm); });
+  m.def("fromArrays",
+        [](Surface_mesh_EPICK &sm, VertexArray &vertices, py::object &faces) {
+          fromArrays(sm, vertices, faces);
+        });
+  m.def("toArrays", [](Surface_mesh_EPICK &sm) { return toArrays(sm); });
 
   /**********************************************************************
   EPECK
@@ -680,6 +786,11 @@ PYBIND11_MODULE(Surface_mesh, m) {
   });
   m.def("toVerticesAndPolygons",
         [](Surface_mesh_EPECK &sm) { return toVerticesAndPolygons(sm); });
+  m.def("fromArrays",
+        [](Surface_mesh_EPECK &sm, VertexArray &vertices, py::object &faces) {
+          fromArrays(sm, vertices, faces);
+        });
+  m.def("toArrays", [](Surface_mesh_EPECK &sm) { return toArrays(sm); });
 
   /**********************************************************************
   ECER
@@ -716,4 +827,5 @@ PYBIND11_MODULE(Surface_mesh, m) {
   // {toCGALSurfaceMesh(sm, polygons);});
   m.def("toVerticesAndPolygons",
         [](Surface_mesh_ECER &sm) { return toVerticesAndPolygons(sm); });
+  m.def("toArrays", [](Surface_mesh_ECER &sm) { return toArrays(sm); });
 }
@@ -13,25 +13,83 @@ from . import Triangle_3
 from . import Vector_3
 from . import CGAL
 from . import pythonHelpers
+from .. import config as _config
 
+import logging as _log
 import numpy as _np
 
 
+def _surfaceMesh():
+    """
+    Empty surface mesh of the kernel selected by config.meshing
+    """
+    if _config.meshing == _config.meshingType.cgal_epick:
+        return Surface_mesh.Surface_mesh_EPICK()
+    return Surface_mesh.Surface_mesh_EPECK()
+
+
+def _isEpick(sm):
+    return isinstance(sm, Surface_mesh.Surface_mesh_EPICK)
+
+
+def _toEpeck(sm):
+    """
+    Exact construction (EPECK) surface mesh equal to sm. EPICK coordinates are
+    doubles so the conversion is exact.
+    """
+    if not _isEpick(sm):
+        return sm
+    vertices, triangles = Surface_mesh.toArrays(sm)
+    out = Surface_mesh.Surface_mesh_EPECK()
+    Surface_mesh.fromArrays(out, vertices, triangles)
+    return out
+
+
 class CSG:
     def __init__(self):
-        self.sm = Surface_mesh.Surface_mesh_EPECK()
+        self.sm = _surfaceMesh()
 
     @classmethod
     def fromPolygons(cls, polygons, **kwargs):
         csg = CSG()
-        csg.sm = Surface_mesh.Surface_mesh_EPECK()
+        csg.sm = _surfaceMesh()
         Surface_mesh.toCGALSurfaceMesh(csg.sm, polygons)
         Polygon_mesh_processing.triangulate_faces(csg.sm)
         return csg
 
+    @classmethod
+    def fromArrays(cls, vertices, faces):
+        """
+        Mesh from vertices (N,3) and faces, an integer array (M,k) of vertex
+        indices or a list of them. Vertices are used as given (no merging).
+        """
+        csg = CSG()
+        csg.sm = _surfaceMesh()
+        Surface_mesh.fromArrays(csg.sm, vertices, faces)
+        Polygon_mesh_processing.triangulate_faces(csg.sm)
+        return csg
+
     def toVerticesAndPolygons(self):
         return Surface_mesh.toVerticesAndPolygons(self.sm)
 
+    def toArrays(self):
+        """
+        Vertices as a float64 array (N,3) and triangles as an int32 array (M,3).
+        """
+        return Surface_mesh.toArrays(self.sm)
+
+    def isExact(self):
+        """
+        True if the mesh uses the exact construction (EPECK) kernel.
+        """
+        return not _isEpick(self.sm)
+
+    def exactSurfaceMesh(self):
+        """
+        The surface mesh with the exact construction (EPECK) kernel, converted if needed.
+        """
+        return _toEpeck(self.sm)
+
     def clone(self):
         csg = CSG()
         csg.sm = self.sm.clone()
@@ -64,7 +122,12 @@ class CSG:
         rot[2][1] = (verSin * z * y) + (x * sinAngle)
         rot[2][2] = (verSin * z * z) + cosAngle
 
-        rotn = Aff_transformation_3.Aff_transformation_3_EPECK(
+        if _isEpick(self.sm):
+            affineTransformation = Aff_transformation_3.Aff_transformation_3_EPICK
+        else:
+            affineTransformation = Aff_transformation_3.Aff_transformation_3_EPECK
+
+        rotn = affineTransformation(
             rot[0][0],
             rot[0][1],
             rot[0][2],
@@ -81,8 +144,12 @@ class CSG:
     def translate(self, disp):
         vIn = geom.Vector(disp)
         # TODO tidy vector usage (i.e conversion in geom?)
-        v = Vector_3.Vector_3_EPECK(vIn[0], vIn[1], vIn[2])
-        transl = Aff_transformation_3.Aff_transformation_3_EPECK(CGAL.Translation(), v)
+        if _isEpick(self.sm):
+            v = Vector_3.Vector_3_EPICK(vIn[0], vIn[1], vIn[2])
+            transl = Aff_transformation_3.Aff_transformation_3_EPICK(CGAL.Translation(), v)
+        else:
+            v = Vector_3.Vector_3_EPECK(vIn[0], vIn[1], vIn[2])
+            transl = Aff_transformation_3.Aff_transformation_3_EPECK(CGAL.Translation(), v)
         Polygon_mesh_processing.transform(transl, self.sm)
 
     # TODO need to finish and check signatures
@@ -104,7 +171,10 @@ class CSG:
             x = 1
             y = 1
             z = 1
-        scal = Aff_transformation_3.Aff_transformation_3_EPECK(x, 0, 0, 0, y, 0, 0, 0, z, 1)
+        if _isEpick(self.sm):
+            scal = Aff_transformation_3.Aff_transformation_3_EPICK(x, 0, 0, 0, y, 0, 0, 0, z, 1)
+        else:
+            scal = Aff_transformation_3.Aff_transformation_3_EPECK(x, 0, 0, 0, y, 0, 0, 0, z, 1)
         Polygon_mesh_processing.transform(scal, self.sm)
 
     def getNumberVertices(self):
@@ -119,26 +189,48 @@ class CSG:
     def polygonCount(self):
         return self.sm.number_of_faces()
 
-    def intersect(self, csg2):
+    def _boolean(self, csg2, corefine):
+        """
+        Corefinement boolean with the EPICK kernel if both meshes use it, retried with
+        the exact EPECK kernel if the EPICK result is not valid or an input mesh self
+        intersects. Otherwise (or after a retry) the result is an EPECK mesh.
+
+        Corefinement refines its input meshes in place, also when it fails, so the EPICK
+        attempt is made on clones. The operands are left unchanged and a retry starts
+        from the original meshes.
+        """
+        sm1 = self.sm
+        sm2 = csg2.sm
+
+        if _isEpick(sm1) and _isEpick(sm2):
+            out = Surface_mesh.Surface_mesh_EPICK()
+            try:
+                valid = corefine(sm1.clone(), sm2.clone(), out, throw_on_self_intersection=True)
+            except RuntimeError as error:
+                _log.info("pycgal.CSG> EPICK %s failed (%s)", corefine.__name__, error)
+                valid = False
+
+            if valid:
+                csg = CSG()
+                csg.sm = out
+                return csg
+
+            _log.info("pycgal.CSG> retrying %s with EPECK", corefine.__name__)
+
         out = Surface_mesh.Surface_mesh_EPECK()
-        Polygon_mesh_processing.corefine_and_compute_intersection(self.sm, csg2.sm, out)
+        corefine(_toEpeck(sm1), _toEpeck(sm2), out)
         csg = CSG()
         csg.sm = out
         return csg
 
+    def intersect(self, csg2):
+        return self._boolean(csg2, Polygon_mesh_processing.corefine_and_compute_intersection)
+
     def union(self, csg2):
-        out = Surface_mesh.Surface_mesh_EPECK()
-        Polygon_mesh_processing.corefine_and_compute_union(self.sm, csg2.sm, out)
-        csg = CSG()
-        csg.sm = out
-        return csg
+        return self._boolean(csg2, Polygon_mesh_processing.corefine_and_compute_union)
 
     def subtract(self, csg2):
-        out = Surface_mesh.Surface_mesh_EPECK()
-        Polygon_mesh_processing.corefine_and_compute_difference(self.sm, csg2.sm, out)
-        csg = CSG()
-        csg.sm = out
-        return csg
+        return self._boolean(csg2, Polygon_mesh_processing.corefine_and_compute_difference)
 
     def inverse(self):
         CGAL.reverse_face_orientations(self.sm)
@@ -151,8 +243,8 @@ class CSG:
 
         """
 
-        sm1 = self.sm
-        sm2 = csg.sm
+        sm1 = self.exactSurfaceMesh()
+        sm2 = csg.exactSurfaceMesh()
 
         #######################################
         # triangle planes
@@ -211,6 +303,7 @@ class CSG:
 
         # return surface mesh
         c = CSG()
+        c.sm = Surface_mesh.Surface_mesh_EPECK()
         out = c.sm
 
         # close planes
@@ -368,49 +461,16 @@ class CSG:
     def area(self):
         return Polygon_mesh_processing.area(self.sm)
 
+    def edgeLengths(self):
+        vertices, triangles = self.toArrays()
+        edges = vertices[_np.roll(triangles, -1, axis=1)] - vertices[triangles]
+        return _np.sqrt((edges * edges).sum(axis=-1)).ravel()
+
     def minEdgeLength(self):
-        vAp = self.toVerticesAndPolygons()
-        v = vAp[0]
-        p = vAp[1]
-        n = vAp[2]
-
-        minEdge = 9e99
-        maxEdge = -9e99
-
-        for i, tri in enumerate(p):
-            for j, vertInd in enumerate(tri):
-                v1 = _np.array(v[j])
-                v2 = _np.array(v[(j + 1) % 3])
-                dv = v2 - v1
-                mdv = _np.sqrt((dv * dv).sum())
-
-                if mdv < minEdge:
-                    minEdge = mdv
-                if mdv > maxEdge:
-                    maxEdge = mdv
-        return minEdge
+        return self.edgeLengths().min(initial=9e99)
 
     def maxEdgeLength(self):
-        vAp = self.toVerticesAndPolygons()
-        v = vAp[0]
-        p = vAp[1]
-        n = vAp[2]
-
-        minEdge = 9e99
-        maxEdge = -9e99
-
-        for i, tri in enumerate(p):
-            for j, vertInd in enumerate(tri):
-                v1 = _np.array(v[j])
-                v2 = _np.array(v[(j + 1) % 3])
-                dv = v2 - v1
-                mdv = _np.sqrt((dv * dv).sum())
-
-                if mdv < minEdge:
-                    minEdge = mdv
-                if mdv > maxEdge:
-                    maxEdge = mdv
-        return maxEdge
+        return self.edgeLengths().max(initial=-9e99)
 
     def isNull(self):
         return self.sm.number_of_faces() == 0
@@ -449,6 +509,10 @@ class CSG:
 
 
 def do_intersect(csg1, csg2):
+    if _isEpick(csg1.sm) != _isEpick(csg2.sm):
+        return Polygon_mesh_processing.do_intersect(
+            csg1.exactSurfaceMesh(), csg2.exactSurfaceMesh()
+        )
     return Polygon_mesh_processing.do_intersect(csg1.sm, csg2.sm)
 
 
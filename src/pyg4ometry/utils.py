@@ -115,30 +115,34 @@ class Timer:
     mean_step1 = timer.samples.means()["step1"]
     std_step1 = timer.samples.stds()["step1"]
 
+    The clock is process_time by default, pass clock=time.perf_counter
+    to record wall clock times instead.
+
     """
 
-    def __init__(self, **metadata):
+    def __init__(self, clock=time.process_time, **metadata):
         self.metadata = metadata
-        self.time0 = time.process_time()
+        self.clock = clock
+        self.time0 = self.clock()
         self.last_time = self.time0
         self.samples = Samples(**metadata)
 
     def add(self, name):
         assert name != "total", "use updateTotal"
-        now = time.process_time()
+        now = self.clock()
         duration = now - self.last_time
         self.samples.add(name, duration)
         self.last_time = now
 
     def update(self):
         """Update the last_time attribute to now."""
-        self.last_time = time.process_time()
+        self.last_time = self.clock()
 
     def __str__(self):
         return str(self.samples)
 
     def updateTotal(self):
-        now = time.process_time()
+        now = self.clock()
         total = now - self.time0
-        self.time0 = time.process_time()
+        self.time0 = self.clock()
         self.samples.add("total", total)
@@ -11,11 +11,40 @@ def mkVtkIdList(it):
     return vil
 
 
+# convert vertex (n,3) and triangle (m,3) arrays to vtkPolyData
+def arraysToVtkPolyData(vertices, triangles):
+    import vtk.util.numpy_support as _numpy_support
+
+    meshPolyData = _vtk.vtkPolyData()
+
+    points = _vtk.vtkPoints()
+    points.SetData(_numpy_support.numpy_to_vtk(_np.ascontiguousarray(vertices), deep=True))
+
+    offsets = _np.arange(0, 3 * len(triangles) + 1, 3).astype(_numpy_support.ID_TYPE_CODE)
+    connectivity = _np.ascontiguousarray(triangles, dtype=_numpy_support.ID_TYPE_CODE).ravel()
+    polys = _vtk.vtkCellArray()
+    polys.SetData(
+        _numpy_support.numpy_to_vtkIdTypeArray(offsets, deep=True),
+        _numpy_support.numpy_to_vtkIdTypeArray(connectivity, deep=True),
+    )
+
+    scalars = _numpy_support.numpy_to_vtk(_np.ones(len(triangles), dtype=_np.float32), deep=True)
+
+    meshPolyData.SetPoints(points)
+    meshPolyData.SetPolys(polys)
+    meshPolyData.GetPointData().SetScalars(scalars)
+
+    return meshPolyData
+
+
 # convert pycsh mesh to vtkPolyData
 def pycsgMeshToVtkPolyData(mesh):
     # refine mesh
     # mesh.refine()
 
+    if hasattr(mesh, "toArrays"):
+        return arraysToVtkPolyData(*mesh.toArrays())
+
     verts, cells, count = mesh.toVerticesAndPolygons()
     meshPolyData = _vtk.vtkPolyData()
     points = _vtk.vtkPoints()
@@ -5,8 +5,12 @@ import pyg4ometry.exceptions
 
 if _config.meshing == _config.meshingType.pycsg:
     from pyg4ometry.pycsg.core import CSG as _CSG
-elif _config.meshing == _config.meshingType.cgal_sm:
+    from pyg4ometry.pycsg.geom import Vertex as _Vertex
+    from pyg4ometry.pycsg.geom import Polygon as _Polygon
+elif _config.meshing in (_config.meshingType.cgal_sm, _config.meshingType.cgal_epick):
     from pyg4ometry.pycgal.core import CSG as _CSG
+    from pyg4ometry.pycgal.geom import Vertex as _Vertex
+    from pyg4ometry.pycgal.geom import Polygon as _Polygon
 
 
 import logging as _log
@@ -27,8 +31,11 @@ class Mesh:
         # solid which contains the mesh
         self.solid = solid
 
-        # mesh in local coordinates
-        self.localmesh = self.solid.mesh()
+        # circular import
+        from pyg4ometry.geant4.solid.MeshCache import cachedMesh as _cachedMesh
+
+        # mesh in local coordinates (shared with identical solids)
+        self.localmesh = _cachedMesh(self.solid)
 
         # bounding mesh in local coordinates
         self.localboundingmesh = self.getBoundingBoxMesh()
@@ -40,8 +47,11 @@ class Mesh:
         # existing overlaps become invalid
         self.overlapmeshes = []
 
+        # circular import
+        from pyg4ometry.geant4.solid.MeshCache import cachedMesh as _cachedMesh
+
         # recreate mesh
-        self.localmesh = self.solid.mesh().clone()
+        self.localmesh = _cachedMesh(self.solid)
 
         # recreate bounding mesh
         self.localboundingmesh = self.getBoundingBoxMesh()
@@ -69,14 +79,13 @@ def _getBoundingBox(aMesh, rotationMatrix=None, translation=None, nameForError="
     Axes aligned bounding box. Can also provide a rotation and
     a translation (applied in that order) to the vertices.
     """
-    vertices, _, _ = aMesh.toVerticesAndPolygons()
-    if not vertices:
+    vertices = _meshVertices(aMesh)
+    if len(vertices) == 0:
         print("Warning> getBoundingBox null mesh error : ", nameForError)
         if _config.meshingNullException:
             raise pyg4ometry.exceptions.NullMeshError(nameForError)
         else:
             return [[-1e-9, -1e-9, -1e-9], [1e9, 1e9, 1e9]]
-    vertices = _np.vstack(vertices)
 
     if rotationMatrix is not None:
         vertices = rotationMatrix.dot(vertices.T).T
@@ -111,3 +120,38 @@ def _getBoundingBoxMesh(boundingBox):
 
     mesh = _CSG.cube(center=[x0, y0, z0], radius=[pX, pY, pZ])
     return mesh
+
+
+def _meshVertices(aMesh):
+    """
+    Vertices of a mesh as a numpy array (n,3).
+    """
+    if hasattr(aMesh, "toArrays"):
+        return aMesh.toArrays()[0]
+    vertices, _, _ = aMesh.toVerticesAndPolygons()
+    return _np.array(vertices, dtype=float).reshape(-1, 3)
+
+
+def _meshToArrays(aMesh):
+    """
+    Serialise a mesh to a numpy array of vertices (n,3) and its faces, an int32
+    array (m,3) of triangles for CGAL meshes or a list of vertex index lists.
+    Suitable for sending a mesh between processes.
+    """
+    if hasattr(aMesh, "toArrays"):
+        return aMesh.toArrays()
+    vertices, polygons, _ = aMesh.toVerticesAndPolygons()
+    vertices = _np.array(vertices, dtype=float).reshape(-1, 3)
+    faces = [list(p) for p in polygons]
+    return vertices, faces
+
+
+def _meshFromArrays(vertices, faces):
+    """
+    Construct a mesh from the output of _meshToArrays
+    """
+    if isinstance(faces, _np.ndarray) and hasattr(_CSG, "fromArrays"):
+        return _CSG.fromArrays(vertices, faces.astype(_np.int32, copy=False))
+    vertices = _np.asarray(vertices, dtype=float).tolist()
+    polygons = [_Polygon([_Vertex(vertices[i]) for i in f]) for f in faces]
+    return _CSG.fromPolygons(polygons)
@@ -169,7 +169,12 @@ class ViewerBase:
                     pv.name,
                 )
             elif pv.type == "replica" or pv.type == "division":
-                for mesh, trans in zip(pv.meshes, pv.transforms):
+                # one mesh per distinct shape, instanced for each copy
+                for k, trans in zip(pv.meshIndex, pv.transforms):
+                    if k < 0:
+                        continue
+                    mesh_name = pv.name if k == 0 else pv.name + "_" + str(k)
+
                     # pv transform
                     pvmrot = _transformation.tbxyz2matrix(trans[0])
                     pvtra = _np.array(trans[1])
@@ -180,11 +185,15 @@ class ViewerBase:
 
                     pv.visOptions.depth = depth + 2
 
-                    self.addMesh(pv.name, mesh.localmesh)
-                    self.addInstance(pv.name, new_mtra, new_tra, pv.name)
-                    self.addVisOptions(pv.name, pv.visOptions)
+                    self.addMesh(mesh_name, pv.uniqueMeshes[k].localmesh)
+                    self.addInstance(mesh_name, new_mtra, new_tra, pv.name)
+                    self.addVisOptions(mesh_name, pv.visOptions)
             elif pv.type == "parametrised":
-                for mesh, trans, i in zip(pv.meshes, pv.transforms, range(0, len(pv.meshes), 1)):
+                # one mesh per distinct shape, instanced for each copy
+                for i, (k, trans) in enumerate(zip(pv.meshIndex, pv.transforms)):
+                    if k < 0:
+                        continue
+                    mesh_name = pv.name + "_param_" + str(k)
                     pv_name = pv.name + "_param_" + str(i)
 
                     # pv transform
@@ -197,9 +206,9 @@ class ViewerBase:
 
                     pv.visOptions.depth = depth + 2
 
-                    self.addMesh(pv_name, mesh.localmesh)
-                    self.addInstance(pv_name, new_mtra, new_tra, pv_name)
-                    self.addVisOptions(pv_name, pv.visOptions)
+                    self.addMesh(mesh_name, pv.uniqueMeshes[k].localmesh)
+                    self.addInstance(mesh_name, new_mtra, new_tra, pv_name)
+                    self.addVisOptions(mesh_name, pv.visOptions)
 
     def addFlukaRegions(self, fluka_registry, max_region=1000000, debugIO=False):
         icount = 0
@@ -432,9 +441,12 @@ class ViewerBase:
 
             inf = csg.info()
 
-            vAndPs = csg.toVerticesAndPolygons()
-            verts = vAndPs[0]
-            tris = vAndPs[1]
+            if hasattr(csg, "toArrays"):
+                verts, tris = csg.toArrays()
+            else:
+                vAndPs = csg.toVerticesAndPolygons()
+                verts = vAndPs[0]
+                tris = vAndPs[1]
 
             verts = _np.array(verts).astype(_np.float32)
             tris = _np.array(tris).astype(_np.uint32)
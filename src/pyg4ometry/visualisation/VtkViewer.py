@@ -8,6 +8,7 @@ from .VisualisationOptions import (
     getPredefinedMaterialVisOptions as _getPredefinedMaterialVisOptions,
 )
 from pyg4ometry.visualisation import Convert as _Convert
+from pyg4ometry.visualisation import _meshVertices
 import logging as _log
 import random as _random
 
@@ -508,10 +509,10 @@ class VtkViewer:
     def addMeshSimple(self, csgMesh, visOptions=_VisOptions(), clip=False, name="mesh"):
         if clip:
             csgMesh = csgMesh.clone()
-            verts, _, _ = csgMesh.toVerticesAndPolygons()
-            x = _np.array([v[0] for v in verts])
-            y = _np.array([v[1] for v in verts])
-            z = _np.array([v[2] for v in verts])
+            verts = _meshVertices(csgMesh)
+            x = verts[:, 0]
+            y = verts[:, 1]
+            z = verts[:, 2]
             xsize = max(x) - min(x)
             ysize = max(y) - min(y)
             zsize = max(z) - min(z)
@@ -643,6 +644,9 @@ class VtkViewer:
                     )
             elif pv.type == "parametrised":
                 for mesh, trans in zip(pv.meshes, pv.transforms):
+                    if mesh is None:
+                        continue
+
                     # pv transform
                     pvmrot = _transformation.tbxyz2matrix(trans[0].eval())
                     pvtra = _np.array(trans[1].eval())
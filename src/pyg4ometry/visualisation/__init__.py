@@ -2,6 +2,9 @@ from .Mesh import Mesh
 from .Mesh import OverlapType
 from .Mesh import _getBoundingBox
 from .Mesh import _getBoundingBoxMesh
+from .Mesh import _meshToArrays
+from .Mesh import _meshFromArrays
+from .Mesh import _meshVertices
 from .ViewerBase import ViewerBase
 from .VisualisationOptions import *
 from .VtkViewer import *
@@ -856,3 +856,434 @@ def test_PythonFluka_T401(tmptestdir, testdata):
     print(tmptestdir)
     T401_flukaRun.Test(False, False, True, outputPath=tmptestdir)
     T402_flukaLoad.Test(testdata)
+
+
+def test_Geant42FlukaConversion_latticeInstancing(tmptestdir):
+    import pyg4ometry.convert as _convert
+    import pyg4ometry.fluka as _fluka
+    import pyg4ometry.geant4 as _g4
+
+    reg = _g4.Registry()
+    wm = _g4.MaterialPredefined("G4_Galactic")
+    bm = _g4.MaterialPredefined("G4_Fe")
+    ws = _g4.solid.Box("ws", 1000, 1000, 1000, reg, "mm")
+    ms = _g4.solid.Box("ms", 100, 100, 100, reg, "mm")
+    cs = _g4.solid.Box("cs", 20, 20, 20, reg, "mm")
+    wl = _g4.LogicalVolume(ws, wm, "wl", reg)
+    ml = _g4.LogicalVolume(ms, wm, "ml", reg)
+    cl = _g4.LogicalVolume(cs, bm, "cl", reg)
+    _g4.PhysicalVolume([0, 0, 0], [0, 0, 0], cl, "c_pv", ml, reg)
+    for i in range(3):
+        _g4.PhysicalVolume([0, 0, 0.1 * i], [200 * i, 0, 0], ml, f"m{i}_pv", wl, reg)
+    reg.setWorld(wl.name)
+
+    full = _convert.geant4Reg2FlukaReg(reg)
+    instanced = _convert.geant4Reg2FlukaReg(reg, latticeThreshold=2)
+
+    assert len(instanced.latticeDict) == 2
+    assert len(instanced.regionDict) == len(full.regionDict) - 4
+    assert len(instanced.bodyDict) < len(full.bodyDict)
+
+    outputFile = tmptestdir / "latticeInstancing.inp"
+    w = _fluka.Writer()
+    w.addDetector(instanced)
+    w.write(outputFile)
+
+    freg = _fluka.Reader(str(outputFile)).getRegistry()
+    assert set(freg.latticeDict) == set(instanced.latticeDict)
+
+
+def test_Geant42FlukaConversion_spatialMotherSubtraction():
+    import pyg4ometry.convert as _convert
+    import pyg4ometry.geant4 as _g4
+
+    reg = _g4.Registry()
+    wm = _g4.MaterialPredefined("G4_Galactic")
+    bm = _g4.MaterialPredefined("G4_Fe")
+    ws = _g4.solid.Box("ws", 1000, 1000, 1000, reg, "mm")
+    b1 = _g4.solid.Box("b1", 100, 100, 100, reg, "mm")
+    b2 = _g4.solid.Box("b2", 100, 100, 100, reg, "mm")
+    us = _g4.solid.Union("us", b1, b2, [[0, 0, 0], [300, 0, 0]], reg)
+    ds = _g4.solid.Box("ds", 20, 20, 20, reg, "mm")
+    wl = _g4.LogicalVolume(ws, wm, "wl", reg)
+    ul = _g4.LogicalVolume(us, wm, "ul", reg)
+    dl = _g4.LogicalVolume(ds, bm, "dl", reg)
+    _g4.PhysicalVolume([0, 0, 0], [0, 0, 0], dl, "d_pv", ul, reg)
+    _g4.PhysicalVolume([0, 0, 0], [-100, 0, 0], ul, "u_pv", wl, reg)
+    reg.setWorld(wl.name)
+
+    freg = _convert.geant4Reg2FlukaReg(reg)
+
+    motherName = freg.PhysVolToRegionMap["u_pv"]
+    mother = freg.regionDict[motherName]
+    assert len(mother.zones) == 2
+    assert [len(zone.subtractions) for zone in mother.zones] == [1, 0]
+
+
+def test_Geant42FlukaConversion_memoisedSolidRegions():
+    import numpy as _np
+    import pyg4ometry.convert as _convert
+    import pyg4ometry.fluka as _fluka
+    import pyg4ometry.geant4 as _g4
+
+    reg = _g4.Registry()
+    t1 = _g4.solid.Tubs("t1", 0, 50, 100, 0, "pi", reg, "mm")
+    t2 = _g4.solid.Tubs("t2", 0, 50, 100, 0, "pi", reg, "mm")
+    t3 = _g4.solid.Tubs("t3", 0, 50, 200, 0, "pi", reg, "mm")
+
+    freg = _fluka.FlukaRegistry()
+    mtra = _np.identity(3)
+    tra = _np.array([10, 0, 0])
+    r1, count = _convert.geant4Solid2FlukaRegion(0, t1, mtra, tra, freg)
+    nBodies = len(freg.bodyDict)
+
+    # same content and placement: a new region made of the same bodies
+    r2, count = _convert.geant4Solid2FlukaRegion(count, t2, mtra, tra, freg)
+    assert r2.name != r1.name
+    assert r2.bodies() == r1.bodies()
+    assert len(freg.bodyDict) == nBodies
+
+    # a different length only needs new z planes, the cylinder is shared
+    r3, count = _convert.geant4Solid2FlukaRegion(count, t3, mtra, tra, freg)
+    assert len(r3.bodies() & r1.bodies()) > 0
+    assert len(freg.bodyDict) < 2 * nBodies
+    for body in r3.bodies():
+        assert freg.bodyDict[body.name] is body
+
+
+def test_Geant42FlukaConversion_batchQuadricTransform():
+    import numpy as _np
+    import pyg4ometry.convert as _convert
+
+    mtra = _np.array(
+        [
+            [0.955336489125606, -0.22602632124962302, 0.19037934406737264],
+            [0.29552020666133955, 0.7306816499355124, -0.6154446635582734],
+            [0.0, 0.644217687237691, 0.7648421872844885],
+        ]
+    )
+    tra = _np.array([1.5, -2.0, 3.0])
+    coefficients = [
+        [1.0, 2.0, 3.0, 0.5, -0.25, 0.75, 1.0, -2.0, 0.5, -4.0],
+        [0.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -9.0],
+        [-1.0, 0.5, 0.0, 1.5, 2.0, -1.0, 0.0, 3.0, -1.0, 2.0],
+    ]
+
+    # computed with the per-body formula the batch transform replaced
+    expected = [
+        [
+            0.93786875046945,
+            2.107604029334757,
+            2.9545272201957933,
+            -0.14176863752217456,
+            0.37860068325917196,
+            -0.7809711333619,
+            -2.730366772571676,
+            9.512417048719168,
+            -20.763020893620453,
+            37.46324536209559,
+        ],
+        [
+            0.08733219254516084,
+            0.9126678074548394,
+            1.0,
+            -0.5646424733950354,
+            -1.3014886026739304e-16,
+            6.169453431926064e-16,
+            -1.391281524425553,
+            4.497634939911909,
+            -5.999999999999999,
+            5.541096083231071,
+        ],
+        [
+            -0.8042372356867235,
+            0.5894538864060141,
+            -0.28521665071929014,
+            -1.1245235018452016,
+            2.289148866473676,
+            1.0459638876637547,
+            -7.572240203867503,
+            3.7141987487654067,
+            1.5373152543613213,
+            10.794523052708167,
+        ],
+    ]
+
+    def perBody(axx, ayy, azz, axy, axz, ayz, ax, ay, az, a, M, T):
+        Q = _np.array([[axx, axy / 2, axz / 2], [axy / 2, ayy, ayz / 2], [axz / 2, ayz / 2, azz]])
+        P = _np.array([ax, ay, az])
+        M = _np.linalg.inv(M)
+        T = -M @ T
+        Qprime = M.T @ Q @ M
+        Pprime = M.T @ Q @ T + M.T @ Q.T @ T + M.T @ P
+        Rprime = a + T @ Q @ T + P @ T
+        return [
+            Qprime[0, 0],
+            Qprime[1, 1],
+            Qprime[2, 2],
+            Qprime[0, 1] * 2,
+            Qprime[0, 2] * 2,
+            Qprime[1, 2] * 2,
+            *Pprime,
+            Rprime,
+        ]
+
+    batch = _convert.geant42Fluka.transformQuadricsFluka(coefficients, mtra, tra)
+    for c, row, exp in zip(coefficients, batch, expected):
+        assert row.tolist() == pytest.approx(exp, rel=1e-12, abs=1e-12)
+        # bitwise identical to the per-body formula on the same machine
+        assert row.tolist() == [float(v) for v in perBody(*c, mtra, tra)]
+        assert list(_convert.geant42Fluka.transformQuadricFluka(*c, mtra, tra)) == row.tolist()
+
+
+def _planeCards(region):
+    return [
+        boolean.body.flukaFreeString()
+        for zone in region.zones
+        for boolean in zone.intersections + zone.subtractions
+    ]
+
+
+def _perBodyPlaneCard(name, ibody, normal, point, mtra=None, tra=None):
+    import numpy as _np
+    import pyg4ometry.fluka as _fluka
+
+    if mtra is not None:
+        normal = mtra @ _np.array(normal)
+        point = mtra @ _np.array(point) + tra / 10
+    return _fluka.PLA("B" + name + format(ibody, "02"), normal, point).flukaFreeString()
+
+
+def test_Geant42FlukaConversion_extrudedBodiesMatchPerBody():
+    import numpy as _np
+    import pyg4ometry.convert as _convert
+    import pyg4ometry.fluka as _fluka
+    import pyg4ometry.geant4 as _g4
+    import pyg4ometry.transformation as _transformation
+
+    reg = _g4.Registry()
+    polygon = [[0, 0], [30, 5], [25, 20], [5, 15]]
+    slices = [[-10, [0, 0], 1.0], [5, [2.5, 1], 1.5], [20, [-5, 3], 0.75]]
+    solid = _g4.solid.ExtrudedSolid("xtru", polygon, slices, reg)
+    mtra = _transformation.tbxyz2matrix([0.3, -0.7, 1.1])
+    tra = _np.array([10.0, -20.0, 30.0])
+
+    # the per-body formula the batched planes replaced, with lengths in cm
+    polyListConvex = _convert.geant42Fluka._PolygonProcessing.decomposePolygon2d(
+        [[x * 0.1, y * 0.1] for x, y in reversed(polygon)]
+    )
+    zpos = [s[0] * 0.1 for s in slices]
+    xoffs = [s[1][0] * 0.1 for s in slices]
+    yoffs = [s[1][1] * 0.1 for s in slices]
+    scale = [s[2] for s in slices]
+
+    for bake in (False, True):
+        m, t = (mtra, tra) if bake else (None, None)
+        expected = []
+        for i in range(len(slices) - 1):
+            zi1, zi2 = zpos[i], zpos[i + 1]
+            layer = [
+                [
+                    [scale[i] * v[0] + xoffs[i], scale[i] * v[1] + yoffs[i]],
+                    [scale[i + 1] * v[0] + xoffs[i + 1], scale[i + 1] * v[1] + yoffs[i + 1]],
+                ]
+                for v in [v for p in polyListConvex for v in p]
+            ]
+            ibody = len(expected)
+            expected.append(_perBodyPlaneCard("0000", ibody, [0, 0, -1], [0, 0, zi1], m, t))
+            expected.append(_perBodyPlaneCard("0000", ibody + 1, [0, 0, 1], [0, 0, zi2], m, t))
+            first = 0
+            for p in polyListConvex:
+                for k in range(len(p)):
+                    (x0, y0), (x1, y1) = layer[first + k]
+                    x2, y2 = layer[first + (k + 1) % len(p)][0]
+                    dx1, dy1, dz1 = x1 - x0, y1 - y0, zi2 - zi1
+                    ld1 = _np.sqrt(dx1**2 + dy1**2 + dz1**2)
+                    dx1, dy1, dz1 = dx1 / ld1, dy1 / ld1, dz1 / ld1
+                    dx2, dy2, dz2 = x2 - x0, y2 - y0, zi1 - zi1
+                    ld2 = _np.sqrt(dx2**2 + dy2**2 + dz2**2)
+                    dx2, dy2, dz2 = dx2 / ld2, dy2 / ld2, dz2 / ld2
+                    nx = dy1 * dz2 - dz1 * dy2
+                    ny = dx2 * dz1 - dx1 * dz2
+                    nz = dx1 * dy2 - dy1 * dx2
+                    expected.append(
+                        _perBodyPlaneCard(
+                            "0000", len(expected), [-nx, -ny, -nz], [x0, y0, zi1], m, t
+                        )
+                    )
+                first += len(p)
+
+        freg = _fluka.FlukaRegistry()
+        region, _ = _convert.geant42Fluka.geant4Extruded2Fluka(
+            0, solid, mtra, tra, freg, bakeTransform=bake
+        )
+        cards = sorted(set(_planeCards(region)))
+        assert cards == sorted(expected)
+
+
+def test_Geant42FlukaConversion_polyhedraBodiesMatchPerBody():
+    import numpy as _np
+    import pyg4ometry.convert as _convert
+    import pyg4ometry.fluka as _fluka
+    import pyg4ometry.geant4 as _g4
+    import pyg4ometry.transformation as _transformation
+
+    reg = _g4.Registry()
+    zPlane, rInner, rOuter = [-20, 30], [10, 10], [50, 40]
+    solid = _g4.solid.Polyhedra("phdr", 0.2, 1.5, 5, 2, zPlane, rInner, rOuter, reg)
+    mtra = _transformation.tbxyz2matrix([0.3, -0.7, 1.1])
+    tra = _np.array([10.0, -20.0, 30.0])
+
+    # the per-body formula the batched planes replaced, with lengths in cm
+    pZ = [zPlane[0] * 0.1] + [z * 0.1 for z in zPlane] + [z * 0.1 for z in zPlane[-1:0:-1]]
+    pR = [rInner[0] * 0.1] + [r * 0.1 for r in rOuter] + [r * 0.1 for r in rInner[-1:0:-1]]
+    zrListConvex = _convert.geant42Fluka._PolygonProcessing.decomposePolygon2d(
+        _np.array([[z, r] for z, r in zip(pZ, pR)][::-1])
+    )
+    dPhi = 1.5 / 5
+
+    for bake in (False, True):
+        m, t = (mtra, tra) if bake else (None, None)
+        expected = []
+        for zr in zrListConvex:
+            for j in range(5):
+                phi1 = dPhi * j + 0.2
+                phi2 = dPhi * (j + 1) + 0.2
+                for k in range(len(zr)):
+                    z1, r1 = zr[k][0], zr[k][1]
+                    z2, r2 = zr[(k + 1) % len(zr)][0], zr[(k + 1) % len(zr)][1]
+                    x1p1, y1p1 = r1 * _np.cos(phi1), r1 * _np.sin(phi1)
+                    x1p2, y1p2 = r1 * _np.cos(phi2), r1 * _np.sin(phi2)
+                    x2p1, y2p1 = r2 * _np.cos(phi1), r2 * _np.sin(phi1)
+                    dx1, dy1, dz1 = x2p1 - x1p1, y2p1 - y1p1, z2 - z1
+                    l1 = _np.sqrt(dx1**2 + dy1**2 + dz1**2)
+                    dx1, dy1, dz1 = dx1 / l1, dy1 / l1, dz1 / l1
+                    dx2, dy2, dz2 = x1p2 - x1p1, y1p2 - y1p1, 0
+                    l2 = _np.sqrt(dx2**2 + dy2**2 + dz2**2)
+                    dx2, dy2, dz2 = dx2 / l2, dy2 / l2, dz2 / l2
+                    nx = dy1 * dz2 - dz1 * dy2
+                    ny = dz1 * dx2 - dx1 * dz2
+                    nz = dx1 * dy2 - dy1 * dx2
+                    expected.append(
+                        _perBodyPlaneCard(
+                            "0000", len(expected), [nx, ny, nz], [x1p1, y1p1, z1], m, t
+                        )
+                    )
+                for normal in (
+                    [_np.cos(phi1 - _np.pi / 2.0), _np.sin(phi1 - _np.pi / 2.0), 0],
+                    [_np.cos(phi2 + _np.pi / 2.0), _np.sin(phi2 + _np.pi / 2.0), 0],
+                ):
+                    expected.append(
+                        _perBodyPlaneCard("0000", len(expected), normal, [0, 0, 0], m, t)
+                    )
+
+        freg = _fluka.FlukaRegistry()
+        region, _ = _convert.geant42Fluka.geant4Polyhedra2Fluka(
+            0, solid, mtra, tra, freg, bakeTransform=bake
+        )
+        cards = sorted(set(_planeCards(region)))
+        assert cards == sorted(expected)
+
+
+def test_Geant42FlukaConversion_meshBodiesMatchPerBody():
+    import numpy as _np
+    import pyg4ometry.convert as _convert
+    import pyg4ometry.fluka as _fluka
+    import pyg4ometry.geant4 as _g4
+    import pyg4ometry.pycgal as _pycgal
+    import pyg4ometry.transformation as _transformation
+
+    reg = _g4.Registry()
+    solid = _g4.solid.Trd("trd", 30, 10, 40, 15, 50, reg)
+    mesh = solid.mesh()
+    mtra = _transformation.tbxyz2matrix([0.3, -0.7, 1.1])
+    tra = _np.array([10.0, -20.0, 30.0])
+
+    # the per-body formula the batched planes replaced
+    polyhedron = _pycgal.Polyhedron_3.Polyhedron_3_EPECK()
+    _pycgal.CGAL.copy_face_graph(mesh.exactSurfaceMesh(), polyhedron)
+    nef = _pycgal.Nef_polyhedron_3.Nef_polyhedron_3_EPECK(polyhedron)
+    planes = [
+        plane
+        for convex in _pycgal.PolyhedronProcessing.nefPolyhedron_to_convexPolyhedra(nef)
+        for plane in _pycgal.PolyhedronProcessing.polyhedron_to_numpyArrayPlanes(convex)
+    ]
+
+    for bake in (False, True):
+        expected = []
+        for ibody, plane in enumerate(planes):
+            plane = _np.asarray(plane, dtype=float)
+            if not bake:
+                normal = -plane[3:] / _np.sqrt((plane[3:] ** 2).sum())
+                point = plane[0:3] / 10.0
+            else:
+                normal = mtra @ -plane[3:] / _np.sqrt((plane[3:] ** 2).sum())
+                point = mtra @ plane[0:3] / 10 + tra / 10
+            expected.append(_perBodyPlaneCard("trd", ibody, normal, point))
+
+        freg = _fluka.FlukaRegistry()
+        region = _convert.geant42Fluka.pycsgmesh2FlukaRegion(
+            mesh, "trd", mtra, tra, freg, bakeTransform=bake
+        )
+        cards = sorted(set(_planeCards(region)))
+        assert cards == sorted(expected)
+
+
+def test_Geant42FlukaConversion_collidingHashesNotShared():
+    import numpy as _np
+    import pyg4ometry.convert as _convert
+    import pyg4ometry.fluka as _fluka
+    import pyg4ometry.geant4 as _g4
+
+    # hash(-1.0) == hash(-2.0), the bodies must still be told apart
+    assert hash(-1.0) == hash(-2.0)
+
+    reg = _g4.Registry()
+    b1 = _g4.solid.Box("b1", 10, 10, 10, reg, "mm")
+    b2 = _g4.solid.Box("b2", 10, 10, 10, reg, "mm")
+
+    freg = _fluka.FlukaRegistry()
+    mtra = _np.identity(3)
+    r1, count = _convert.geant4Solid2FlukaRegion(0, b1, mtra, _np.array([-1, 0, 0]), freg)
+    r2, count = _convert.geant4Solid2FlukaRegion(count, b2, mtra, _np.array([-2, 0, 0]), freg)
+    assert not r1.bodies() & r2.bodies()
+
+    z1 = freg.makeBody(_fluka.XYP, "z1", -1, flukaregistry=freg)
+    z2 = freg.makeBody(_fluka.XYP, "z2", -2, flukaregistry=freg)
+    assert z1 is not z2
+    assert freg.makeBody(_fluka.XYP, "z3", -1, flukaregistry=freg) is z1
+
+
+def test_Geant42FlukaConversion_extruderNotMemoised():
+    import numpy as _np
+    import pyg4ometry
+    import pyg4ometry.convert as _convert
+    import pyg4ometry.fluka as _fluka
+
+    reg = pyg4ometry.geant4.Registry()
+    au = pyg4ometry.geant4.nist_material_2geant4Material("G4_Au", reg)
+    fe = pyg4ometry.geant4.nist_material_2geant4Material("G4_Fe", reg)
+    es = _fluka.Extruder("Magnet", length=500, registry=reg)
+    outer = es.addRegion("outer")
+    es.setRegionMaterial("outer", au)
+    outer.extend([[-100, -100], [-100, 100], [100, 100], [100, -100]])
+    es.setRegionToOuterBoundary("outer")
+    pole = es.addRegion("pole")
+    es.setRegionMaterial("pole", fe)
+    pole.extend([[-50, -50], [-50, 50], [50, 50], [50, -50]])
+    es.buildCgalPolygons()
+    es.buildGeant4Extrusions()
+
+    freg = _fluka.FlukaRegistry()
+    _convert.geant42Fluka.geant4MaterialDict2Fluka(reg.materialDict, freg)
+    mtra = _np.identity(3)
+    tra = _np.zeros(3)
+
+    # the decomposed regions and their materials are added for every instance
+    count = 0
+    nRegions = []
+    for _ in range(2):
+        _, count = _convert.geant4Solid2FlukaRegion(count, es, mtra, tra, freg)
+        nRegions.append(len(freg.regionDict))
+    assert nRegions[1] == 2 * nRegions[0] > 0
+    assert all(name in freg.assignmas for name in freg.regionDict)
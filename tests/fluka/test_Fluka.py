@@ -1,9 +1,11 @@
+import multiprocessing
 from random import random
 import numpy as np
 import pytest
 
 import pyg4ometry.visualisation.VtkViewerNew as _VtkViewerNew
-from pyg4ometry.fluka.fluka_registry import RotoTranslationStore, FlukaRegistry
+from pyg4ometry.fluka.fluka_registry import RotoTranslationStore, FlukaRegistry, FlukaBodyStore
+from pyg4ometry.fluka import body as _body
 from pyg4ometry.fluka.directive import rotoTranslationFromTra2
 
 import T001_RPP
@@ -1408,6 +1410,236 @@ def test_addRotoTranslation():
     #    store.addRotoTranslation(rtrans5)
 
 
+def test_FlukaBodyStore_degenerateBodies():
+    store = FlukaBodyStore()
+
+    xyp = store.make(_body.XYP, "xyp", 10.0)
+    assert store.make(_body.XYP, "xyp2", 10.0 + 1e-9) is xyp
+    assert store.make(_body.PLA, "pla", [0, 0, 2], [5, 5, 10]) is xyp
+    assert store.make(_body.XYP, "xyp3", 11.0) is not xyp
+
+    zcc = store.make(_body.ZCC, "zcc", 1.0, 2.0, 5.0)
+    assert store.make(_body.ZCC, "zcc2", 1.0, 2.0, 5.0) is zcc
+    assert store.make(_body.ZCC, "zcc3", 1.0, 2.0, 6.0) is not zcc
+    assert store.make(_body.ZCC, "zcc4", 2.0, 2.0, 5.0) is not zcc
+
+    assert len(store) == 5
+    assert "xyp3" in store
+    assert store["zcc"] is zcc
+
+    del store["xyp"]
+    assert "xyp" not in store
+    assert store.make(_body.XYP, "xyp5", 10.0).name == "xyp5"
+
+
+def test_FlukaBodyStoreExact_deleteIdenticalBody():
+    from pyg4ometry.fluka.fluka_registry import FlukaBodyStoreExact
+
+    store = FlukaBodyStoreExact()
+    a = _body.XYP("a", 1.0)
+    b = _body.XYP("b", 1.0)
+    store.addBody(a)
+    store.addBody(b)
+    assert store.getDegenerateBody(_body.XYP("c", 1.0)) is a
+
+    # the identical body left behind is found once the first is deleted
+    del store["a"]
+    assert store.getDegenerateBody(_body.XYP("d", 1.0)) is b
+    assert store.hashName[b.key()] == "b"
+
+    del store["b"]
+    e = _body.XYP("e", 1.0)
+    assert store.getDegenerateBody(e) is e
+
+
+def test_Zone_analyticAABB():
+    from pyg4ometry.fluka.region import Zone
+    from pyg4ometry.fluka.vector import AABB
+
+    freg = FlukaRegistry()
+    sph = _body.SPH("sph", [0, 0, 0], 10, flukaregistry=freg)
+    hole = _body.SPH("hole", [0, 0, 0], 5, flukaregistry=freg)
+    far = _body.SPH("far", [50, 0, 0], 10, flukaregistry=freg)
+    zcc = _body.ZCC("zcc", 1, 2, 3, flukaregistry=freg)
+    xyp = _body.XYP("xyp", 20, flukaregistry=freg)
+    xyp2 = _body.XYP("xyp2", -20, flukaregistry=freg)
+
+    hollow = Zone()
+    hollow.addIntersection(sph)
+    hollow.addSubtraction(hole)
+    aabb = hollow.aabb()
+    assert np.allclose(aabb.lower, [-10, -10, -10])
+    assert np.allclose(aabb.upper, [10, 10, 10])
+    meshed = hollow.aabb(analytic=False)
+    assert (np.asarray(meshed.lower) >= np.asarray(aabb.lower) - 1e-6).all()
+    assert (np.asarray(meshed.upper) <= np.asarray(aabb.upper) + 1e-6).all()
+
+    cylinder = Zone()
+    cylinder.addIntersection(zcc)
+    cylinder.addIntersection(xyp)
+    cylinder.addSubtraction(xyp2)
+    aabb = cylinder.aabb()
+    assert np.allclose(aabb.lower, [-2, -1, -20])
+    assert np.allclose(aabb.upper, [4, 5, 20])
+
+    null = Zone()
+    null.addIntersection(sph)
+    null.addIntersection(far)
+    with pytest.raises(ValueError, match="Null zone"):
+        null.aabb()
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="processes cannot be forked"
+)
+def test_fluka2Geant4_parallelMatchesSerial(monkeypatch):
+    import concurrent.futures
+    import pyg4ometry.convert as _convert
+    from pyg4ometry.fluka import Region, Zone
+    from pyg4ometry.fluka import analytic_aabb
+
+    freg = FlukaRegistry()
+    for i in range(4):
+        # the sphere cuts the box along all three axes, so the zone has to be meshed
+        rpp = _body.RPP(f"rpp{i}", 20 * i, 20 * i + 10, 0, 10, 0, 10, flukaregistry=freg)
+        sph = _body.SPH(f"sph{i}", [20 * i, 5, 5], 6, flukaregistry=freg)
+        zone = Zone(name=f"z{i}")
+        zone.addIntersection(rpp)
+        zone.addIntersection(sph)
+        assert analytic_aabb.zoneAABB(zone) == (False, None)
+        region = Region(f"REG{i}")
+        region.addZone(zone)
+        freg.addRegion(region)
+        freg.assignma("COPPER", region)
+
+    pools = []
+
+    class CountingExecutor(concurrent.futures.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(kwargs)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", CountingExecutor)
+
+    serial = _convert.fluka2Geant4(freg)
+    assert not pools
+    parallel = _convert.fluka2Geant4(freg, workers=2)
+    assert len(pools) == 1
+
+    def materials(reg):
+        return {name: str(lv.material.name) for name, lv in reg.logicalVolumeDict.items()}
+
+    assert list(serial.solidDict) == list(parallel.solidDict)
+    assert list(serial.logicalVolumeDict) == list(parallel.logicalVolumeDict)
+    assert materials(serial) == materials(parallel)
+    assert list(serial.physicalVolumeDict) == list(parallel.physicalVolumeDict)
+    for name, pv in serial.physicalVolumeDict.items():
+        assert np.allclose(pv.position.eval(), parallel.physicalVolumeDict[name].position.eval())
+    for name, solid in serial.solidDict.items():
+        assert solid.type == parallel.solidDict[name].type
+
+
+def test_Zone_toDNF():
+    from pyg4ometry.exceptions import FLUKAError
+    from pyg4ometry.fluka import Zone, boolean_algebra
+
+    freg = FlukaRegistry()
+    a, b, c, d = (_body.XYP(name, i, flukaregistry=freg) for i, name in enumerate("abcd"))
+
+    # a - (b - c) - (a - d) = a + c + d | a + d - b, dropping a - a
+    inner1 = Zone()
+    inner1.addIntersection(b)
+    inner1.addSubtraction(c)
+    inner2 = Zone()
+    inner2.addIntersection(a)
+    inner2.addSubtraction(d)
+    zone = Zone()
+    zone.addIntersection(a)
+    zone.addSubtraction(inner1)
+    zone.addSubtraction(inner2)
+
+    dnf = zone.toDNF("dnf")
+    assert dnf.isDNF()
+    terms = [
+        (
+            [i.body.name for i in z.intersections],
+            [s.body.name for s in z.subtractions],
+        )
+        for z in dnf.zones
+    ]
+    assert terms == [(["a", "c", "d"], []), (["a", "d"], ["b"])]
+
+    with pytest.raises(FLUKAError):
+        boolean_algebra.zoneToDNFZones(zone, termLimit=1)
+
+
+def test_Region_connectedZones():
+    from pyg4ometry.fluka import Region, Zone
+
+    freg = FlukaRegistry()
+    region = Region("reg")
+    for i, x in enumerate([0, 5, 100, 8]):
+        rpp = _body.RPP(f"rpp{i}", x, x + 10, 0, 10, 0, 10, flukaregistry=freg)
+        zone = Zone()
+        zone.addIntersection(rpp)
+        region.addZone(zone)
+
+    components = sorted(sorted(c) for c in region.connectedZones())
+    assert components == [[0, 1, 3], [2]]
+
+
+def test_FlukaRegistry_derive():
+    from pyg4ometry.fluka import Region, Zone
+
+    freg = FlukaRegistry()
+    rpp = _body.RPP("rpp", 0, 10, 0, 10, 0, 10, flukaregistry=freg)
+    zone = Zone()
+    zone.addIntersection(rpp)
+    region = Region("REG")
+    region.addZone(zone)
+    freg.addRegion(region)
+    freg.assignma("COPPER", region)
+
+    derived = freg.derive()
+    assert not derived.regionDict
+    assert "rpp" not in derived.bodyDict
+    assert derived.materials["COPPER"] is freg.materials["COPPER"]
+    derived.assignmas.pop("REG")
+    assert "REG" in freg.assignmas
+
+
+def test_Writer_compressed(tmptestdir):
+    import gzip
+    import time
+    from pyg4ometry.fluka import Region, Transform, Writer, Zone
+
+    freg = FlukaRegistry()
+    rtrans = rotoTranslationFromTra2("rt", [[0, 0, 0.5], [0, 0, 20]])
+    transform = Transform(rotoTranslation=rtrans)
+    rpp1 = _body.RPP("rpp1", 0, 1, 0, 1, 0, 1, transform=transform, flukaregistry=freg)
+    rpp2 = _body.RPP("rpp2", 0, 2, 0, 2, 0, 2, transform=transform, flukaregistry=freg)
+    zone = Zone()
+    zone.addIntersection(rpp2)
+    zone.addSubtraction(rpp1)
+    region = Region("REG")
+    region.addZone(zone)
+    freg.addRegion(region)
+    freg.assignma("COPPER", region)
+
+    w = Writer()
+    w.addDetector(freg)
+    w.write(tmptestdir / "writer.inp")
+    w.write(tmptestdir / "writer.inp.gz")
+
+    with gzip.open(tmptestdir / "writer.inp.gz", "rt") as f:
+        text = f.read()
+    assert text == (tmptestdir / "writer.inp").read_text()
+    assert text.count("$start_transform rt") == 2
+    assert "bodies" in w.timer.samples
+    assert "total" in w.timer.samples
+    assert w.timer.clock is time.perf_counter
+
+
 def test_fluka_vis(tmptestdir, testdata):
     r = T902_cube_from_six_PLAs.Test(
         False,
@@ -160,6 +160,93 @@ def test_GdmlDefine_FuncAbs():
     assert xc.eval() == 1.0
 
 
+def test_GdmlDefine_ExpressionCompiledMatchesANTLR():
+    from pyg4ometry.gdml.GdmlExpression.GdmlExpressionCompiler import CompiledExpression
+
+    r = pyg4ometry.geant4.Registry()
+    pyg4ometry.gdml.Constant("a", "2", r)
+    pyg4ometry.gdml.Constant("b", "-3.5", r)
+    parser = r.getExpressionParser()
+    for e in ["-2^2", "2^3^2", "a*b+1/2", "sin(a)+pow(a,3)", "max(a,b)", "-(a+b)*-a", "3*deg"]:
+        expected = parser.evaluate(parser.parse(e), r.defineDict)
+        compiled = parser.compile(e)
+        assert isinstance(compiled, CompiledExpression)
+        assert compiled.evaluate(r.defineDict) == expected
+        assert compiled.variables == parser.get_variables(parser.parse(e))
+
+
+def test_GdmlDefine_ExpressionCompiledCache():
+    from pyg4ometry.gdml.GdmlExpression.GdmlExpressionEval import ParsedExpression
+
+    r = pyg4ometry.geant4.Registry()
+    parser = r.getExpressionParser()
+    assert parser.compile("1+2") is parser.compile("1+2")
+    # not handled by the fast path so parsed by ANTLR
+    assert isinstance(parser.compile("1e2.5"), ParsedExpression)
+
+
+def test_GdmlDefine_ValueCacheInvalidation():
+    r = pyg4ometry.geant4.Registry()
+    a = pyg4ometry.gdml.Constant("a", "2", r)
+    b = pyg4ometry.gdml.Variable("b", "a*3", r)
+    c = pyg4ometry.gdml.Constant("c", "5", r)
+    p = pyg4ometry.gdml.Position("p", "b", "c", "0", "mm", r)
+    assert p.eval() == [6, 5, 0]
+    assert r.defineValueCache["b"] == 6
+    assert "b" in r.defineDependents["a"]
+
+    # only the transitive dependents of a are invalidated
+    a.setExpression("4")
+    assert "b" not in r.defineValueCache
+    assert "p" not in r.defineValueCache
+    assert "c" in r.defineValueCache
+    assert p.eval() == [12, 5, 0]
+
+    # changing the expression string in place is seen too
+    b.expression.expressionString = "a"
+    assert p.eval() == [4, 5, 0]
+
+    # as is changing a unit
+    p.unit = "cm"
+    assert p.eval() == [40, 50, 0]
+
+
+def test_GdmlDefine_ValueCacheFlagsSolids():
+    r = pyg4ometry.geant4.Registry()
+    a = pyg4ometry.gdml.Constant("a", "10", r)
+    b = pyg4ometry.gdml.Constant("b", "2*a", r)
+    c = pyg4ometry.gdml.Constant("c", "1", r)
+    box1 = pyg4ometry.geant4.solid.Box("box1", "b", 10, 10, r)
+    box2 = pyg4ometry.geant4.solid.Box("box2", c, 10, 10, r)
+    assert box1.evaluateParameter(box1.pX) == 20
+    r.editedSolids = []
+
+    a.setExpression("20")
+    assert box1.evaluateParameter(box1.pX) == 40
+    assert r.editedSolids == ["box1"]
+
+    # solids are found from an index of the defines they use, as are solids built from them
+    assert r.defineSolids["b"] == {"box1"}
+    union = pyg4ometry.geant4.solid.Union("union", box1, box2, [[0, 0, 0], [0, 0, 0]], r)
+    lv = pyg4ometry.geant4.LogicalVolume(union, "G4_Fe", "lv", r)
+    r.editedSolids = []
+    r.editedLogicalVolumes = []
+    a.setExpression("30")
+    assert r.editedSolids == ["box1", "union"]
+    assert r.editedLogicalVolumes == ["lv"]
+
+    # repeated edits flag each name once
+    a.setExpression("40")
+    box1.pY = 20
+    assert r.editedSolids == ["box1", "union"]
+    assert r.editedLogicalVolumes == ["lv"]
+
+    # setting a parameter updates the index
+    box2.pX = "a"
+    assert "box2" in r.defineSolids["a"]
+    assert "box2" not in r.defineSolids["c"]
+
+
 # #############################
 # Constants
 # #############################
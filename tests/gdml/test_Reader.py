@@ -930,3 +930,77 @@ def test_GdmlLoad_Par02FullDetector(testdata):
         testdata["gdml/Par02/Par02FullDetector.gdml"]
     )
     # assert(geant4LoadTest(writtenFilename)) # Overlaps in the orignal file
+
+
+@pytest.mark.parametrize("filename", ["gdml/G01/solids.gdml", "gdml/G04/auxiliary.gdml"])
+def test_GdmlLoad_StreamingMatchesMinidom(testdata, filename):
+    streamed = pyg4ometry.gdml.Reader(testdata[filename]).getRegistry()
+    parsed = pyg4ometry.gdml.Reader(testdata[filename], streaming=False).getRegistry()
+
+    assert list(streamed.defineDict) == list(parsed.defineDict)
+    assert list(streamed.materialDict) == list(parsed.materialDict)
+    assert list(streamed.solidDict) == list(parsed.solidDict)
+    assert list(streamed.logicalVolumeDict) == list(parsed.logicalVolumeDict)
+    assert list(streamed.physicalVolumeDict) == list(parsed.physicalVolumeDict)
+    assert len(streamed.userInfo) == len(parsed.userInfo)
+    assert streamed.getWorldVolume().name == parsed.getWorldVolume().name
+
+    for name, define in streamed.defineDict.items():
+        assert str(define.eval()) == str(parsed.defineDict[name].eval())
+
+
+def test_GdmlWrite_EscapingMatchesMinidom():
+    from xml.dom import minidom
+    from pyg4ometry.gdml.Writer import _XmlDocument
+
+    # compared with minidom of the running Python, whose escaping changed in 3.13
+    values = ["a & b < c > d", 'say "hi"', "it's", "tab\tnew\nline\rreturn", "&amp;"]
+    outputs = []
+    for doc in [
+        _XmlDocument("gdml"),
+        minidom.getDOMImplementation().createDocument(None, "gdml", None),
+    ]:
+        for value in values:
+            element = doc.createElement("auxiliary")
+            element.setAttribute("auxvalue", value)
+            doc.documentElement.appendChild(element)
+            element = doc.createElement("text")
+            element.appendChild(doc.createTextNode(value))
+            doc.documentElement.appendChild(element)
+        outputs.append(doc.toprettyxml())
+
+    assert outputs[0] == outputs[1]
+    assert "a &amp; b &lt; c &gt; d" in outputs[0]
+
+
+def test_GdmlWrite_StreamingMatchesMinidom(tmp_path):
+    reg = pyg4ometry.geant4.Registry()
+    pyg4ometry.gdml.Constant("a", "10", reg)
+    pyg4ometry.gdml.Expression("e", "2*a", reg)
+    ws = pyg4ometry.geant4.solid.Box("ws", "e", 100, 100, reg, "mm")
+    vertices = [[0, 0, 0], [10, 0, 0], [0, 10, 0], [0, 0, 10]]
+    facets = [[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]]
+    ts = pyg4ometry.geant4.solid.TessellatedSolid("ts", [vertices, facets], reg)
+    wl = pyg4ometry.geant4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+    tl = pyg4ometry.geant4.LogicalVolume(ts, "G4_Fe", "tl", reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [0, 0, 0], tl, "tp", wl, reg)
+    reg.setWorld(wl.name)
+
+    outputs = {}
+    for streaming in [True, False]:
+        for compact in [True, False]:
+            writer = pyg4ometry.gdml.Writer(streaming=streaming)
+            writer.addDetector(reg)
+            filename = tmp_path / f"out_{streaming}_{compact}.gdml"
+            writer.write(str(filename), compact=compact)
+            outputs[(streaming, compact)] = filename.read_text()
+
+    assert outputs[(True, False)] == outputs[(False, False)]
+    assert outputs[(True, True)] == outputs[(False, True)]
+    assert 'name="ts_3" x="0.000000000000000" y="0.000000000000000" z="10.000000000000000"' in (
+        outputs[(True, False)]
+    )
+
+    # compact output reads back the same
+    loaded = pyg4ometry.gdml.Reader(str(tmp_path / "out_True_True.gdml")).getRegistry()
+    assert list(loaded.solidDict) == list(reg.solidDict)
@@ -203,6 +203,592 @@ def test_Python_FreeCadImportFail():
 # #############################
 # Mesh
 # #############################
+def test_Python_OverlapAABBCandidatePairs():
+    from pyg4ometry.meshutils import aabbCandidatePairs
+
+    aabbs = _np.array(
+        [
+            [[0, 0, 0], [1, 1, 1]],
+            [[0.5, 0.5, 0.5], [2, 2, 2]],
+            [[1, 0, 0], [3, 1, 1]],  # touches 0 on x
+            [[10, 10, 10], [11, 11, 11]],
+        ]
+    )
+    assert aabbCandidatePairs(aabbs) == [(0, 1), (1, 2)]
+    assert aabbCandidatePairs(aabbs, 1e-6) == [(0, 1), (0, 2), (1, 2)]
+
+
+def test_Python_OverlapCullStatistics():
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    ws = pyg4ometry.geant4.solid.Box("ws", 100, 100, 100, reg, "mm")
+    bs = pyg4ometry.geant4.solid.Box("bs", 10, 10, 10, reg, "mm")
+    wl = pyg4ometry.geant4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+    bl = pyg4ometry.geant4.LogicalVolume(bs, "G4_Fe", "bl", reg)
+    for i in range(4):
+        pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [-30 + 20 * i, 0, 0], bl, f"b_pv{i}", wl, reg)
+
+    stats = {"culled": 0, "tested": 0}
+    wl.checkOverlaps(cullStatistics=stats)
+    # 6 daughter pairs and 4 daughters contained in the mother are all culled
+    assert stats == {"culled": 10, "tested": 0}
+
+
+def test_Python_OverlapParallel():
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    ws = pyg4ometry.geant4.solid.Box("ws", 100, 100, 100, reg, "mm")
+    bs = pyg4ometry.geant4.solid.Box("bs", 10, 10, 10, reg, "mm")
+    wl = pyg4ometry.geant4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+    bl = pyg4ometry.geant4.LogicalVolume(bs, "G4_Fe", "bl", reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [0, 0, 0], bl, "b_pv1", wl, reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [5, 0, 0], bl, "b_pv2", wl, reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [48, 0, 0], bl, "b_pv3", wl, reg)
+
+    nOverlaps = [0]
+    wl.checkOverlaps(recursive=True, nOverlapsDetected=nOverlaps, workers=2)
+    # one daughter-daughter overlap and one protrusion from the mother
+    assert nOverlaps[0] == 2
+    assert len(wl.mesh.overlapmeshes) == 2
+
+
+def test_Python_MeshCache():
+    import pyg4ometry
+    from pyg4ometry.geant4.solid.MeshCache import meshCache, meshCacheKey
+
+    meshCache.clear()
+    reg = pyg4ometry.geant4.Registry()
+    a = pyg4ometry.gdml.Constant("a", "10", reg)
+    bs1 = pyg4ometry.geant4.solid.Box("bs1", "2*a", 10, 10, reg, "mm")
+    bs2 = pyg4ometry.geant4.solid.Box("bs2", 20, 10, 10, reg, "mm")
+    us = pyg4ometry.geant4.solid.Union("us", bs1, bs2, [[0, 0, 0], [5, 0, 0]], reg)
+    assert meshCacheKey(bs1) == meshCacheKey(bs2)
+
+    bl1 = pyg4ometry.geant4.LogicalVolume(bs1, "G4_Fe", "bl1", reg)
+    bl2 = pyg4ometry.geant4.LogicalVolume(bs2, "G4_Fe", "bl2", reg)
+    ul = pyg4ometry.geant4.LogicalVolume(us, "G4_Fe", "ul", reg)
+    reg.meshAll(parallel=False)
+    # the box is meshed once, the union once
+    assert meshCache.misses == 2
+    assert len(meshCache) == 2
+    assert bl1.mesh.localmesh is not bl2.mesh.localmesh
+
+    # editing a parameter drops the box and the union using it
+    bs1.pX = 30
+    assert len(meshCache) == 0
+    bl1.reMesh()
+    assert bl1.mesh.getBoundingBox()[1][0] == pytest.approx(15)
+    assert meshCache.misses == 3
+
+
+def test_Python_MeshDiskCache(tmp_path, monkeypatch):
+    import pyg4ometry
+    from pyg4ometry.geant4.solid.MeshCache import meshCache, meshCacheKey, MeshDiskCache
+
+    monkeypatch.setattr(pyg4ometry.config, "meshDiskCacheDir", str(tmp_path))
+    meshCache.clear()
+    reg = pyg4ometry.geant4.Registry()
+    bs = pyg4ometry.geant4.solid.Box("bs", 10, 20, 30, reg, "mm")
+    bl = pyg4ometry.geant4.LogicalVolume(bs, "G4_Fe", "bl", reg)
+    bl.mesh  # meshed lazily when first used
+    cache = MeshDiskCache(str(tmp_path))
+    assert cache.info()[0] == 1
+
+    # a new session only has the on-disk cache
+    meshCache.clear()
+    bl.reMesh()
+    assert _np.array(bl.mesh.getBoundingBox()) == pytest.approx(
+        _np.array([[-5, -10, -15], [5, 10, 15]])
+    )
+
+    # meshes from another cache format are not used
+    assert cache.contains(meshCacheKey(bs))
+    monkeypatch.setattr(MeshDiskCache, "formatVersion", MeshDiskCache.formatVersion + 1)
+    assert not cache.contains(meshCacheKey(bs))
+
+    assert cache.prune(0) == 1
+    assert cache.info() == (0, 0)
+
+
+def test_Python_LazyMeshing(monkeypatch):
+    import pyg4ometry
+    from pyg4ometry.geant4.solid.MeshCache import meshCache
+
+    # by default logical volumes are meshed on construction
+    reg = pyg4ometry.geant4.Registry()
+    bs = pyg4ometry.geant4.solid.Box("bs", 10, 10, 10, reg, "mm")
+    assert pyg4ometry.geant4.LogicalVolume(bs, "G4_Fe", "bl", reg).isMeshed()
+
+    monkeypatch.setattr(pyg4ometry.config, "lazyMeshing", True)
+    meshCache.clear()
+    reg = pyg4ometry.geant4.Registry()
+    bs = pyg4ometry.geant4.solid.Box("bs", 10, 10, 10, reg, "mm")
+    ts = pyg4ometry.geant4.solid.Tubs("ts", 0, 10, 10, 0, "2*pi", reg, "mm", "rad")
+    bl = pyg4ometry.geant4.LogicalVolume(bs, "G4_Fe", "bl", reg)
+    tl = pyg4ometry.geant4.LogicalVolume(ts, "G4_Fe", "tl", reg)
+
+    # nothing is meshed until used
+    assert not bl.isMeshed()
+    assert meshCache.misses == 0
+    assert bl.mesh.getBoundingBox()[1][0] == pytest.approx(5)
+    assert bl.isMeshed()
+    assert not tl.isMeshed()
+
+    reg.meshAll()
+    assert tl.isMeshed()
+    assert tl.mesh.getBoundingBox()[1][0] == pytest.approx(10)
+
+    # doMeshing = False also stops lazy meshing
+    monkeypatch.setattr(pyg4ometry.config, "doMeshing", False)
+    nl = pyg4ometry.geant4.LogicalVolume(bs, "G4_Fe", "nl", reg)
+    assert nl.mesh is None
+    assert not nl.isMeshed()
+    nl.reMesh()
+    assert nl.isMeshed()
+
+
+def test_Python_ArrayMesh():
+    import pyg4ometry
+    from pyg4ometry.geant4.solid.ArrayMesh import polygonsToArrays
+
+    # shared corners are merged and faces keep their vertex count
+    square = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]]
+    vertices, faces = polygonsToArrays([square], [[square[0], square[2], [0, 0, 1]]])
+    assert vertices.shape == (5, 3)
+    assert faces[0].tolist() == [[0, 1, 2, 3]]
+    assert faces[1].tolist() == [[0, 2, 4]]
+
+    reg = pyg4ometry.geant4.Registry()
+    ts = pyg4ometry.geant4.solid.Tubs("ts", 5, 10, 20, 0, "pi", reg, "mm", "rad", nslice=16)
+    vertices, faces = ts.meshArrays()
+    assert vertices.shape == (4 * 17, 3)
+    assert sum(len(f) for f in faces) == 2 + 4 * 16
+    assert ts.mesh().volume() == pytest.approx(_np.pi / 2 * (10**2 - 5**2) * 20, rel=1e-2)
+
+    ps = pyg4ometry.geant4.solid.Polycone(
+        "ps", 0, "2*pi", [-10, 10], [0, 0], [5, 10], reg, "mm", "rad", nslice=32
+    )
+    assert ps.mesh().volume() == pytest.approx(_np.pi * 20 / 3 * (25 + 50 + 100), rel=1e-2)
+
+
+# face sets of the polygon meshes from before the array meshing, nslice/nstack kept small
+_arrayMeshFaceSets = [
+    # tubs solid closed
+    (
+        "Tubs",
+        [0, 10, 20, 0, "2*pi"],
+        {"nslice": 3},
+        [
+            [-5.0, -8.660254038, -10.0],
+            [-5.0, -8.660254038, 10.0],
+            [-5.0, 8.660254038, -10.0],
+            [-5.0, 8.660254038, 10.0],
+            [0.0, 0.0, -10.0],
+            [0.0, 0.0, 10.0],
+            [10.0, 0.0, -10.0],
+            [10.0, 0.0, 10.0],
+        ],
+        [
+            [0, 1, 3, 2],
+            [0, 2, 4],
+            [0, 4, 6],
+            [0, 6, 7, 1],
+            [1, 5, 3],
+            [1, 7, 5],
+            [2, 3, 7, 6],
+            [2, 6, 4],
+            [3, 5, 7],
+        ],
+    ),
+    # tubs hollow open
+    (
+        "Tubs",
+        [5, 10, 20, 0, "pi"],
+        {"nslice": 3},
+        [
+            [-10.0, 0.0, -10.0],
+            [-10.0, 0.0, 10.0],
+            [-5.0, 0.0, -10.0],
+            [-5.0, 0.0, 10.0],
+            [-5.0, 8.660254038, -10.0],
+            [-5.0, 8.660254038, 10.0],
+            [-2.5, 4.330127019, -10.0],
+            [-2.5, 4.330127019, 10.0],
+            [2.5, 4.330127019, -10.0],
+            [2.5, 4.330127019, 10.0],
+            [5.0, 0.0, -10.0],
+            [5.0, 0.0, 10.0],
+            [5.0, 8.660254038, -10.0],
+            [5.0, 8.660254038, 10.0],
+            [10.0, 0.0, -10.0],
+            [10.0, 0.0, 10.0],
+        ],
+        [
+            [0, 1, 5, 4],
+            [0, 2, 3, 1],
+            [0, 4, 6, 2],
+            [1, 3, 7, 5],
+            [2, 6, 7, 3],
+            [4, 5, 13, 12],
+            [4, 12, 8, 6],
+            [5, 7, 9, 13],
+            [6, 8, 9, 7],
+            [8, 10, 11, 9],
+            [8, 12, 14, 10],
+            [9, 11, 15, 13],
+            [10, 14, 15, 11],
+            [12, 13, 15, 14],
+        ],
+    ),
+    # cons solid closed
+    (
+        "Cons",
+        [0, 10, 0, 5, 20, 0, "2*pi"],
+        {"nslice": 3},
+        [
+            [-5.0, -8.660254038, -10.0],
+            [-5.0, 8.660254038, -10.0],
+            [-2.5, -4.330127019, 10.0],
+            [-2.5, 4.330127019, 10.0],
+            [0.0, 0.0, -10.0],
+            [0.0, 0.0, 10.0],
+            [5.0, 0.0, 10.0],
+            [10.0, 0.0, -10.0],
+        ],
+        [
+            [0, 1, 4],
+            [0, 2, 3, 1],
+            [0, 4, 7],
+            [0, 7, 6, 2],
+            [1, 3, 6, 7],
+            [1, 7, 4],
+            [2, 5, 3],
+            [2, 6, 5],
+            [3, 5, 6],
+        ],
+    ),
+    # cons hollow open
+    (
+        "Cons",
+        [3, 10, 2, 5, 20, 0, "pi"],
+        {"nslice": 3},
+        [
+            [-10.0, 0.0, -10.0],
+            [-5.0, 0.0, 10.0],
+            [-5.0, 8.660254038, -10.0],
+            [-3.0, 0.0, -10.0],
+            [-2.5, 4.330127019, 10.0],
+            [-2.0, 0.0, 10.0],
+            [-1.5, 2.598076211, -10.0],
+            [-1.0, 1.732050808, 10.0],
+            [1.0, 1.732050808, 10.0],
+            [1.5, 2.598076211, -10.0],
+            [2.0, 0.0, 10.0],
+            [2.5, 4.330127019, 10.0],
+            [3.0, 0.0, -10.0],
+            [5.0, 0.0, 10.0],
+            [5.0, 8.660254038, -10.0],
+            [10.0, 0.0, -10.0],
+        ],
+        [
+            [0, 1, 4, 2],
+            [0, 2, 6, 3],
+            [0, 3, 5, 1],
+            [1, 5, 7, 4],
+            [2, 4, 11, 14],
+            [2, 14, 9, 6],
+            [3, 6, 7, 5],
+            [4, 7, 8, 11],
+            [6, 9, 8, 7],
+            [8, 9, 12, 10],
+            [8, 10, 13, 11],
+            [9, 14, 15, 12],
+            [10, 12, 15, 13],
+            [11, 13, 15, 14],
+        ],
+    ),
+    # sphere solid closed
+    (
+        "Sphere",
+        [0, 10, 0, "2*pi", 0, "pi"],
+        {"nslice": 3, "nstack": 2},
+        [
+            [-5.0, -8.660254038, 0.0],
+            [-5.0, 8.660254038, 0.0],
+            [0.0, 0.0, -10.0],
+            [0.0, 0.0, 10.0],
+            [10.0, 0.0, 0.0],
+        ],
+        [[0, 1, 2], [0, 2, 4], [0, 3, 1], [0, 4, 3], [1, 3, 4], [1, 4, 2]],
+    ),
+    # sphere hollow open
+    (
+        "Sphere",
+        [5, 10, 0, "pi", 0.5, 1.5],
+        {"nslice": 3, "nstack": 2},
+        [
+            [-9.489846194, 0.0, 3.153223624],
+            [-9.092974268, 0.0, -4.161468365],
+            [-4.794255386, 0.0, 8.775825619],
+            [-4.744923097, 0.0, 1.576611812],
+            [-4.744923097, 8.218447882, 3.153223624],
+            [-4.546487134, 0.0, -2.080734183],
+            [-4.546487134, 7.874746712, -4.161468365],
+            [-2.397127693, 0.0, 4.387912809],
+            [-2.397127693, 4.151946957, 8.775825619],
+            [-2.372461548, 4.109223941, 1.576611812],
+            [-2.273243567, 3.937373356, -2.080734183],
+            [-1.198563847, 2.075973478, 4.387912809],
+            [1.198563847, 2.075973478, 4.387912809],
+            [2.273243567, 3.937373356, -2.080734183],
+            [2.372461548, 4.109223941, 1.576611812],
+            [2.397127693, 0.0, 4.387912809],
+            [2.397127693, 4.151946957, 8.775825619],
+            [4.546487134, 0.0, -2.080734183],
+            [4.546487134, 7.874746712, -4.161468365],
+            [4.744923097, 0.0, 1.576611812],
+            [4.744923097, 8.218447882, 3.153223624],
+            [4.794255386, 0.0, 8.775825619],
+            [9.092974268, 0.0, -4.161468365],
+            [9.489846194, 0.0, 3.153223624],
+        ],
+        [
+            [0, 1, 5, 3],
+            [0, 2, 8, 4],
+            [0, 3, 7, 2],
+            [0, 4, 6, 1],
+            [1, 6, 10, 5],
+            [2, 7, 11, 8],
+            [3, 5, 10, 9],
+            [3, 9, 11, 7],
+            [4, 8, 16, 20],
+            [4, 20, 18, 6],
+            [6, 18, 13, 10],
+            [8, 11, 12, 16],
+            [9, 10, 13, 14],
+            [9, 14, 12, 11],
+            [12, 14, 19, 15],
+            [12, 15, 21, 16],
+            [13, 17, 19, 14],
+            [13, 18, 22, 17],
+            [16, 21, 23, 20],
+            [18, 20, 23, 22],
+        ],
+    ),
+    # torus solid closed
+    (
+        "Torus",
+        [0, 5, 20, 0, "2*pi"],
+        {"nslice": 3, "nstack": 3},
+        [
+            [-12.5, -21.650635095, 0.0],
+            [-12.5, 21.650635095, 0.0],
+            [-8.75, -15.155444566, -4.330127019],
+            [-8.75, -15.155444566, 4.330127019],
+            [-8.75, 15.155444566, -4.330127019],
+            [-8.75, 15.155444566, 4.330127019],
+            [17.5, 0.0, -4.330127019],
+            [17.5, 0.0, 4.330127019],
+            [25.0, 0.0, 0.0],
+        ],
+        [
+            [0, 1, 4, 2],
+            [0, 2, 6, 8],
+            [0, 3, 5, 1],
+            [0, 8, 7, 3],
+            [1, 5, 7, 8],
+            [1, 8, 6, 4],
+            [2, 3, 7, 6],
+            [2, 4, 5, 3],
+            [4, 6, 7, 5],
+        ],
+    ),
+    # torus hollow open
+    (
+        "Torus",
+        [2, 5, 20, 0, "pi"],
+        {"nslice": 3, "nstack": 3},
+        [
+            [-25.0, 0.0, 0.0],
+            [-22.0, 0.0, 0.0],
+            [-19.0, 0.0, -1.732050808],
+            [-19.0, 0.0, 1.732050808],
+            [-17.5, 0.0, -4.330127019],
+            [-17.5, 0.0, 4.330127019],
+            [-12.5, 21.650635095, 0.0],
+            [-11.0, 19.052558883, 0.0],
+            [-9.5, 16.454482672, -1.732050808],
+            [-9.5, 16.454482672, 1.732050808],
+            [-8.75, 15.155444566, -4.330127019],
+            [-8.75, 15.155444566, 4.330127019],
+            [8.75, 15.155444566, -4.330127019],
+            [8.75, 15.155444566, 4.330127019],
+            [9.5, 16.454482672, -1.732050808],
+            [9.5, 16.454482672, 1.732050808],
+            [11.0, 19.052558883, 0.0],
+            [12.5, 21.650635095, 0.0],
+            [17.5, 0.0, -4.330127019],
+            [17.5, 0.0, 4.330127019],
+            [19.0, 0.0, -1.732050808],
+            [19.0, 0.0, 1.732050808],
+            [22.0, 0.0, 0.0],
+            [25.0, 0.0, 0.0],
+        ],
+        [
+            [0, 1, 3, 5],
+            [0, 4, 2, 1],
+            [0, 5, 11, 6],
+            [0, 6, 10, 4],
+            [1, 2, 8, 7],
+            [1, 7, 9, 3],
+            [2, 3, 9, 8],
+            [2, 4, 5, 3],
+            [4, 10, 11, 5],
+            [6, 11, 13, 17],
+            [6, 17, 12, 10],
+            [7, 8, 14, 16],
+            [7, 16, 15, 9],
+            [8, 9, 15, 14],
+            [10, 12, 13, 11],
+            [12, 17, 23, 18],
+            [12, 18, 19, 13],
+            [13, 19, 23, 17],
+            [14, 15, 21, 20],
+            [14, 20, 22, 16],
+            [15, 16, 22, 21],
+            [18, 20, 21, 19],
+            [18, 23, 22, 20],
+            [19, 21, 22, 23],
+        ],
+    ),
+]
+
+
+def _canonicalFaces(vertices, faces):
+    # vertices rounded to 1e-9 and sorted, each face as indices starting at its smallest index
+    def key(p):
+        return tuple(round(float(c), 9) + 0.0 for c in p)
+
+    keys = sorted({key(p) for p in vertices})
+    index = {k: i for i, k in enumerate(keys)}
+    canonical = []
+    for face in faces:
+        idx = [index[key(vertices[i])] for i in face]
+        k = idx.index(min(idx))
+        canonical.append(idx[k:] + idx[:k])
+    return [list(k) for k in keys], sorted(canonical)
+
+
+@pytest.mark.parametrize(("solidType", "args", "kwargs", "vertices", "faces"), _arrayMeshFaceSets)
+def test_Python_ArrayMeshFaceSets(solidType, args, kwargs, vertices, faces):
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    solid = getattr(pyg4ometry.geant4.solid, solidType)("s", *args, reg, "mm", "rad", **kwargs)
+    v, f = solid.meshArrays()
+    actualVertices, actualFaces = _canonicalFaces(v, [face for b in f for face in b.tolist()])
+    assert _np.array(actualVertices) == pytest.approx(_np.array(vertices), abs=1e-9)
+    assert actualFaces == faces
+
+
+def test_Python_UnionMeshes():
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    bs = pyg4ometry.geant4.solid.Box("bs", 10, 10, 10, reg, "mm")
+
+    # a disjoint bolt pattern and a chain of overlapping boxes
+    trans = [[[0, 0, 0], [20 * i, 0, 0]] for i in range(8)]
+    trans += [[[0, 0, 0], [5 * i, 50, 0]] for i in range(8)]
+    mu = pyg4ometry.geant4.solid.MultiUnion("mu", [bs] * len(trans), trans, reg)
+
+    mesh = mu.mesh()
+    assert mesh.volume() == pytest.approx(8 * 1000 + 1000 + 7 * 500)
+
+    vertices, faces = mesh.toArrays()
+    assert vertices[:, 0].min() == pytest.approx(-5)
+    assert vertices[:, 0].max() == pytest.approx(145)
+
+
+def test_Python_UnionMeshesParallel(monkeypatch):
+    import concurrent.futures.process
+    import multiprocessing
+    import pyg4ometry
+    from pyg4ometry.geant4.solid import ArrayMesh
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("processes cannot be forked")
+
+    def boxChain():
+        reg = pyg4ometry.geant4.Registry()
+        bs = pyg4ometry.geant4.solid.Box("bs", 10, 10, 10, reg, "mm")
+        meshes = []
+        for i in range(8):
+            mesh = bs.mesh()
+            mesh.translate([5 * i, 0, 0])
+            meshes.append(mesh)
+        return meshes
+
+    submitted = []
+    originalSubmit = concurrent.futures.process.ProcessPoolExecutor.submit
+
+    def submit(executor, function, *args):
+        submitted.append(function)
+        return originalSubmit(executor, function, *args)
+
+    monkeypatch.setattr(concurrent.futures.process.ProcessPoolExecutor, "submit", submit)
+
+    # exact meshes are united in this process and stay exact
+    meshes = boxChain()
+    serial = ArrayMesh.unionMeshes(meshes)
+    parallel = ArrayMesh.unionMeshes(meshes, workers=2)
+    assert not submitted
+    assert parallel.isExact()
+    for a, b in zip(serial.toArrays(), parallel.toArrays()):
+        assert _np.array_equal(a, b)
+
+    # inexact meshes are united in the pool, one for all three levels of the tree
+    monkeypatch.setattr(pyg4ometry.config, "meshing", pyg4ometry.config.meshingType.cgal_epick)
+    meshes = boxChain()
+    serial = ArrayMesh.unionMeshes(meshes)
+    parallel = ArrayMesh.unionMeshes(meshes, workers=2)
+    assert submitted
+    assert parallel.volume() == pytest.approx(serial.volume())
+    assert parallel.volume() == pytest.approx(1000 + 7 * 500)
+
+
+def test_Python_ParameterisedVolumeSharedMeshes():
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    ws = pyg4ometry.geant4.solid.Box("ws", 1000, 1000, 1000, reg, "mm")
+    bs = pyg4ometry.geant4.solid.Box("bs", 10, 10, 10, reg, "mm")
+    wl = pyg4ometry.geant4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+    bl = pyg4ometry.geant4.LogicalVolume(bs, "G4_Fe", "bl", reg)
+
+    ncopies = 100
+    paramData = []
+    transforms = []
+    for i in range(ncopies):
+        size = pyg4ometry.gdml.Expression(f"p_size_{i}", str(10 + 10 * (i % 2)), reg, False)
+        paramData.append(pyg4ometry.geant4.ParameterisedVolume.BoxDimensions(size, size, size))
+        rot = pyg4ometry.gdml.Rotation(f"p_rot_{i}", 0, 0, 0, "rad", reg, False)
+        pos = pyg4ometry.gdml.Position(f"p_pos_{i}", 30 * i - 1500, 0, 0, "mm", reg, False)
+        transforms.append([rot, pos])
+
+    pv = pyg4ometry.geant4.ParameterisedVolume("p", bl, wl, ncopies, paramData, transforms, reg)
+
+    # two distinct shapes shared by all the copies
+    assert len(pv.uniqueMeshes) == 2
+    assert pv.meshIndex.tolist() == [i % 2 for i in range(ncopies)]
+    assert len(pv.meshes) == ncopies
+    assert pv.meshes[0] is pv.meshes[2]
+
+    vMin, vMax = pv.extent()
+    assert vMin[0] == pytest.approx(-1505)
+    assert vMax[0] == pytest.approx(30 * (ncopies - 1) - 1500 + 10)
 
 
 # #############################
@@ -0,0 +1,72 @@
+"""
+Time meshing boolean heavy solids with the exact construction (cgal_sm) and the inexact
+construction (cgal_epick) CGAL kernels.
+
+    python benchmark_cgal_kernels.py [nHoles] [nslice]
+"""
+
+import sys
+import time
+
+import pyg4ometry
+from pyg4ometry.geant4.solid.MeshCache import meshCache
+
+
+def booleanSolids(nHoles=50, nslice=32):
+    """
+    A plate drilled with nHoles holes, a star of crossing ribs and their intersection.
+    """
+    reg = pyg4ometry.geant4.Registry()
+    g4 = pyg4ometry.geant4.solid
+
+    plate = g4.Box("plate", 1000, 1000, 50, reg)
+    hole = g4.Tubs("hole", 0, 20, 100, 0, "2*pi", reg, nslice=nslice)
+    drilled = plate
+    for i in range(nHoles):
+        x = (i % 10) * 90 - 405
+        y = (i // 10) * 90 - 405
+        drilled = g4.Subtraction(f"drilled{i}", drilled, hole, [[0, 0, 0], [x, y, 0]], reg)
+
+    rib = g4.Box("rib", 1200, 40, 40, reg)
+    ribs = rib
+    for i in range(1, 8):
+        ribs = g4.Union(f"ribs{i}", ribs, rib, [[0, 0, i * 0.4], [0, 0, 0]], reg)
+
+    both = g4.Intersection("both", drilled, ribs, [[0, 0, 0], [0, 0, 0]], reg)
+    return [drilled, ribs, both]
+
+
+def timeMeshing(meshing, nHoles, nslice):
+    pyg4ometry.config.meshing = meshing
+    meshCache.clear()
+    solids = booleanSolids(nHoles, nslice)
+
+    start = time.perf_counter()
+    meshes = [s.mesh() for s in solids]
+    elapsed = time.perf_counter() - start
+
+    return elapsed, [m.volume() for m in meshes], [m.isExact() for m in meshes]
+
+
+def main(nHoles=50, nslice=32):
+    meshing = pyg4ometry.config.meshing
+    try:
+        exactTime, exactVolumes, _ = timeMeshing(
+            pyg4ometry.config.meshingType.cgal_sm, nHoles, nslice
+        )
+        epickTime, epickVolumes, epickExact = timeMeshing(
+            pyg4ometry.config.meshingType.cgal_epick, nHoles, nslice
+        )
+    finally:
+        pyg4ometry.config.meshing = meshing
+
+    print(f"holes {nHoles} nslice {nslice}")
+    print(f"cgal_sm    {exactTime:8.3f} s")
+    print(f"cgal_epick {epickTime:8.3f} s  speedup {exactTime / epickTime:.1f}")
+    for ve, vi, fallback in zip(exactVolumes, epickVolumes, epickExact):
+        print(f"volume {ve:.6e} {vi:.6e} relative difference {abs(vi - ve) / ve:.1e}", end="")
+        print(" (exact fallback)" if fallback else "")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,36 @@
+import numpy as _np
+import pytest
+
+import pyg4ometry.pycgal as _cgal
+
+
+def test_cgal_arrays_roundtrip():
+    c = _cgal.CSG.cube([1, 2, 3], [1, 1, 1])
+
+    vertices, triangles = c.toArrays()
+    assert vertices.dtype == _np.float64
+    assert vertices.shape == (8, 3)
+    assert triangles.dtype == _np.int32
+    assert triangles.shape == (12, 3)
+    assert vertices.min(axis=0).tolist() == [0, 1, 2]
+    assert vertices.max(axis=0).tolist() == [2, 3, 4]
+
+    c2 = _cgal.CSG.fromArrays(vertices, triangles)
+    assert c2.isClosed()
+    assert c2.volume() == pytest.approx(8)
+
+
+def test_cgal_arrays_polygon_faces():
+    # unit cube from quads and a list of face arrays
+    vertices = _np.array([[i & 1, (i >> 1) & 1, (i >> 2) & 1] for i in range(8)], dtype=float)
+    quads = _np.array([[0, 4, 6, 2], [1, 3, 7, 5], [0, 1, 5, 4], [2, 6, 7, 3]])
+    ends = [_np.array([[0, 2, 3, 1]]), _np.array([[4, 5, 7, 6]])]
+
+    c = _cgal.CSG.fromArrays(vertices, [quads, *ends])
+    assert c.isClosed()
+    assert c.isOutwardOriented()
+    assert c.volume() == pytest.approx(1)
+    assert c.maxEdgeLength() == pytest.approx(_np.sqrt(2))
+
+    with pytest.raises(IndexError):
+        _cgal.CSG.fromArrays(vertices, _np.array([[0, 1, 8]]))